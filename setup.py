@@ -30,6 +30,7 @@ setup(
             "web3==6.20.3",
             "requests-toolbelt==1.0.0",
             "tqdm==4.66.5",
+            "websockets>=12",
             ],
         entry_points={
             # placeholder
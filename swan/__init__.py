@@ -5,6 +5,13 @@
 # from swan.contract.swan_contract import SwanContract
 from swan.session import Session
 from swan.api.orchestrator import Orchestrator
+from swan.api.catalog_watcher import CatalogWatcher
+from swan.api.launch_scheduler import DeferredLaunchScheduler
+from swan.api.task_watcher import TaskFleetWatcher
+from swan.api.renewal_manager import RenewalManager
+from swan.api.config_order_watcher import ConfigOrderWatcher
+from swan.api.fleet_reconciler import FleetReconciler, ReplicaSetSpec
+from swan.api.endpoint_balancer import EndpointBalancer
 
 from swan.api.bucket_api import BucketAPI
 
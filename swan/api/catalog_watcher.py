@@ -0,0 +1,88 @@
+# ./swan/api/catalog_watcher.py
+
+import asyncio
+import time
+from typing import AsyncIterator, List
+
+from swan.api.poller import Poller
+from swan.object.catalog import CatalogEvent, SNAPSHOT_EXPIRING, diff_to_events
+
+
+class CatalogWatcher(Poller):
+    """Poll the hardware catalog and dispatch typed CatalogEvent objects.
+
+    Each poll goes through `Orchestrator.update_instance_resources`, so an
+    unchanged snapshot costs one request and no re-parsing. The next poll is
+    scheduled just after the current snapshot's `expiry_time` when that comes
+    sooner than `interval`.
+    """
+
+    thread_name = "swan-catalog-watcher"
+
+    def __init__(
+            self,
+            orchestrator,
+            interval: float = 30,
+            min_interval: float = 5,
+            expiring_threshold: float = 60,
+        ):
+        """
+        Args:
+            orchestrator: Orchestrator used to fetch the catalog.
+            interval: maximum seconds between polls.
+            min_interval: minimum seconds between polls.
+            expiring_threshold: seconds before `expiry_time` to emit `snapshot_expiring`.
+        """
+        super().__init__()
+        self.orchestrator = orchestrator
+        self.interval = interval
+        self.min_interval = min_interval
+        self.expiring_threshold = expiring_threshold
+        self._expiring_notified = None
+        self._primed = False
+
+    def poll(self) -> List[CatalogEvent]:
+        """Fetch the catalog once and dispatch resulting events to subscribers.
+
+        Returns:
+            list of CatalogEvent produced by this poll.
+        """
+        catalog = self.orchestrator.catalog
+        if not self._primed and not len(catalog):
+            self.orchestrator.update_instance_resources()
+            self._primed = True
+            return []
+        self._primed = True
+
+        diff = self.orchestrator.update_instance_resources()
+        events = diff_to_events(diff, catalog) if diff else []
+
+        expiry_time = catalog.expiry_time
+        if (expiry_time is not None
+                and catalog.snapshot_id != self._expiring_notified
+                and expiry_time - time.time() <= self.expiring_threshold):
+            self._expiring_notified = catalog.snapshot_id
+            events.append(CatalogEvent(
+                type=SNAPSHOT_EXPIRING,
+                snapshot_id=catalog.snapshot_id,
+                expiry_time=expiry_time
+            ))
+
+        self._dispatch(events)
+        return events
+
+    def next_delay(self) -> float:
+        """Seconds to wait before the next poll."""
+        delay = self.interval
+        expiry_time = self.orchestrator.catalog.expiry_time
+        if expiry_time is not None:
+            delay = min(delay, expiry_time - time.time() + 1)
+        return max(delay, self.min_interval)
+
+    async def events(self) -> AsyncIterator[CatalogEvent]:
+        """Async iterator over catalog events; polls in the default executor."""
+        loop = asyncio.get_running_loop()
+        while True:
+            for event in await loop.run_in_executor(None, self.poll):
+                yield event
+            await asyncio.sleep(self.next_delay())
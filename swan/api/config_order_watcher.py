@@ -0,0 +1,135 @@
+# ./swan/api/config_order_watcher.py
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from swan.api.poller import Poller
+from swan.object.models import Base, ConfigOrder
+
+CONFIG_ORDER_CONFIRMED = "confirmed"
+CONFIG_ORDER_FAILED = "failed"
+CONFIG_ORDER_TIMEOUT = "timeout"
+
+
+@dataclass
+class ConfigOrderEvent(Base):
+    type: Optional[str] = None
+    task_uuid: Optional[str] = None
+    tx_hash: Optional[str] = None
+    config_order: Optional[ConfigOrder] = None
+
+
+class ConfigOrderWatcher(Poller):
+    """Wait on many config orders (new tasks, renewals) with one shared poller.
+
+    Every poll queries all watched orders concurrently. The delay between
+    polls backs off while nothing changes and resets whenever an order is
+    added or settles; it is jittered so that many watchers do not poll the
+    backend in lockstep.
+    """
+
+    thread_name = "swan-config-order-watcher"
+
+    def __init__(
+            self,
+            orchestrator,
+            min_interval: float = 1,
+            max_interval: float = 15,
+            max_workers: int = 8,
+        ):
+        """
+        Args:
+            orchestrator: Orchestrator used to query config orders.
+            min_interval: minimum seconds between polls. (Default = 1)
+            max_interval: maximum seconds between polls. (Default = 15)
+            max_workers: maximum number of concurrent status requests. (Default = 8)
+        """
+        super().__init__()
+        self.orchestrator = orchestrator
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_workers = max_workers
+        self._interval = min_interval
+        self._orders: Dict[Tuple[str, str], Tuple[Future, Optional[float]]] = {}
+        self._orders_lock = threading.Lock()
+
+    def watch(self, task_uuid: str, tx_hash: str, timeout: Optional[float] = None) -> Future:
+        """Start waiting on the config order of a payment.
+
+        Returns:
+            Future resolved with the terminal ConfigOrder, or None once `timeout` seconds passed.
+        """
+        key = (task_uuid, tx_hash)
+        with self._orders_lock:
+            if key in self._orders:
+                return self._orders[key][0]
+            future = Future()
+            self._orders[key] = (future, time.time() + timeout if timeout is not None else None)
+            self._interval = self.min_interval
+        return future
+
+    @property
+    def pending(self) -> List[Tuple[str, str]]:
+        with self._orders_lock:
+            return list(self._orders)
+
+    def _settle(self, key, config_order: Optional[ConfigOrder]):
+        with self._orders_lock:
+            entry = self._orders.pop(key, None)
+        if entry:
+            entry[0].set_result(config_order)
+
+    def poll(self, now: Optional[float] = None) -> List[ConfigOrderEvent]:
+        """Query every watched order once and dispatch the ones that settled.
+
+        Returns:
+            list of ConfigOrderEvent produced by this poll.
+        """
+        with self._orders_lock:
+            orders = dict(self._orders)
+        if not orders:
+            return []
+
+        keys = list(orders)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(keys)))) as pool:
+            config_orders = list(pool.map(lambda key: self.orchestrator.get_config_order(*key), keys))
+
+        now = now if now is not None else time.time()
+        events = []
+        for key, config_order in zip(keys, config_orders):
+            task_uuid, tx_hash = key
+            deadline = orders[key][1]
+            if config_order is not None and not config_order.pending:
+                event_type = CONFIG_ORDER_FAILED if config_order.failed else CONFIG_ORDER_CONFIRMED
+            elif deadline is not None and now >= deadline:
+                event_type = CONFIG_ORDER_TIMEOUT
+                config_order = None
+            else:
+                continue
+            self._settle(key, config_order)
+            events.append(ConfigOrderEvent(type=event_type, task_uuid=task_uuid, tx_hash=tx_hash, config_order=config_order))
+
+        if events:
+            self._interval = self.min_interval
+        else:
+            self._interval = min(self._interval * 2, self.max_interval)
+        logging.debug(f"Config order watcher settled {len(events)} of {len(keys)} orders")
+        self._dispatch(events)
+        return events
+
+    def next_delay(self, now: Optional[float] = None) -> float:
+        """Jittered seconds until the next poll, never past the nearest order timeout."""
+        now = now if now is not None else time.time()
+        delay = random.uniform(self.min_interval, self._interval)
+        with self._orders_lock:
+            if not self._orders:
+                return self.max_interval
+            deadlines = [deadline for _, deadline in self._orders.values() if deadline is not None]
+        if deadlines:
+            delay = min(delay, min(deadlines) - now)
+        return max(delay, self.min_interval)
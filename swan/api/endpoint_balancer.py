@@ -0,0 +1,231 @@
+# ./swan/api/endpoint_balancer.py
+
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from swan.api.poller import Poller
+from swan.object.models import Base
+
+LEAST_OUTSTANDING = "least_outstanding"
+EWMA = "ewma"
+
+ENDPOINT_ADDED = "added"
+ENDPOINT_REMOVED = "removed"
+ENDPOINT_EJECTED = "ejected"
+ENDPOINT_RESTORED = "restored"
+
+
+@dataclass
+class Endpoint(Base):
+    url: Optional[str] = None
+    outstanding: int = 0
+    ewma: Optional[float] = None
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    ejections: int = 0
+    ejected_until: Optional[float] = None
+
+
+@dataclass
+class EndpointEvent(Base):
+    type: Optional[str] = None
+    task_uuid: Optional[str] = None
+    url: Optional[str] = None
+    ejected_until: Optional[float] = None
+
+
+class EndpointBalancer(Poller):
+    """Spread application traffic over every `job_real_uri` of a task.
+
+    `least_outstanding` picks the endpoint with the fewest requests in
+    flight; `ewma` picks the lowest smoothed latency weighted by requests in
+    flight, so slow replicas get less traffic before they fail. Endpoints
+    failing `failure_threshold` times in a row are ejected for
+    `ejection_time` seconds, doubling per repeated ejection up to
+    `max_ejection_time`. If every endpoint is ejected, all of them are used
+    again rather than failing the request. The endpoint list is refreshed
+    from `get_deployment_info` every `refresh_interval` seconds while the
+    balancer is started, and lazily on first use.
+    """
+
+    thread_name = "swan-endpoint-balancer"
+
+    def __init__(
+            self,
+            orchestrator,
+            task_uuid: str,
+            policy: str = LEAST_OUTSTANDING,
+            refresh_interval: float = 30,
+            failure_threshold: int = 3,
+            ejection_time: float = 30,
+            max_ejection_time: float = 300,
+            ewma_alpha: float = 0.3,
+        ):
+        """
+        Args:
+            orchestrator: Orchestrator used to look up the task's jobs.
+            task_uuid: uuid of task whose `job_real_uri` endpoints are balanced.
+            policy: `least_outstanding` or `ewma`. (Default = `least_outstanding`)
+            refresh_interval: seconds between endpoint list refreshes. (Default = 30)
+            failure_threshold: consecutive failures that eject an endpoint. (Default = 3)
+            ejection_time: seconds of the first ejection. (Default = 30)
+            max_ejection_time: upper bound of the ejection time. (Default = 300)
+            ewma_alpha: weight of the latest latency in the moving average. (Default = 0.3)
+        """
+        if policy not in (LEAST_OUTSTANDING, EWMA):
+            raise ValueError(f"Unknown policy {policy}, expected {LEAST_OUTSTANDING} or {EWMA}")
+        super().__init__()
+        self.orchestrator = orchestrator
+        self.task_uuid = task_uuid
+        self.policy = policy
+        self.refresh_interval = refresh_interval
+        self.failure_threshold = failure_threshold
+        self.ejection_time = ejection_time
+        self.max_ejection_time = max_ejection_time
+        self.ewma_alpha = ewma_alpha
+        self._endpoints: Dict[str, Endpoint] = {}
+        self._endpoints_lock = threading.Lock()
+        self._refreshed = False
+
+    @property
+    def endpoints(self) -> List[Endpoint]:
+        with self._endpoints_lock:
+            return [Endpoint(**vars(endpoint)) for endpoint in self._endpoints.values()]
+
+    def refresh(self) -> List[EndpointEvent]:
+        """Sync the endpoint list with the task's HTTP(S) job URIs, keeping the stats of known endpoints.
+
+        The current list is kept when the task cannot be fetched.
+        """
+        task_info = self.orchestrator.get_deployment_info(self.task_uuid)
+        if not task_info or not task_info.task.uuid:
+            logging.warning(f"Could not refresh endpoints of task {self.task_uuid}, keeping {len(self._endpoints)}")
+            return []
+        # jobs may also report non-HTTP access such as `ssh root@host -p30001`
+        urls = list(dict.fromkeys(
+            job.job_real_uri for job in task_info.jobs or []
+            if job.job_real_uri and urlparse(job.job_real_uri).scheme in ("http", "https")
+        ))
+
+        events = []
+        with self._endpoints_lock:
+            for url in list(self._endpoints):
+                if url not in urls:
+                    del self._endpoints[url]
+                    events.append(EndpointEvent(type=ENDPOINT_REMOVED, task_uuid=self.task_uuid, url=url))
+            for url in urls:
+                if url not in self._endpoints:
+                    self._endpoints[url] = Endpoint(url=url)
+                    events.append(EndpointEvent(type=ENDPOINT_ADDED, task_uuid=self.task_uuid, url=url))
+            self._refreshed = True
+        return events
+
+    def _score(self, endpoint: Endpoint) -> float:
+        if self.policy == EWMA:
+            # untried endpoints score 0 so each gets probed once
+            return (endpoint.ewma or 0) * (endpoint.outstanding + 1)
+        return endpoint.outstanding
+
+    def acquire(self) -> Optional[str]:
+        """Pick an endpoint and count a request in flight on it. Pair with `release`.
+
+        Returns:
+            url of endpoint, or None when the task has no reachable URL.
+        """
+        if not self._refreshed:
+            self._dispatch(self.refresh())
+        now = time.time()
+        restored = []
+        with self._endpoints_lock:
+            endpoints = list(self._endpoints.values())
+            if not endpoints:
+                return None
+            for endpoint in endpoints:
+                if endpoint.ejected_until is not None and endpoint.ejected_until <= now:
+                    endpoint.ejected_until = None
+                    restored.append(EndpointEvent(type=ENDPOINT_RESTORED, task_uuid=self.task_uuid, url=endpoint.url))
+            available = [endpoint for endpoint in endpoints if endpoint.ejected_until is None] or endpoints
+            best = min(self._score(endpoint) for endpoint in available)
+            endpoint = random.choice([endpoint for endpoint in available if self._score(endpoint) == best])
+            endpoint.outstanding += 1
+        self._dispatch(restored)
+        return endpoint.url
+
+    def release(self, url: str, latency: Optional[float] = None, success: bool = True):
+        """Finish a request started with `acquire`, recording its latency (seconds) and outcome."""
+        ejected = None
+        with self._endpoints_lock:
+            endpoint = self._endpoints.get(url)
+            if endpoint is None:
+                return
+            endpoint.outstanding = max(endpoint.outstanding - 1, 0)
+            if success:
+                endpoint.successes += 1
+                endpoint.consecutive_failures = 0
+                endpoint.ejections = 0
+                if latency is not None:
+                    endpoint.ewma = latency if endpoint.ewma is None else \
+                        self.ewma_alpha * latency + (1 - self.ewma_alpha) * endpoint.ewma
+                return
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= self.failure_threshold and endpoint.ejected_until is None:
+                endpoint.ejected_until = time.time() + min(
+                    self.ejection_time * 2 ** endpoint.ejections, self.max_ejection_time
+                )
+                endpoint.ejections += 1
+                endpoint.consecutive_failures = 0
+                ejected = EndpointEvent(
+                    type=ENDPOINT_EJECTED, task_uuid=self.task_uuid, url=url, ejected_until=endpoint.ejected_until
+                )
+        if ejected:
+            logging.warning(f"Ejected endpoint {url} of task {self.task_uuid} until {ejected.ejected_until}")
+            self._dispatch([ejected])
+
+    @contextmanager
+    def endpoint(self):
+        """Context manager yielding an endpoint url; an exception in the block counts as a failure.
+
+        Raises:
+            LookupError: the task has no reachable URL.
+        """
+        url = self.acquire()
+        if url is None:
+            raise LookupError(f"Task {self.task_uuid} has no reachable job_real_uri")
+        start = time.time()
+        try:
+            yield url
+        except Exception:
+            self.release(url, success=False)
+            raise
+        self.release(url, latency=time.time() - start)
+
+    def request(self, method: str, path: str = "", **kwargs) -> requests.Response:
+        """
+        Send an HTTP request to `path` on the picked endpoint.
+
+        Raises:
+            requests.RequestException: connection error or 5xx response, counted as a failure of the endpoint.
+        """
+        with self.endpoint() as url:
+            response = requests.request(method, url.rstrip("/") + "/" + path.lstrip("/") if path else url, **kwargs)
+            if response.status_code >= 500:
+                raise requests.HTTPError(f"{response.status_code} from {url}", response=response)
+            return response
+
+    def poll(self) -> List[EndpointEvent]:
+        events = self.refresh()
+        self._dispatch(events)
+        return events
+
+    def next_delay(self) -> float:
+        return self.refresh_interval
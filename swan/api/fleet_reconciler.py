@@ -0,0 +1,369 @@
+# ./swan/api/fleet_reconciler.py
+
+import logging
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from swan.api.poller import Poller
+from swan.common.utils import is_terminal_status
+from swan.object.models import Base, BatchResult, TaskInfo
+from swan.object.task_store import TaskStore
+
+FLEET_RECONCILED = "reconciled"
+
+_FAILED_JOB_STATUSES = ("failed", "error")
+
+
+@dataclass
+class ReplicaSetSpec(Base):
+    """Desired state of one service: `replicas` tasks of one source on one instance type."""
+    name: Optional[str] = None
+    wallet_address: Optional[str] = None
+    replicas: int = 1
+    instance_type: Optional[str] = None
+    regions: List[str] = field(default_factory=lambda: ["global"])
+    app_repo_image: Optional[str] = None
+    job_source_uri: Optional[str] = None
+    repo_uri: Optional[str] = None
+    repo_branch: Optional[str] = None
+    duration: int = 3600
+    renew_duration: Optional[int] = None
+    renew_before: int = 600
+    private_key: Optional[str] = None
+    preferred_cp_list: Optional[List[str]] = None
+    ip_whitelist: Optional[List[str]] = None
+
+
+@dataclass
+class ReconcileReport(Base):
+    type: str = FLEET_RECONCILED
+    name: Optional[str] = None
+    healthy: List[str] = field(default_factory=list)
+    create_regions: List[str] = field(default_factory=list)
+    renew: List[str] = field(default_factory=list)
+    terminate: List[str] = field(default_factory=list)
+    deferred: List[str] = field(default_factory=list)
+    renewing: List[str] = field(default_factory=list)
+    adopted: List[str] = field(default_factory=list)
+    released: List[str] = field(default_factory=list)
+    created: Optional[BatchResult] = None
+    renewed: Optional[BatchResult] = None
+    terminated: Optional[BatchResult] = None
+    error: Optional[str] = None
+
+
+def _task_region(task_info: TaskInfo) -> Optional[str]:
+    requirements = task_info.task.task_detail.requirements if task_info.task.task_detail else None
+    if isinstance(requirements, dict):
+        return requirements.get("region")
+    return requirements.region if requirements else None
+
+
+def _task_end_at(task_info: TaskInfo) -> Optional[int]:
+    task = task_info.task
+    return task.end_at or (task.task_detail.end_at if task.task_detail else None)
+
+
+class FleetReconciler(Poller):
+    """Keep replica sets at their desired state.
+
+    Each cycle lists every wallet's tasks once, matches them to a spec by the
+    owner tag recorded in `store` when the reconciler created them, then in
+    one batch per action: creates
+    missing replicas (spread over the spec's regions), renews replicas ending
+    within `renew_before` seconds, and terminates failed or surplus ones.
+    Per-cycle caps on each action and on total spend keep a bad spec or a
+    backend hiccup from turning into a burst of transactions; whatever does
+    not fit is reported as deferred and retried next cycle.
+
+    Untagged live tasks with the spec's instance type and job source URI are
+    adopted (tagged) so existing replicas are not duplicated; once tagged, a
+    replica stays a member even if the spec's resolved source URI changes.
+    Pass a file-backed `TaskStore` to keep the tags across restarts.
+
+    Submitted renewals are remembered with the task's `end_at` at the time;
+    the task is not renewed again until the backend reports a later `end_at`
+    or `renew_timeout` seconds passed.
+    """
+
+    thread_name = "swan-fleet-reconciler"
+
+    def __init__(
+            self,
+            orchestrator,
+            specs: Optional[List[ReplicaSetSpec]] = None,
+            interval: float = 60,
+            max_creates_per_cycle: int = 5,
+            max_renewals_per_cycle: int = 20,
+            max_terminations_per_cycle: int = 5,
+            max_spend_per_cycle: Optional[float] = None,
+            store: Optional[TaskStore] = None,
+            adopt: bool = True,
+            renew_timeout: float = 900,
+        ):
+        """
+        Args:
+            orchestrator: Orchestrator used to list, create, renew and terminate tasks.
+            specs: Optional. Initial replica set specs.
+            interval: seconds between cycles. (Default = 60)
+            max_creates_per_cycle: maximum tasks created per cycle. (Default = 5)
+            max_renewals_per_cycle: maximum tasks renewed per cycle. (Default = 20)
+            max_terminations_per_cycle: maximum tasks terminated per cycle. (Default = 5)
+            max_spend_per_cycle: Optional. Maximum SWAN spent on creations and renewals per cycle.
+            store: Optional. TaskStore holding which replica set owns which task. (Default: in-memory)
+            adopt: adopt untagged tasks matching a spec's instance type and job source URI. (Default = True)
+            renew_timeout: seconds a submitted renewal blocks renewing the task again. (Default = 900)
+        """
+        super().__init__()
+        self.orchestrator = orchestrator
+        self.interval = interval
+        self.max_creates_per_cycle = max_creates_per_cycle
+        self.max_renewals_per_cycle = max_renewals_per_cycle
+        self.max_terminations_per_cycle = max_terminations_per_cycle
+        self.max_spend_per_cycle = max_spend_per_cycle
+        self.store = store if store is not None else TaskStore()
+        self.adopt = adopt
+        self.renew_timeout = renew_timeout
+        # task uuid -> (tx_hash, end_at before the renewal, submitted at)
+        self._renewing: Dict[str, Tuple[Optional[str], Optional[int], float]] = {}
+        self._specs: Dict[str, ReplicaSetSpec] = {}
+        self._specs_lock = threading.Lock()
+        self._job_source_uris: Dict[str, str] = {}
+        for spec in specs or []:
+            self.apply(spec)
+
+    def apply(self, spec: ReplicaSetSpec):
+        """Add or replace the spec named `spec.name`."""
+        if not spec.name or not spec.wallet_address or not spec.instance_type:
+            raise ValueError("A replica set needs a name, wallet_address and instance_type")
+        with self._specs_lock:
+            self._specs[spec.name] = spec
+            self._job_source_uris.pop(spec.name, None)
+
+    def remove(self, name: str):
+        """Stop managing a replica set. Its tasks are left running."""
+        with self._specs_lock:
+            self._specs.pop(name, None)
+            self._job_source_uris.pop(name, None)
+
+    @property
+    def specs(self) -> List[ReplicaSetSpec]:
+        with self._specs_lock:
+            return list(self._specs.values())
+
+    def _job_source_uri(self, spec: ReplicaSetSpec) -> str:
+        if spec.name not in self._job_source_uris:
+            self._job_source_uris[spec.name] = self.orchestrator.resolve_job_source_uri(
+                wallet_address=spec.wallet_address,
+                instance_type=spec.instance_type,
+                job_source_uri=spec.job_source_uri,
+                app_repo_image=spec.app_repo_image,
+                repo_uri=spec.repo_uri,
+                repo_branch=spec.repo_branch
+            )
+        return self._job_source_uris[spec.name]
+
+    def _adoptable(self, spec: ReplicaSetSpec, task_info: TaskInfo) -> bool:
+        task_detail = task_info.task.task_detail
+        return bool(
+            self.adopt
+            and task_detail
+            and task_detail.hardware == spec.instance_type
+            and task_detail.job_source_uri == self._job_source_uri(spec)
+        )
+
+    def members(self, spec: ReplicaSetSpec, task_infos: List[TaskInfo]) -> List[TaskInfo]:
+        """Live tasks of `task_infos` that are tagged as owned by `spec`, or can be adopted by it."""
+        owners = self.store.owners()
+        return [
+            task_info for task_info in task_infos
+            if not is_terminal_status(task_info.task.status)
+            and (owners.get(task_info.task.uuid) == spec.name
+                 or (task_info.task.uuid not in owners and self._adoptable(spec, task_info)))
+        ]
+
+    def plan(self, spec: ReplicaSetSpec, task_infos: List[TaskInfo], now: Optional[float] = None) -> ReconcileReport:
+        """Compute the actions that bring `spec` to its desired state, ignoring per-cycle limits."""
+        now = now if now is not None else time.time()
+        report = ReconcileReport(name=spec.name)
+        owned = self.store.owners(spec.name)
+        report.released = [
+            task_info.task.uuid for task_info in task_infos
+            if task_info.task.uuid in owned and is_terminal_status(task_info.task.status)
+        ]
+        healthy = []
+        for task_info in self.members(spec, task_infos):
+            if task_info.task.uuid not in owned:
+                report.adopted.append(task_info.task.uuid)
+            failed = any(job.status and job.status.lower() in _FAILED_JOB_STATUSES for job in task_info.jobs or [])
+            if failed:
+                report.terminate.append(task_info.task.uuid)
+            else:
+                healthy.append(task_info)
+
+        # surplus: drop replicas that are not running yet first, then those ending soonest
+        healthy.sort(key=lambda task_info: ((task_info.task.status or "").lower() != "running", -(_task_end_at(task_info) or 0)))
+        report.terminate.extend(task_info.task.uuid for task_info in healthy[spec.replicas:])
+        healthy = healthy[:spec.replicas]
+        report.healthy = [task_info.task.uuid for task_info in healthy]
+
+        expiring = [
+            task_info for task_info in healthy
+            if _task_end_at(task_info) is not None and _task_end_at(task_info) - now <= spec.renew_before
+        ]
+        in_flight = {task_info.task.uuid for task_info in healthy if self._renewal_in_flight(task_info, now)}
+        for task_info in sorted(expiring, key=_task_end_at):
+            if task_info.task.uuid in in_flight:
+                report.renewing.append(task_info.task.uuid)
+            else:
+                report.renew.append(task_info.task.uuid)
+
+        # spread missing replicas over the regions with the fewest replicas
+        regions = list(spec.regions) or ["global"]
+        per_region = {region: 0 for region in regions}
+        for task_info in healthy:
+            region = _task_region(task_info)
+            if region in per_region:
+                per_region[region] += 1
+        for _ in range(spec.replicas - len(healthy)):
+            region = min(regions, key=lambda region: per_region[region])
+            per_region[region] += 1
+            report.create_regions.append(region)
+        return report
+
+    def _renewal_in_flight(self, task_info: TaskInfo, now: float) -> bool:
+        """Whether a renewal of the task was submitted and the backend has not applied it yet."""
+        renewing = self._renewing.get(task_info.task.uuid)
+        if renewing is None:
+            return False
+        tx_hash, end_at, submitted_at = renewing
+        current_end_at = _task_end_at(task_info)
+        if end_at is not None and current_end_at is not None and current_end_at > end_at:
+            self._renewing.pop(task_info.task.uuid, None)
+            return False
+        if now - submitted_at >= self.renew_timeout:
+            logging.warning(f"Renewal {tx_hash} of task {task_info.task.uuid} not applied within {self.renew_timeout} seconds")
+            self._renewing.pop(task_info.task.uuid, None)
+            return False
+        return True
+
+    def _cost(self, spec: ReplicaSetSpec, duration: int) -> float:
+        price = self.orchestrator.get_instance_price(spec.instance_type)
+        return (price or 0) * duration / 3600
+
+    def reconcile(self, now: Optional[float] = None, dry_run: bool = False) -> List[ReconcileReport]:
+        """Run one reconciliation cycle over all specs.
+
+        Args:
+            now: Optional. Current unix time.
+            dry_run: only plan, do not create, renew or terminate anything.
+
+        Returns:
+            list of ReconcileReport, one per spec.
+        """
+        now = now if now is not None else time.time()
+        specs = self.specs
+        tasks_by_wallet: Dict[str, Optional[List[TaskInfo]]] = {}
+        for wallet_address in {spec.wallet_address for spec in specs}:
+            tasks_by_wallet[wallet_address] = self.orchestrator.get_all_tasks(wallet_address)
+
+        budget = {
+            "creates": self.max_creates_per_cycle,
+            "renewals": self.max_renewals_per_cycle,
+            "terminations": self.max_terminations_per_cycle,
+            "spend": self.max_spend_per_cycle if self.max_spend_per_cycle is not None else float("inf"),
+        }
+        reports = []
+        for spec in specs:
+            task_infos = tasks_by_wallet.get(spec.wallet_address)
+            if task_infos is None:
+                reports.append(ReconcileReport(name=spec.name, error="Failed to list tasks"))
+                continue
+            try:
+                report = self.plan(spec, task_infos, now)
+                self._limit(spec, report, budget)
+                if not dry_run:
+                    self._execute(spec, report, task_infos, now)
+            except Exception as e:
+                logging.error(str(e) + traceback.format_exc())
+                report = ReconcileReport(name=spec.name, error=str(e))
+            reports.append(report)
+        return reports
+
+    def _limit(self, spec: ReplicaSetSpec, report: ReconcileReport, budget: dict):
+        renew_cost = self._cost(spec, spec.renew_duration or spec.duration)
+        create_cost = self._cost(spec, spec.duration)
+
+        renew = []
+        for task_uuid in report.renew:
+            if budget["renewals"] > 0 and budget["spend"] >= renew_cost:
+                budget["renewals"] -= 1
+                budget["spend"] -= renew_cost
+                renew.append(task_uuid)
+            else:
+                report.deferred.append(f"renew {task_uuid}")
+        report.renew = renew
+
+        create_regions = []
+        for region in report.create_regions:
+            if budget["creates"] > 0 and budget["spend"] >= create_cost:
+                budget["creates"] -= 1
+                budget["spend"] -= create_cost
+                create_regions.append(region)
+            else:
+                report.deferred.append(f"create in {region}")
+        report.create_regions = create_regions
+
+        terminate = report.terminate[:max(budget["terminations"], 0)]
+        report.deferred.extend(f"terminate {task_uuid}" for task_uuid in report.terminate[len(terminate):])
+        budget["terminations"] -= len(terminate)
+        report.terminate = terminate
+
+    def _execute(self, spec: ReplicaSetSpec, report: ReconcileReport, task_infos: List[TaskInfo], now: float):
+        if report.adopted:
+            self.store.set_owner(report.adopted, spec.name)
+        if report.released:
+            self.store.release(report.released)
+        if report.renew:
+            report.renewed = self.orchestrator.renew_tasks(
+                report.renew, duration=spec.renew_duration or spec.duration, private_key=spec.private_key
+            )
+            end_at = {task_info.task.uuid: _task_end_at(task_info) for task_info in task_infos}
+            for task_uuid, result, error in zip(report.renew, report.renewed.results, report.renewed.errors):
+                if error is None:
+                    self._renewing[task_uuid] = (result.tx_hash if result else None, end_at.get(task_uuid), now)
+        if report.create_regions:
+            report.created = self.orchestrator.create_tasks([
+                {
+                    "wallet_address": spec.wallet_address,
+                    "instance_type": spec.instance_type,
+                    "region": region,
+                    "duration": spec.duration,
+                    "job_source_uri": self._job_source_uri(spec),
+                    "private_key": spec.private_key,
+                    "auto_pay": bool(spec.private_key),
+                    "preferred_cp_list": spec.preferred_cp_list,
+                    "ip_whitelist": spec.ip_whitelist,
+                }
+                for region in report.create_regions
+            ])
+            created = [result.task_uuid or result.task.uuid for result in report.created.succeeded]
+            self.store.set_owner([task_uuid for task_uuid in created if task_uuid], spec.name)
+        if report.terminate:
+            report.terminated = self.orchestrator.terminate_tasks(report.terminate)
+        logging.info(
+            f"Reconciled {spec.name}: {len(report.healthy)}/{spec.replicas} healthy, "
+            f"{len(report.create_regions)} created, {len(report.renew)} renewed, "
+            f"{len(report.terminate)} terminated, {len(report.deferred)} deferred"
+        )
+
+    def poll(self) -> List[ReconcileReport]:
+        reports = self.reconcile()
+        self._dispatch(reports)
+        return reports
+
+    def next_delay(self) -> float:
+        return self.interval
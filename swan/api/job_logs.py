@@ -0,0 +1,323 @@
+# ./swan/api/job_logs.py
+
+import codecs
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+
+from swan.common.utils import is_terminal_status
+from swan.object.models import Base, Job
+
+BUILD_LOG = "build"
+CONTAINER_LOG = "container"
+
+_LOG_FIELDS = {BUILD_LOG: "build_log", CONTAINER_LOG: "container_log"}
+
+
+@dataclass
+class JobLogLine(Base):
+    task_uuid: Optional[str] = None
+    job_uuid: Optional[str] = None
+    cp_account_address: Optional[str] = None
+    log_type: Optional[str] = None
+    line: Optional[str] = None
+
+
+class LineCursor:
+    """Split a log into lines and drop lines that were already delivered.
+
+    Log servers that cannot resume replay the whole log on every read or
+    reconnect. A fingerprint of each delivered line is kept, so a replay is
+    skipped line by line; if a replayed line differs (the log was rotated or
+    the container restarted), everything from that line on is new again.
+    """
+
+    def __init__(self):
+        self._fingerprints: List[int] = []
+        self._replayed = 0
+        self._partial = ""
+
+    def restart(self):
+        """Start of a new replay from the beginning of the log."""
+        self._replayed = 0
+        self._partial = ""
+
+    def feed(self, text: str, final: bool = False) -> List[str]:
+        """Lines of `text` not delivered before. A trailing partial line is held back until `final`."""
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        if final and self._partial:
+            lines.append(self._partial)
+            self._partial = ""
+
+        new_lines = []
+        for line in lines:
+            line = line.rstrip("\r")
+            fingerprint = hash(line)
+            index = self._replayed
+            self._replayed += 1
+            if index < len(self._fingerprints):
+                if self._fingerprints[index] == fingerprint:
+                    continue
+                del self._fingerprints[index:]
+            self._fingerprints.append(fingerprint)
+            new_lines.append(line)
+        return new_lines
+
+
+class HttpLogCursor:
+    """Poll a plain HTTP(S) log, fetching only what is new.
+
+    Sends `Range: bytes=<offset>-` and `If-None-Match: <etag>` so servers
+    that support them answer with only the appended bytes or 304. Servers
+    that ignore them return the whole log, which is deduplicated by content.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.offset = 0
+        self.etag: Optional[str] = None
+        self._ranges = True
+        self._lines = LineCursor()
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def poll(self, session, timeout: float = 30) -> List[str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.offset and self._ranges:
+            headers["Range"] = f"bytes={self.offset}-"
+        response = session.get(self.url, headers=headers, timeout=timeout)
+        if response.status_code in (304, 416):
+            return []
+        response.raise_for_status()
+        self.etag = response.headers.get("ETag")
+        body = response.content
+        if response.status_code == 206:
+            self.offset += len(body)
+            return self._lines.feed(self._decoder.decode(body))
+
+        # whole log: either the first read or the server does not support ranges
+        if self.offset:
+            self._ranges = False
+        self.offset = len(body)
+        self._lines.restart()
+        self._decoder.reset()
+        return self._lines.feed(self._decoder.decode(body))
+
+
+def _websocket_connect(url: str):
+    try:
+        from websockets.sync.client import connect
+    except ImportError as e:
+        raise ImportError("Following wss:// job logs requires websockets>=12") from e
+    return connect(url, open_timeout=10)
+
+
+class WebSocketLogReader:
+    """Follow a `wss://` log in a background thread, reconnecting with backoff.
+
+    CP log sockets send the whole log on connect and then new output, so
+    every reconnect is a replay that `LineCursor` deduplicates.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            on_lines: Callable[[List[str]], None],
+            connect: Callable = _websocket_connect,
+            reconnect_interval: float = 2,
+            max_reconnect_interval: float = 60,
+        ):
+        self.url = url
+        self.on_lines = on_lines
+        self.connect = connect
+        self.reconnect_interval = reconnect_interval
+        self.max_reconnect_interval = max_reconnect_interval
+        self._lines = LineCursor()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name="swan-job-log", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def run(self):
+        delay = self.reconnect_interval
+        while not self._stop_event.is_set():
+            self._lines.restart()
+            try:
+                with self.connect(self.url) as websocket:
+                    delay = self.reconnect_interval
+                    while not self._stop_event.is_set():
+                        try:
+                            message = websocket.recv(timeout=1)
+                        except TimeoutError:
+                            continue
+                        if isinstance(message, bytes):
+                            message = message.decode("utf-8", errors="replace")
+                        self._emit(self._lines.feed(message))
+            except ImportError as e:
+                logging.error(f"Cannot follow log {self.url}: {e}")
+                return
+            except Exception as e:
+                logging.debug(f"Log socket {self.url} closed: {e}")
+            if self._stop_event.is_set():
+                # a partial line is only final when no replay will complete it
+                self._emit(self._lines.feed("", final=True))
+                break
+            self._stop_event.wait(delay)
+            delay = min(delay * 2, self.max_reconnect_interval)
+
+    def _emit(self, lines: List[str]):
+        if lines:
+            self.on_lines(lines)
+
+
+class JobLogStreamer:
+    """Follow the build and container logs of every job of a task at once.
+
+    Jobs are discovered from `get_deployment_info` every `refresh_interval`
+    seconds, so jobs added to the task later are followed too. `wss://` logs
+    are read by one `WebSocketLogReader` each; HTTP(S) logs are polled
+    together every `interval` seconds with `HttpLogCursor`. Streaming ends
+    one `interval` after the task reached a terminal status, once its logs
+    were read one last time, or after `timeout`.
+    """
+
+    def __init__(
+            self,
+            orchestrator,
+            task_uuid: str,
+            log_types: Iterable[str] = (BUILD_LOG, CONTAINER_LOG),
+            interval: float = 5,
+            refresh_interval: float = 30,
+            connect: Callable = _websocket_connect,
+            session: Optional[requests.Session] = None,
+        ):
+        """
+        Args:
+            orchestrator: Orchestrator used to look up the task's jobs.
+            task_uuid: uuid of task.
+            log_types: `build` and/or `container`. (Default = both)
+            interval: seconds between polls of HTTP logs. (Default = 5)
+            refresh_interval: seconds between job list refreshes. (Default = 30)
+            connect: Optional. Opens a websocket for a `wss://` log url.
+            session: Optional. requests session used for HTTP logs.
+        """
+        self.log_types = tuple(log_types)
+        for log_type in self.log_types:
+            if log_type not in _LOG_FIELDS:
+                raise ValueError(f"Unknown log type {log_type}, expected {BUILD_LOG} or {CONTAINER_LOG}")
+        self.orchestrator = orchestrator
+        self.task_uuid = task_uuid
+        self.interval = interval
+        self.refresh_interval = refresh_interval
+        self.connect = connect
+        self.session = session or requests.Session()
+        self._queue: "queue.Queue[JobLogLine]" = queue.Queue()
+        self._readers: Dict[Tuple[str, str], WebSocketLogReader] = {}
+        self._cursors: Dict[Tuple[str, str], Tuple[Job, HttpLogCursor]] = {}
+        self._urls: Dict[Tuple[str, str], str] = {}
+
+    def _put(self, job: Job, log_type: str, lines: List[str]):
+        for line in lines:
+            self._queue.put(JobLogLine(
+                task_uuid=self.task_uuid,
+                job_uuid=job.uuid,
+                cp_account_address=job.cp_account_address,
+                log_type=log_type,
+                line=line
+            ))
+
+    def _follow(self, jobs: List[Job]):
+        for job in jobs:
+            for log_type in self.log_types:
+                url = getattr(job, _LOG_FIELDS[log_type])
+                key = (job.uuid or str(job.id), log_type)
+                if not url or self._urls.get(key) == url:
+                    continue
+                # a job moved to another log url starts a new log
+                if key in self._readers:
+                    self._readers.pop(key).stop()
+                self._cursors.pop(key, None)
+                self._urls[key] = url
+                if url.startswith(("ws://", "wss://")):
+                    self._readers[key] = WebSocketLogReader(
+                        url, lambda lines, job=job, log_type=log_type: self._put(job, log_type, lines), self.connect
+                    ).start()
+                else:
+                    self._cursors[key] = (job, HttpLogCursor(url))
+
+    def _poll_cursor(self, key: Tuple[str, str]):
+        job, cursor = self._cursors[key]
+        try:
+            self._put(job, key[1], cursor.poll(self.session))
+        except Exception as e:
+            logging.warning(f"Failed to read {key[1]} log of job {key[0]}: {e}")
+
+    def stream(self, timeout: Optional[float] = None) -> Iterator[JobLogLine]:
+        """
+        Yield new log lines of all jobs as they arrive.
+
+        Args:
+            timeout: Optional. Seconds after which streaming stops.
+
+        Yields:
+            JobLogLine, in arrival order per log.
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+        next_refresh = 0
+        next_poll = 0
+        finish_at = None
+        executor = ThreadPoolExecutor(max_workers=8)
+        try:
+            while True:
+                now = time.time()
+                if finish_at is None and now >= next_refresh:
+                    task_info = self.orchestrator.get_deployment_info(self.task_uuid)
+                    if task_info and task_info.task.uuid:
+                        self._follow(task_info.jobs or [])
+                        if is_terminal_status(task_info.task.status):
+                            # read once more after one interval to catch the tail of every log
+                            finish_at = now + self.interval
+                            next_poll = now
+                    else:
+                        logging.warning(f"Could not refresh jobs of task {self.task_uuid}")
+                    next_refresh = now + self.refresh_interval
+                if now >= next_poll:
+                    list(executor.map(self._poll_cursor, list(self._cursors)))
+                    next_poll = now + self.interval
+
+                while not self._queue.empty():
+                    yield self._queue.get_nowait()
+                now = time.time()
+                if finish_at is not None and now >= finish_at:
+                    return
+                if deadline is not None and now >= deadline:
+                    return
+
+                wait = min(next_poll, next_refresh) - now
+                if deadline is not None:
+                    wait = min(wait, deadline - now)
+                try:
+                    yield self._queue.get(timeout=max(wait, 0))
+                except queue.Empty:
+                    pass
+        finally:
+            for reader in self._readers.values():
+                reader.stop(timeout=2)
+            self._readers.clear()
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,197 @@
+# ./swan/api/launch_scheduler.py
+
+import logging
+import threading
+import time
+import traceback
+import uuid
+from typing import List, Optional
+
+from swan.api.poller import Poller
+from swan.object import TaskCreationResult
+
+PENDING = "pending"
+LAUNCHING = "launching"
+LAUNCHED = "launched"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+class DeferredLaunch:
+    """A `create_task` request held until its price ceiling or deadline is met."""
+
+    def __init__(self, max_price: float, deadline: float, task_kwargs: dict):
+        self.id = str(uuid.uuid4())
+        self.max_price = max_price
+        self.deadline = deadline
+        self.task_kwargs = task_kwargs
+        self.instance_type = task_kwargs.get("instance_type") or "C1ae.small"
+        self.region = task_kwargs.get("region") or "global"
+        self.status = PENDING
+        self.reason = None
+        self.launch_price = None
+        self.launched_at = None
+        self.result: Optional[TaskCreationResult] = None
+        self._done = threading.Event()
+
+    @property
+    def type(self) -> str:
+        return self.status
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[TaskCreationResult]:
+        """Block until the launch happened (or was cancelled) and return its result."""
+        self._done.wait(timeout)
+        return self.result
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "instance_type": self.instance_type,
+            "region": self.region,
+            "max_price": self.max_price,
+            "deadline": self.deadline,
+            "status": self.status,
+            "reason": self.reason,
+            "launch_price": self.launch_price,
+            "launched_at": self.launched_at,
+            "task_uuid": self.result.task_uuid if self.result else None,
+        }
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_dict()})"
+
+
+class DeferredLaunchScheduler(Poller):
+    """Hold `create_task` requests until the instance price drops to a ceiling.
+
+    Each check refreshes the catalog through `Orchestrator.update_instance_resources`
+    (a no-op when the snapshot_id is unchanged) and launches every pending request
+    whose instance type is available in its region at or below `max_price`, or
+    whose latest-start deadline has been reached. Launched and failed requests
+    are dispatched to subscribers, with their status as event type.
+    """
+
+    thread_name = "swan-launch-scheduler"
+
+    def __init__(self, orchestrator, interval: float = 60, min_interval: float = 5):
+        """
+        Args:
+            orchestrator: Orchestrator used to read prices and create tasks.
+            interval: maximum seconds between price checks.
+            min_interval: minimum seconds between price checks.
+        """
+        super().__init__()
+        self.orchestrator = orchestrator
+        self.interval = interval
+        self.min_interval = min_interval
+        self._pending: List[DeferredLaunch] = []
+        self._pending_lock = threading.Lock()
+
+    def submit(self, max_price: float, deadline: float, **task_kwargs) -> DeferredLaunch:
+        """Queue a `create_task` request.
+
+        Args:
+            max_price: price ceiling per hour for the instance type.
+            deadline: latest start as unix time; the task is launched at any price then.
+            task_kwargs: keyword arguments for `Orchestrator.create_task`.
+
+        Returns:
+            DeferredLaunch handle.
+        """
+        launch = DeferredLaunch(max_price, deadline, task_kwargs)
+        with self._pending_lock:
+            self._pending.append(launch)
+        self.wake()
+        return launch
+
+    def cancel(self, launch: DeferredLaunch) -> bool:
+        """Drop a pending request. Returns False once its `create_task` call has started."""
+        with self._pending_lock:
+            if launch not in self._pending:
+                return False
+            self._pending.remove(launch)
+            launch.status = CANCELLED
+        launch._done.set()
+        return True
+
+    @property
+    def pending(self) -> List[DeferredLaunch]:
+        with self._pending_lock:
+            return list(self._pending)
+
+    def _current_price(self, launch: DeferredLaunch) -> Optional[float]:
+        instance = self.orchestrator.catalog.get(launch.instance_type)
+        if instance is None or instance.status != "available":
+            return None
+        regions = instance.region if isinstance(instance.region, list) else [instance.region]
+        if launch.region.lower() != "global" and launch.region not in regions:
+            return None
+        try:
+            return float(instance.price)
+        except (TypeError, ValueError):
+            return None
+
+    def check(self, now: Optional[float] = None) -> List[DeferredLaunch]:
+        """Refresh prices once and launch every request that is due.
+
+        Returns:
+            list of DeferredLaunch launched (or failed) in this check.
+        """
+        pending = self.pending
+        if not pending:
+            return []
+        self.orchestrator.update_instance_resources()
+        now = now if now is not None else time.time()
+
+        due = []
+        for launch in pending:
+            price = self._current_price(launch)
+            if price is not None and price <= launch.max_price:
+                reason = "price"
+            elif now >= launch.deadline:
+                reason = "deadline"
+            else:
+                continue
+            due.append((launch, price, reason))
+
+        launched = []
+        for launch, price, reason in due:
+            # taken off the queue right before create_task, so a launch cancelled meanwhile is never paid for
+            with self._pending_lock:
+                if launch not in self._pending:
+                    continue
+                self._pending.remove(launch)
+                launch.status = LAUNCHING
+            launch.launch_price = price
+            launch.reason = reason
+            logging.info(f"Launching deferred task, {launch.instance_type=}, {launch.launch_price=}, {launch.reason=}")
+            try:
+                launch.result = self.orchestrator.create_task(**launch.task_kwargs)
+            except Exception as e:
+                logging.error(str(e) + traceback.format_exc())
+            launch.launched_at = now
+            launch.status = LAUNCHED if launch.result else FAILED
+            launch._done.set()
+            launched.append(launch)
+        return launched
+
+    def poll(self) -> List[DeferredLaunch]:
+        launched = self.check()
+        self._dispatch(launched)
+        return launched
+
+    def next_delay(self, now: Optional[float] = None) -> float:
+        """Seconds until the next check: the interval, the nearest deadline or the snapshot expiry."""
+        pending = self.pending
+        if not pending:
+            return self.interval
+        now = now if now is not None else time.time()
+        delay = min(self.interval, min(launch.deadline for launch in pending) - now)
+        expiry_time = self.orchestrator.catalog.expiry_time
+        if expiry_time is not None:
+            delay = min(delay, expiry_time - now + 1)
+        return max(delay, self.min_interval)
@@ -1,27 +1,37 @@
 import logging
 import traceback
 import json
+import random
 import time
-from typing import List, Optional
+import copy
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Optional
 
 from eth_account import Account
 from eth_account.messages import encode_defunct
 
 from swan.api_client import OrchestratorAPIClient
 from swan.common.constant import *
-from swan.object import HardwareConfig, InstanceResource
+from swan.object import HardwareConfig, InstanceResource, InstanceCatalog, InstanceQuote, CatalogDiff, PriceHistory, TaskStore, CostPlanner, CostPlan
 from swan.common.exception import SwanAPIException
 from swan.contract.swan_contract import SwanContract
 from swan.object import (
     TaskCreationResult, 
     TaskDeploymentInfo, 
     TaskList,
+    TaskInfo,
     TaskRenewalResult, 
     TaskTerminationMessage,
     PaymentResult,
-    TaskDetail
+    TaskDetail,
+    ConfigOrder,
+    BatchResult
 )
-from swan.common.utils import validate_ip_or_cidr
+from swan.object.models import dict_to_dataclass
+from swan.api.job_logs import JobLogLine, JobLogStreamer
+from swan.common.utils import is_terminal_status, validate_ip_or_cidr
+from swan.common.cache import TTLCache
 
 class Orchestrator(OrchestratorAPIClient):
   
@@ -40,6 +50,10 @@ class Orchestrator(OrchestratorAPIClient):
         self.region = "global"
         self.all_hardware = None
         self.instance_mapping = None
+        self.catalog = InstanceCatalog()
+        self.price_history = None
+        self.source_uri_cache = TTLCache(ttl=SOURCE_URI_CACHE_TTL)
+        self.app_repo_image_cache = TTLCache(ttl=APP_REPO_IMAGE_CACHE_TTL)
 
         if url_endpoint:
             self.swan_url = url_endpoint
@@ -99,23 +113,55 @@ class Orchestrator(OrchestratorAPIClient):
             if not wallet_address:
                 raise SwanAPIException(f"No wallet_address provided")
 
-            params = {
-                "wallet_address": wallet_address,
-                "hardware_id": hardware_id,
-                "repo_uri": repo_uri,
-                "repo_branch": repo_branch,
-                "dp": "true"
-            }
-            response = self._request_with_params(POST, GET_SOURCE_URI, self.swan_url, params, self.token, None)
-            job_source_uri = ""
-            if response and response.get('data'):
-                job_source_uri = response['data']['job_source_uri']
-        
-            return job_source_uri
+            def request_source_uri():
+                params = {
+                    "wallet_address": wallet_address,
+                    "hardware_id": hardware_id,
+                    "repo_uri": repo_uri,
+                    "repo_branch": repo_branch,
+                    "dp": "true"
+                }
+                response = self._request_with_params(POST, GET_SOURCE_URI, self.swan_url, params, self.token, None)
+                job_source_uri = ""
+                if response and response.get('data'):
+                    job_source_uri = response['data']['job_source_uri']
+                return job_source_uri
+
+            return self.source_uri_cache.get_or_set(
+                (repo_uri, repo_branch, hardware_id, wallet_address),
+                request_source_uri
+            )
         except Exception as e:
             logging.error(str(e) + traceback.format_exc())
             return None
 
+    def configure_source_uri_cache(self, ttl: float = SOURCE_URI_CACHE_TTL, path: Optional[str] = None) -> TTLCache:
+        """Configure the cache of resolved job source URIs.
+
+        Resolved URIs are keyed on repo_uri, repo_branch, hardware_id and wallet_address.
+
+        Args:
+            ttl: seconds a resolved job source URI is reused. Set 0 to disable caching.
+            path: Optional. JSON file to persist resolved URIs across processes.
+
+        Returns:
+            TTLCache object
+        """
+        self.source_uri_cache = TTLCache(ttl=ttl, path=path)
+        return self.source_uri_cache
+
+    def invalidate_source_uri(self, repo_uri: Optional[str] = None, repo_branch: Optional[str] = None) -> int:
+        """Drop cached job source URIs, for one repo (and branch) or all of them.
+
+        Returns:
+            number of cached entries dropped.
+        """
+        if repo_uri is None:
+            return self.source_uri_cache.invalidate()
+        return self.source_uri_cache.invalidate(
+            predicate=lambda key: key[0] == repo_uri and (repo_branch is None or key[1] == repo_branch)
+        )
+
 
     def get_contract_info(self, verification: bool = True):
         response = self._request_without_params(GET, GET_CONTRACT_INFO, self.swan_url, self.token)
@@ -139,9 +185,7 @@ class Orchestrator(OrchestratorAPIClient):
             }
         """
         try:
-            response = self._request_without_params(GET, GET_CP_CONFIG_DP, self.swan_url, self.token)
-            self.all_hardware = [InstanceResource(hardware) for hardware in response["data"]["hardware"]]
-            self.instance_mapping = {hardware.instance_type: hardware.to_dict() for hardware in self.all_hardware}
+            self._refresh_catalog()
             if available:
                 hardwares_info = [hardware.to_dict() for hardware in self.all_hardware if hardware.status == "available"]
             else:
@@ -151,11 +195,62 @@ class Orchestrator(OrchestratorAPIClient):
             logging.error("Failed to fetch hardware configurations.")
             return None
         
+    def _refresh_catalog(self) -> CatalogDiff:
+        """Fetch the hardware catalog, rebuilding `all_hardware` and `instance_mapping` only when its snapshot changed."""
+        response = self._request_without_params(GET, GET_CP_CONFIG_DP, self.swan_url, self.token)
+        diff = self.catalog.update(response["data"]["hardware"])
+        if diff.changed or self.all_hardware is not self.catalog.instances:
+            self.all_hardware = self.catalog.instances
+            self.instance_mapping = self.catalog.instance_mapping()
+        if diff.changed and self.price_history is not None:
+            # a broken history store must not fail the catalog refresh
+            try:
+                self.price_history.record(self.catalog.instances)
+            except Exception as e:
+                logging.error(f"Failed to record price history: {str(e)}" + traceback.format_exc())
+        return diff
+
+    def enable_price_history(self, path: str = ":memory:") -> PriceHistory:
+        """Record every new instance resources snapshot into a local price history store.
+
+        Args:
+            path: SQLite database file. (Default: in-memory)
+
+        Returns:
+            PriceHistory object, e.g. `price_history.price_stats('G1ae.medium', region='Quebec-CA')`
+        """
+        self.price_history = PriceHistory(path)
+        if len(self.catalog):
+            self.price_history.record(self.catalog.instances)
+        return self.price_history
+
+    def update_instance_resources(self) -> Optional[CatalogDiff]:
+        """Incrementally refresh the instance resources catalog.
+
+        The catalog is only re-parsed when the backend snapshot_id changed.
+
+        Returns:
+            CatalogDiff object with price, status and region changes per instance type.
+            e.g. diff.changes[0].to_dict() ->
+            {
+                'instance_type': 'G1ae.medium',
+                'old_price': 3.5,
+                'new_price': 3.2,
+                'old_status': 'available',
+                'new_status': 'available',
+                'added_regions': ['Tokyo-JP'],
+                'removed_regions': []
+            }
+        """
+        try:
+            return self._refresh_catalog()
+        except Exception as e:
+            logging.error(str(e) + traceback.format_exc())
+            return None
+
     def _get_instance_mapping(self):
         try:
-            response = self._request_without_params(GET, GET_CP_CONFIG_DP, self.swan_url, self.token)
-            self.all_hardware = [InstanceResource(hardware) for hardware in response["data"]["hardware"]]
-            self.instance_mapping = {hardware.instance_type: hardware.to_dict() for hardware in self.all_hardware}
+            self._refresh_catalog()
         except Exception:
             logging.error("Failed to fetch hardware configurations.")
             return None
@@ -179,8 +274,8 @@ class Orchestrator(OrchestratorAPIClient):
             }
         """
         try:
-            response = self._request_without_params(GET, GET_CP_CONFIG_DP, self.swan_url, self.token)
-            instance_res = [InstanceResource(hardware) for hardware in response["data"]["hardware"]]
+            self._refresh_catalog()
+            instance_res = list(self.catalog.instances)
             if available:
                 instance_res = [instance for instance in instance_res if instance.status == "available"]
             return instance_res
@@ -188,6 +283,48 @@ class Orchestrator(OrchestratorAPIClient):
             logging.error("Failed to fetch instance resources.")
             return []
     
+    def find_cheapest_instances(
+            self,
+            min_vcpu: int = 0,
+            min_memory: float = 0,
+            gpu_models: Optional[List[str]] = None,
+            min_gpu_count: int = 0,
+            regions: Optional[List[str]] = None,
+            duration: int = 3600,
+            limit: Optional[int] = None,
+            refresh: bool = True,
+        ) -> Optional[List[InstanceQuote]]:
+        """Find the cheapest available instance types satisfying the given requirements.
+
+        Args:
+            min_vcpu: minimum number of vCPUs.
+            min_memory: minimum memory in GiB.
+            gpu_models: Optional. Accepted GPU models, e.g. ['Nvidia 4090'].
+            min_gpu_count: minimum number of GPUs.
+            regions: Optional. Acceptable regions. (Default: global)
+            duration: duration of service runtime in seconds. (Default = 3600)
+            limit: Optional. Maximum number of results.
+            refresh: fetch the latest catalog before solving. (Default = True)
+
+        Returns:
+            list of InstanceQuote ranked by total cost (same as `estimate_payment`).
+        """
+        try:
+            if refresh or not len(self.catalog):
+                self._refresh_catalog()
+            return self.catalog.find_cheapest(
+                min_vcpu=min_vcpu,
+                min_memory=min_memory,
+                gpu_models=gpu_models,
+                min_gpu_count=min_gpu_count,
+                regions=regions,
+                duration=duration,
+                limit=limit,
+            )
+        except Exception as e:
+            logging.error(str(e) + traceback.format_exc())
+            return None
+
     def get_instance_hardware_id(self, instance_type):
         try:
             return self.instance_mapping[instance_type]['hardware_id']
@@ -232,6 +369,35 @@ class Orchestrator(OrchestratorAPIClient):
             return None
 
 
+    def terminate_tasks(self, task_uuids: List[str], max_workers: int = 8) -> BatchResult:
+        """
+        Terminate many tasks concurrently
+
+        Args:
+            task_uuids: uuids of the tasks to terminate.
+            max_workers: maximum number of concurrent requests. (Default = 8)
+
+        Returns:
+            BatchResult object, with `results[i]` (TaskTerminationMessage) and `errors[i]` for `task_uuids[i]`.
+        """
+        count = len(task_uuids)
+        batch = BatchResult(results=[None] * count, errors=[None] * count)
+        if not count:
+            return batch
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, count))) as pool:
+            futures = {pool.submit(self.terminate_task, task_uuid): i for i, task_uuid in enumerate(task_uuids)}
+            for future in as_completed(futures):
+                i = futures[future]
+                result = future.result()
+                batch.results[i] = result
+                if result is None:
+                    batch.errors[i] = f"Failed to terminate task {task_uuids[i]}"
+                elif result.status and result.status != "success":
+                    batch.errors[i] = result.message or f"Failed to terminate task {task_uuids[i]}"
+        logging.info(f"Batch task termination finished, {len(batch.succeeded)}/{count} terminated")
+        return batch
+
+
     def claim_review(self, task_uuid: str):
         """
         Review the uptime of a task
@@ -261,7 +427,59 @@ class Orchestrator(OrchestratorAPIClient):
             logging.error(str(e) + traceback.format_exc())
             return None
     
-    def get_app_repo_image(self, name: str = ""):
+    @staticmethod
+    def _index_app_repo_images(response) -> dict:
+        """Build a name -> url index from the full example code mapping."""
+        index = {}
+        data = response.get("data") if isinstance(response, dict) else None
+        if isinstance(data, dict):
+            entries = data.items()
+        elif isinstance(data, list):
+            entries = [(item.get("name"), item) for item in data if isinstance(item, dict)]
+        else:
+            entries = []
+        for name, value in entries:
+            url = value.get("url") if isinstance(value, dict) else value
+            if name and isinstance(url, str) and url:
+                index[name] = url
+        return index
+
+    def _get_app_repo_image_index(self) -> dict:
+        index = self.app_repo_image_cache.get("index")
+        if index is None:
+            response = self._request_without_params(GET, PREMADE_IMAGE, self.swan_url, self.token)
+            index = self._index_app_repo_images(response)
+            self.app_repo_image_cache.set("index", index)
+        return index
+
+    def refresh_app_repo_images(self) -> dict:
+        """Drop the cached app repo image mapping and fetch it again.
+
+        Returns:
+            dict of app repo image name to repo url.
+        """
+        self.app_repo_image_cache.invalidate()
+        return self._get_app_repo_image_index()
+
+    def get_app_repo_image(self, name: str = "", case_insensitive: bool = False):
+        """
+        Get the repo of an app repo image (demo space), or the full mapping when no name is given.
+
+        Names are looked up in the cached full mapping first. A hit returns a
+        response built from the mapping entry, shaped
+        `{"status": "success", "data": {"name": <name as listed>, "url": <repo url>}}`;
+        only `status` and `data["url"]` are guaranteed to match the backend's
+        per-name response. Names missing from the mapping are requested from
+        the backend, and its response is returned (and cached) as is.
+
+        Args:
+            name: Optional. Name of the app repo image.
+            case_insensitive: match the name against the cached mapping ignoring case.
+                The backend itself matches names exactly. (Default = False)
+
+        Returns:
+            dict response, or None if the request failed.
+        """
         if not name:
             return self._request_without_params(
                 GET, 
@@ -269,16 +487,35 @@ class Orchestrator(OrchestratorAPIClient):
                 self.swan_url, 
                 self.token
             )
-        else:
-            params = {"name": name}
-            return self._request_with_params(
-                GET, 
-                PREMADE_IMAGE, 
-                self.swan_url, 
-                params, 
-                self.token, 
-                None
-            )
+
+        try:
+            index = self._get_app_repo_image_index()
+        except Exception as e:
+            logging.warning(f"Failed to fetch app repo image mapping, {str(e)}")
+            index = {}
+        listed_name = name if name in index else None
+        if listed_name is None and case_insensitive:
+            listed_name = next((key for key in index if key.lower() == name.lower()), None)
+        if listed_name is not None:
+            return {"status": "success", "data": {"name": listed_name, "url": index[listed_name]}}
+
+        cached = self.app_repo_image_cache.get(("name", name))
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        # not in the full mapping, ask the backend for this name only
+        params = {"name": name}
+        result = self._request_with_params(
+            GET, 
+            PREMADE_IMAGE, 
+            self.swan_url, 
+            params, 
+            self.token, 
+            None
+        )
+        if result and result.get("status", "") == "success" and (result.get("data") or {}).get("url"):
+            self.app_repo_image_cache.set(("name", name), copy.deepcopy(result))
+        return result
 
     def create_task(
             self,
@@ -322,128 +559,356 @@ class Orchestrator(OrchestratorAPIClient):
             TaskCreationResult object
         """
         try:
-            if not wallet_address:
-                raise SwanAPIException(f"No wallet_address provided, please pass in a wallet_address")
-
-            if auto_pay:
-                if not private_key:
-                    raise SwanAPIException(f"please provide private_key")
-
-            if not region:
-                region = 'global'
-
-            if not duration or duration < 3600:
-                raise SwanAPIException(f"Duration must be no less than 3600 seconds")
-
-            if not instance_type:
-                instance_type = 'C1ae.small'
-
-            hardware_id = self.get_instance_hardware_id(instance_type)
-            if hardware_id is None:
-                raise SwanAPIException(f"Invalid instance_type {instance_type}")
+            instance_type, region = self._validate_task_args(
+                wallet_address=wallet_address,
+                instance_type=instance_type,
+                region=region,
+                duration=duration,
+                auto_pay=auto_pay,
+                private_key=private_key
+            )
 
             logging.info(f"Using {instance_type} machine, {region=} {duration=} (seconds)")
 
-            if not job_source_uri:
-                if app_repo_image:
-                    if auto_pay == None and private_key:
-                        auto_pay = True
-                    repo_res = self.get_app_repo_image(app_repo_image)
-                    if repo_res and repo_res.get("status", "") == "success":
-                        repo_uri = repo_res.get("data", {}).get("url", "")
-                        if repo_uri == "":
-                            raise SwanAPIException(f"Invalid app_repo_image url")
-                    else:
-                        raise SwanAPIException(f"Invalid app_repo_image")
-
-                if repo_uri:
-                    job_source_uri = self._get_source_uri(
-                            repo_uri=repo_uri,
-                            repo_branch=repo_branch,
-                            wallet_address=wallet_address, 
-                            instance_type=instance_type,
-                        )
-                else:
-                    raise SwanAPIException(f"Please provide app_repo_image, or job_source_uri, or repo_uri")
-
-            if not job_source_uri:
-                raise SwanAPIException(f"Cannot get job_source_uri. Please double check your parameters")
-
-            preferred_cp = None
-            if preferred_cp_list and isinstance(preferred_cp_list, list):
-                preferred_cp = ','.join(preferred_cp_list)
+            if not job_source_uri and app_repo_image and auto_pay == None and private_key:
+                auto_pay = True
+            job_source_uri = self.resolve_job_source_uri(
+                wallet_address=wallet_address,
+                instance_type=instance_type,
+                job_source_uri=job_source_uri,
+                app_repo_image=app_repo_image,
+                repo_uri=repo_uri,
+                repo_branch=repo_branch
+            )
 
-            ip_whitelist_str = None
-            if ip_whitelist and isinstance(ip_whitelist, list):
-                # validate ip address
-                for ip in ip_whitelist:
-                    if not validate_ip_or_cidr(ip):
-                        raise SwanAPIException(f"Invalid ip address: {ip}")
-                ip_whitelist_str = ','.join(ip_whitelist)
-            
-            if self._verify_hardware_region(instance_type, region):
-                params = {
-                    "duration": duration,
-                    "cfg_name": instance_type,
-                    "region": region,
-                    "start_in": start_in,
-                    "wallet": wallet_address,
-                    "job_source_uri": job_source_uri
-                }
-                if preferred_cp:
-                    params["preferred_cp"] = preferred_cp
-                if ip_whitelist_str:
-                    params["ip_whitelist"] = ip_whitelist_str
-                result = self._request_with_params(
-                    POST, 
-                    CREATE_TASK, 
-                    self.swan_url, 
-                    params, 
-                    self.token, 
-                    None
-                )
-                try:
-                    task_uuid = result['data']['task']['uuid']
-                except Exception as e:
-                    err_msg = f"Task creation failed, {str(e)}."
-                    raise SwanAPIException(err_msg)
-            else:
-                err_msg = f"No {instance_type} machine in {region}."
-                raise SwanAPIException(err_msg)
+            result, task_uuid = self._request_task_creation(
+                wallet_address=wallet_address,
+                instance_type=instance_type,
+                region=region,
+                duration=duration,
+                job_source_uri=job_source_uri,
+                start_in=start_in,
+                preferred_cp_list=preferred_cp_list,
+                ip_whitelist=ip_whitelist
+            )
         
-            tx_hash = None
-            tx_hash_approve = None
-            config_order = None
-            amount = None
+            config_result = None
             if auto_pay:
                 config_result = self.make_payment(
                     task_uuid=task_uuid, 
                     duration=duration, 
                     private_key=private_key, 
-                    instance_type=instance_type
+                    instance_type=instance_type,
+                    task_detail=self._task_detail_from_result(result)
                 )
-                if config_result and isinstance(config_result, dict):
-                    tx_hash = config_result.get('tx_hash')
-                    config_order = config_result.get('data')
-                    tx_hash_approve = config_result.get('tx_hash_approve')
-                    amount = config_result.get('amount')
-
-
-            result['config_order'] = config_order
-            result['tx_hash'] = tx_hash
-            result['tx_hash_approve'] = tx_hash_approve
-            result['id'] = task_uuid
-            result['task_uuid'] = task_uuid
-            result['instance_type'] = instance_type
-            result['price'] = amount
 
             # logging.info(f"Task created successfully, {task_uuid=}, {tx_hash=}, {instance_type=}")
-            return TaskCreationResult.load_from_resp(result)
+            return self._load_task_creation_result(result, task_uuid, instance_type, config_result)
 
         except Exception as e:
             logging.error(str(e) + traceback.format_exc())
             return None
 
+    def resolve_job_source_uri(
+            self,
+            wallet_address: str,
+            instance_type: str,
+            job_source_uri: Optional[str] = None,
+            app_repo_image: Optional[str] = None,
+            repo_uri: Optional[str] = None,
+            repo_branch: Optional[str] = None,
+        ) -> str:
+        """
+        Resolve the job source URI `create_task` would deploy
+
+        Args:
+            wallet_address: The user's wallet address.
+            instance_type: The type(name) of the hardware.
+            job_source_uri: Optional. Returned as is if given.
+            app_repo_image: Optional. The name of a demo space, used instead of repo_uri.
+            repo_uri: Optional. The URI of the repo to be deployed.
+            repo_branch: Optional. The branch of the repo to be deployed.
+
+        Returns:
+            job source URI
+        """
+        if job_source_uri:
+            return job_source_uri
+        if app_repo_image:
+            repo_uri = self._resolve_app_repo_image(app_repo_image)
+        if not repo_uri:
+            raise SwanAPIException(f"Please provide app_repo_image, or job_source_uri, or repo_uri")
+        job_source_uri = self._get_source_uri(
+            repo_uri=repo_uri,
+            repo_branch=repo_branch,
+            wallet_address=wallet_address,
+            instance_type=instance_type,
+        )
+        if not job_source_uri:
+            raise SwanAPIException(f"Cannot get job_source_uri. Please double check your parameters")
+        return job_source_uri
+
+    def _validate_task_args(self, wallet_address, instance_type, region, duration, auto_pay, private_key):
+        """Validate `create_task` arguments.
+
+        Returns:
+            (instance_type, region) with defaults applied.
+        """
+        if not wallet_address:
+            raise SwanAPIException(f"No wallet_address provided, please pass in a wallet_address")
+
+        if auto_pay:
+            if not private_key:
+                raise SwanAPIException(f"please provide private_key")
+
+        if not region:
+            region = 'global'
+
+        if not duration or duration < 3600:
+            raise SwanAPIException(f"Duration must be no less than 3600 seconds")
+
+        if not instance_type:
+            instance_type = 'C1ae.small'
+
+        hardware_id = self.get_instance_hardware_id(instance_type)
+        if hardware_id is None:
+            raise SwanAPIException(f"Invalid instance_type {instance_type}")
+
+        return instance_type, region
+
+    def _resolve_app_repo_image(self, app_repo_image: str) -> str:
+        repo_res = self.get_app_repo_image(app_repo_image)
+        if repo_res and repo_res.get("status", "") == "success":
+            repo_uri = repo_res.get("data", {}).get("url", "")
+            if repo_uri == "":
+                raise SwanAPIException(f"Invalid app_repo_image url")
+            return repo_uri
+        raise SwanAPIException(f"Invalid app_repo_image")
+
+    def _request_task_creation(
+            self,
+            wallet_address: str,
+            instance_type: str,
+            region: str,
+            duration: int,
+            job_source_uri: str,
+            start_in: Optional[int] = 300,
+            preferred_cp_list: Optional[List[str]] = None,
+            ip_whitelist: Optional[List[str]] = None,
+            refresh: bool = True
+        ):
+        """POST a task creation request.
+
+        Returns:
+            (response, task_uuid)
+        """
+        preferred_cp = None
+        if preferred_cp_list and isinstance(preferred_cp_list, list):
+            preferred_cp = ','.join(preferred_cp_list)
+
+        ip_whitelist_str = None
+        if ip_whitelist and isinstance(ip_whitelist, list):
+            # validate ip address
+            for ip in ip_whitelist:
+                if not validate_ip_or_cidr(ip):
+                    raise SwanAPIException(f"Invalid ip address: {ip}")
+            ip_whitelist_str = ','.join(ip_whitelist)
+
+        if not self._verify_hardware_region(instance_type, region, refresh=refresh):
+            err_msg = f"No {instance_type} machine in {region}."
+            raise SwanAPIException(err_msg)
+
+        params = {
+            "duration": duration,
+            "cfg_name": instance_type,
+            "region": region,
+            "start_in": start_in,
+            "wallet": wallet_address,
+            "job_source_uri": job_source_uri
+        }
+        if preferred_cp:
+            params["preferred_cp"] = preferred_cp
+        if ip_whitelist_str:
+            params["ip_whitelist"] = ip_whitelist_str
+        result = self._request_with_params(
+            POST, 
+            CREATE_TASK, 
+            self.swan_url, 
+            params, 
+            self.token, 
+            None
+        )
+        try:
+            task_uuid = result['data']['task']['uuid']
+        except Exception as e:
+            err_msg = f"Task creation failed, {str(e)}."
+            raise SwanAPIException(err_msg)
+        return result, task_uuid
+
+    def _load_task_creation_result(self, result, task_uuid, instance_type, config_result=None) -> TaskCreationResult:
+        tx_hash = None
+        tx_hash_approve = None
+        config_order = None
+        amount = None
+        if config_result and isinstance(config_result, dict):
+            tx_hash = config_result.get('tx_hash')
+            config_order = config_result.get('data')
+            tx_hash_approve = config_result.get('tx_hash_approve')
+            amount = config_result.get('amount')
+
+        result['config_order'] = config_order
+        result['tx_hash'] = tx_hash
+        result['tx_hash_approve'] = tx_hash_approve
+        result['id'] = task_uuid
+        result['task_uuid'] = task_uuid
+        result['instance_type'] = instance_type
+        result['price'] = amount
+        return TaskCreationResult.load_from_resp(result)
+
+    def create_tasks(self, specs: List[dict], max_workers: int = 8) -> BatchResult:
+        """
+        Create many tasks concurrently.
+
+        Each distinct app_repo_image and repo_uri is resolved once, hardware is
+        checked against a single catalog fetch, creations are POSTed in parallel,
+        and payments start as soon as their task is created (serialized per
+        private key so that wallet nonces do not collide).
+
+        Args:
+            specs: list of dicts of `create_task` keyword arguments.
+            max_workers: maximum number of concurrent requests. (Default = 8)
+
+        Returns:
+            BatchResult object, with `results[i]` (TaskCreationResult) and `errors[i]` for `specs[i]`.
+        """
+        count = len(specs)
+        batch = BatchResult(results=[None] * count, errors=[None] * count)
+        try:
+            self._refresh_catalog()
+        except Exception as e:
+            logging.error(str(e) + traceback.format_exc())
+            batch.errors = [f"Failed to fetch hardware configurations, {str(e)}"] * count
+            return batch
+
+        prepared = {}
+        for i, spec in enumerate(specs):
+            try:
+                spec = dict(spec)
+                spec.setdefault("region", "global")
+                spec.setdefault("duration", 3600)
+                spec.setdefault("auto_pay", True)
+                spec.setdefault("start_in", 300)
+                if spec.get("app_repo_image") and spec["auto_pay"] == None and spec.get("private_key"):
+                    spec["auto_pay"] = True
+                spec["instance_type"], spec["region"] = self._validate_task_args(
+                    wallet_address=spec.get("wallet_address"),
+                    instance_type=spec.get("instance_type"),
+                    region=spec["region"],
+                    duration=spec["duration"],
+                    auto_pay=spec["auto_pay"],
+                    private_key=spec.get("private_key")
+                )
+                if not spec.get("job_source_uri") and not spec.get("app_repo_image") and not spec.get("repo_uri"):
+                    raise SwanAPIException(f"Please provide app_repo_image, or job_source_uri, or repo_uri")
+                prepared[i] = spec
+            except Exception as e:
+                batch.errors[i] = str(e)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # resolve each distinct app_repo_image, then each distinct source uri, once
+            images = {spec["app_repo_image"] for spec in prepared.values()
+                      if not spec.get("job_source_uri") and spec.get("app_repo_image")}
+            image_futures = {image: pool.submit(self._resolve_app_repo_image, image) for image in images}
+            for i, spec in list(prepared.items()):
+                if spec.get("job_source_uri") or not spec.get("app_repo_image"):
+                    continue
+                try:
+                    spec["repo_uri"] = image_futures[spec["app_repo_image"]].result()
+                except Exception as e:
+                    batch.errors[i] = str(e)
+                    del prepared[i]
+
+            def source_key(spec):
+                return (spec["repo_uri"], spec.get("repo_branch"), spec["wallet_address"], spec["instance_type"])
+
+            source_futures = {}
+            for spec in prepared.values():
+                if not spec.get("job_source_uri") and source_key(spec) not in source_futures:
+                    repo_uri, repo_branch, wallet_address, instance_type = source_key(spec)
+                    source_futures[source_key(spec)] = pool.submit(
+                        self._get_source_uri,
+                        repo_uri=repo_uri,
+                        repo_branch=repo_branch,
+                        wallet_address=wallet_address,
+                        instance_type=instance_type
+                    )
+            for i, spec in list(prepared.items()):
+                if not spec.get("job_source_uri"):
+                    spec["job_source_uri"] = source_futures[source_key(spec)].result()
+                if not spec["job_source_uri"]:
+                    batch.errors[i] = "Cannot get job_source_uri. Please double check your parameters"
+                    del prepared[i]
+
+            creation_futures = {
+                pool.submit(
+                    self._request_task_creation,
+                    wallet_address=spec["wallet_address"],
+                    instance_type=spec["instance_type"],
+                    region=spec["region"],
+                    duration=spec["duration"],
+                    job_source_uri=spec["job_source_uri"],
+                    start_in=spec["start_in"],
+                    preferred_cp_list=spec.get("preferred_cp_list"),
+                    ip_whitelist=spec.get("ip_whitelist"),
+                    refresh=False
+                ): i
+                for i, spec in prepared.items()
+            }
+
+            payment_pools = {}
+            payment_futures = {}
+            created = {}
+            try:
+                for future in as_completed(creation_futures):
+                    i = creation_futures[future]
+                    spec = prepared[i]
+                    try:
+                        created[i] = future.result()
+                    except Exception as e:
+                        batch.errors[i] = str(e)
+                        continue
+                    if spec["auto_pay"]:
+                        private_key = spec["private_key"]
+                        if private_key not in payment_pools:
+                            payment_pools[private_key] = ThreadPoolExecutor(max_workers=1)
+                        payment_futures[payment_pools[private_key].submit(
+                            self.make_payment,
+                            task_uuid=created[i][1],
+                            duration=spec["duration"],
+                            private_key=private_key,
+                            instance_type=spec["instance_type"],
+                            task_detail=self._task_detail_from_result(created[i][0])
+                        )] = i
+                    else:
+                        result, task_uuid = created[i]
+                        batch.results[i] = self._load_task_creation_result(result, task_uuid, spec["instance_type"])
+
+                for future in as_completed(payment_futures):
+                    i = payment_futures[future]
+                    result, task_uuid = created[i]
+                    config_result = future.result()
+                    if not config_result:
+                        batch.errors[i] = f"Payment failed for task {task_uuid}"
+                    batch.results[i] = self._load_task_creation_result(
+                        result, task_uuid, prepared[i]["instance_type"], config_result
+                    )
+            finally:
+                for payment_pool in payment_pools.values():
+                    payment_pool.shutdown(wait=True)
+
+        logging.info(f"Batch task creation finished, {len(batch.succeeded)}/{count} created")
+        return batch
+
     def estimate_payment(self, duration: float = 3600, instance_type: str = None):
         """Estimate required amount.
 
@@ -464,6 +929,47 @@ class Orchestrator(OrchestratorAPIClient):
             logging.error(str(e) + traceback.format_exc())
             return None
         
+    def plan_costs(
+            self,
+            rows,
+            private_key: Optional[str] = None,
+            alternatives: int = 0,
+            refresh: bool = True,
+        ) -> Optional[CostPlan]:
+        """Price many launches or renewals at once and check them against the wallet.
+
+        Args:
+            rows: (instance_type, region, duration, replicas) tuples or dicts with these keys;
+                region defaults to global, duration to 3600 seconds and replicas to 1.
+            private_key: Optional. Private key of the paying wallet, to fetch its allowance and balance.
+            alternatives: number of alternative instance types, at least as large, to quote per row. (Default = 0)
+            refresh: fetch the latest catalog before pricing. (Default = True)
+
+        Returns:
+            CostPlan object with per-row amounts, the total in SWAN and, with a
+            private_key, `allowance_shortfall` and `balance_shortfall`.
+            e.g. [("C1ae.small", "Quebec-CA", 7200, 3)] at 0.5 SWAN/hr -> total 3 SWAN
+        """
+        try:
+            if refresh or not len(self.catalog):
+                self._refresh_catalog()
+            allowance = balance = None
+            if private_key:
+                if not self.contract_info:
+                    raise SwanAPIException(f"No contract info on record, please verify contract first.")
+                contract = SwanContract(private_key, self.contract_info)
+                allowance = contract.from_wei(contract.get_allowance())
+                balance = contract.from_wei(contract.get_balance())
+            plan = CostPlanner(self.catalog).plan(rows, alternatives=alternatives, allowance=allowance, balance=balance)
+            logging.info(
+                f"Planned {len(plan.rows)} rows, total {plan.total} SWAN, "
+                f"{len(plan.unpriced)} unpriced, allowance shortfall {plan.allowance_shortfall}"
+            )
+            return plan
+        except Exception as e:
+            logging.error(str(e) + traceback.format_exc())
+            return None
+
     def approve_allowance(self, private_key: str, amount: float):
         """
         Approve in advance for the contract
@@ -521,6 +1027,7 @@ class Orchestrator(OrchestratorAPIClient):
             task_uuid, 
             private_key, 
             duration = 3600, 
+            task_detail: Optional[TaskDetail] = None,
             **kwargs
         ) -> Optional[PaymentResult]:
         """
@@ -530,13 +1037,13 @@ class Orchestrator(OrchestratorAPIClient):
             task_uuid: unique id returned by `swan_api.create_task`
             private_key: private key of owner
             duration: duration of service runtime (seconds).
+            task_detail: Optional. TaskDetail of the task, fetched if not given.
 
         Returns:
             tx_hash
         """
         try:
-            # instance_type = self.get_task_instance_type(task_uuid)
-            task_detail: TaskDetail = self.get_task_detail(task_uuid)
+            task_detail = self._resolve_task_detail(task_uuid, task_detail)
             instance_type = task_detail.hardware
             price_per_hour = float(task_detail.price_per_hour)
             if not instance_type:
@@ -570,6 +1077,7 @@ class Orchestrator(OrchestratorAPIClient):
             task_uuid, 
             private_key, 
             duration = 3600, 
+            task_detail: Optional[TaskDetail] = None,
             **kwargs
         ) -> Optional[PaymentResult]:
         """
@@ -579,13 +1087,13 @@ class Orchestrator(OrchestratorAPIClient):
             task_uuid: unique id returned by `swan_api.create_task`
             private_key: private key of owner
             duration: duration of service runtime (seconds).
+            task_detail: Optional. TaskDetail of the task, fetched if not given.
 
         Returns:
             tx_hash
         """
         try:
-            # instance_type = self.get_task_instance_type(task_uuid)
-            task_detail: TaskDetail = self.get_task_detail(task_uuid)
+            task_detail = self._resolve_task_detail(task_uuid, task_detail)
             instance_type = task_detail.hardware
             price_per_hour = float(task_detail.price_per_hour)
             if not instance_type:
@@ -652,7 +1160,57 @@ class Orchestrator(OrchestratorAPIClient):
             logging.error(str(e) + traceback.format_exc())
             return None
     
-    def make_payment(self, task_uuid, private_key, duration=3600, instance_type = None):
+    def _confirm_payment(
+            self,
+            tx_hash: str,
+            task_uuid: str,
+            timeout: float = PAYMENT_CONFIRM_TIMEOUT,
+            min_interval: float = 0.5,
+            max_interval: float = 5,
+        ) -> Optional[dict]:
+        """
+        Validate a mined payment on SWAN backend, retrying with backoff until accepted
+
+        Args:
+            tx_hash: tx_hash of the payment, whose receipt was already received
+            task_uuid: unique id returned by `swan_api.create_task`
+            timeout: maximum seconds to keep retrying
+            min_interval: seconds before the first retry, doubled after each attempt up to `max_interval`
+
+        Only a known rejection status (`CONFIG_ORDER_FAILED_STATUSES`) or an
+        error code counts as a definitive rejection and is returned at once;
+        anything else, e.g. a tx the backend has not indexed yet, is retried.
+
+        Returns:
+            JSON response of the validation (or config order status), accepted or
+            rejected, None on timeout.
+        """
+        deadline = time.time() + timeout
+        interval = min_interval
+        while True:
+            res = self.validate_payment(tx_hash=tx_hash, task_uuid=task_uuid)
+            if res and res.get("status") == "success":
+                return res
+            if res and res.get("status") == "failed":
+                data = res.get("data")
+                rejection = dict_to_dataclass(ConfigOrder, data) if isinstance(data, dict) else None
+                if rejection and rejection.failed:
+                    logging.error(f"Payment rejected, {task_uuid=}, {tx_hash=}, {res=}")
+                    return res
+            # the backend may already have picked up the payment on its own
+            order = self.get_config_order_status(task_uuid, tx_hash)
+            config_order = dict_to_dataclass(ConfigOrder, order.get("data")) if order and order.get("status") == "success" else None
+            if config_order and not config_order.pending:
+                if config_order.failed:
+                    logging.error(f"Payment config order failed, {task_uuid=}, {tx_hash=}, {config_order.status=}")
+                return order
+            if time.time() + interval > deadline:
+                logging.warning(f"Payment not accepted within {timeout} seconds, {task_uuid=}, {tx_hash=}")
+                return None
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
+
+    def make_payment(self, task_uuid, private_key, duration=3600, instance_type = None, task_detail: Optional[TaskDetail] = None):
         """
         Submit payment for a task and validate it on SWAN backend
 
@@ -660,6 +1218,7 @@ class Orchestrator(OrchestratorAPIClient):
             task_uuid: unique id returned by `swan_api.create_task`
             duration: duration of service runtime (seconds).
             instance_type: instance type, e.g. C1ae.small
+            task_detail: Optional. TaskDetail of the task, fetched if not given.
         
         Returns:
             JSON response from backend server including 'task_uuid'.
@@ -681,17 +1240,18 @@ class Orchestrator(OrchestratorAPIClient):
                 task_uuid=task_uuid, 
                 duration=duration, 
                 private_key=private_key, 
-                instance_type=instance_type
+                instance_type=instance_type,
+                task_detail=task_detail
             ):
-                time.sleep(3)
-                if res := self.validate_payment(
+                if res := self._confirm_payment(
                     tx_hash=payment.tx_hash, 
                     task_uuid=task_uuid
                 ):
                     res['tx_hash'] = payment.tx_hash
                     res['tx_hash_approve'] = payment.tx_hash_approve
                     res['amount'] = payment.amount
-                    logging.info(f"Payment and validation submitted successfully, {task_uuid=}, {payment}")
+                    if res.get("status") == "success":
+                        logging.info(f"Payment and validation submitted successfully, {task_uuid=}, {payment}")
                     return res
         except Exception as e:
             logging.error(str(e) + traceback.format_exc())
@@ -705,6 +1265,7 @@ class Orchestrator(OrchestratorAPIClient):
             tx_hash: Optional[str] = None, 
             auto_pay: Optional[bool] = True, 
             private_key: Optional[str] = None, 
+            task_detail: Optional[TaskDetail] = None,
             **kwargs
         ) -> Optional[TaskRenewalResult]:
         """
@@ -717,6 +1278,7 @@ class Orchestrator(OrchestratorAPIClient):
             tx_hash: (optional)tx_hash of submitted payment
             private_key: (required if no tx_hash)
             auto_pay: (required True if no tx_hash but with private_key provided)
+            task_detail: (optional)TaskDetail of the task, fetched at most once if not given
         
         Returns:
             TaskRenewalResult object
@@ -731,7 +1293,8 @@ class Orchestrator(OrchestratorAPIClient):
                 payment: PaymentResult = self.renew_payment(
                     task_uuid=task_uuid, 
                     duration=duration, 
-                    private_key=private_key
+                    private_key=private_key,
+                    task_detail=task_detail
                 )
                 if payment:
                     logging.info(f"renew payment transaction hash, {payment=}")
@@ -743,40 +1306,151 @@ class Orchestrator(OrchestratorAPIClient):
                     return None
             else:
                 logging.info(f"will use given payment transaction hash, {tx_hash=}")
+                task_detail = task_detail or self.get_task_detail(task_uuid)
                 amount = self.estimate_payment(
                     duration=duration, 
-                    instance_type=self.get_task_instance_type(task_uuid)
+                    instance_type=task_detail.hardware if task_detail else None
                 )
 
-            if tx_hash and task_uuid:
-                params = {
-                    "task_uuid": task_uuid,
-                    "duration": duration,
-                    "tx_hash": tx_hash
-                }
-
-                result = self._request_with_params(
-                        POST, 
-                        RENEW_TASK, 
-                        self.swan_url, 
-                        params, 
-                        self.token, 
-                        None
-                    )
-                result.update({
-                    "tx_hash_approve": tx_hash_approve,
-                    "tx_hash": tx_hash,
-                    "price": amount,
-                    "task_uuid": task_uuid
-                })
-                logging.info(f"Task renewal request sent successfully, {task_uuid=} {tx_hash=}, {duration=}")
-                return TaskRenewalResult.load_from_resp(result)
-            else:
-                raise SwanAPIException(f"{tx_hash=} or {task_uuid=} invalid")
+            return self._request_task_renewal(task_uuid, duration, tx_hash, tx_hash_approve, amount)
         except Exception as e:
             logging.error(str(e) + traceback.format_exc())
             return None
-        
+
+    def _request_task_renewal(self, task_uuid, duration, tx_hash, tx_hash_approve=None, amount=None) -> TaskRenewalResult:
+        if not (tx_hash and task_uuid):
+            raise SwanAPIException(f"{tx_hash=} or {task_uuid=} invalid")
+        params = {
+            "task_uuid": task_uuid,
+            "duration": duration,
+            "tx_hash": tx_hash
+        }
+
+        result = self._request_with_params(
+                POST, 
+                RENEW_TASK, 
+                self.swan_url, 
+                params, 
+                self.token, 
+                None
+            )
+        result.update({
+            "tx_hash_approve": tx_hash_approve,
+            "tx_hash": tx_hash,
+            "price": amount,
+            "task_uuid": task_uuid
+        })
+        logging.info(f"Task renewal request sent successfully, {task_uuid=} {tx_hash=}, {duration=}")
+        return TaskRenewalResult.load_from_resp(result)
+
+    def renew_tasks(
+            self,
+            task_uuids: List[str],
+            duration: int = 3600,
+            private_key: Optional[str] = None,
+            max_workers: int = 8,
+        ) -> BatchResult:
+        """
+        Renew many tasks with one allowance approval
+
+        Task details are fetched once per task in parallel, the total amount is
+        approved in a single transaction if the allowance is short, then all
+        renewal payments are sent back to back with consecutive nonces. Each
+        task's renewal request is sent as soon as its own receipt arrives.
+
+        Args:
+            task_uuids: uuids of the tasks to renew.
+            duration: duration to extend each task by (seconds). (Default = 3600)
+            private_key: private key of the wallet paying for the renewals.
+            max_workers: maximum number of concurrent requests. (Default = 8)
+
+        Returns:
+            BatchResult object, with `results[i]` (TaskRenewalResult) and `errors[i]` for `task_uuids[i]`.
+        """
+        count = len(task_uuids)
+        batch = BatchResult(results=[None] * count, errors=[None] * count)
+        if not count:
+            return batch
+        try:
+            if not private_key:
+                raise SwanAPIException(f"No private_key provided.")
+            if not self.contract_info:
+                raise SwanAPIException(f"No contract info on record, please verify contract first.")
+            self._refresh_catalog()
+        except Exception as e:
+            logging.error(str(e) + traceback.format_exc())
+            batch.errors = [str(e)] * count
+            return batch
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, count))) as pool:
+            plans = {}
+            detail_futures = {pool.submit(self.get_task_detail, task_uuid): i for i, task_uuid in enumerate(task_uuids)}
+            for future in as_completed(detail_futures):
+                i = detail_futures[future]
+                task_detail = future.result()
+                try:
+                    if not task_detail or not task_detail.hardware:
+                        raise SwanAPIException(f"Invalid task info {task_uuids[i]}")
+                    hardware_id = self.get_instance_hardware_id(task_detail.hardware)
+                    if hardware_id is None:
+                        raise SwanAPIException(f"Invalid instance_type {task_detail.hardware}")
+                    plans[i] = (hardware_id, float(task_detail.price_per_hour))
+                except Exception as e:
+                    batch.errors[i] = str(e)
+            if not plans:
+                return batch
+
+            contract = SwanContract(private_key, self.contract_info)
+            amounts = {i: contract.to_wei(price_per_hour * duration / 3600) for i, (_, price_per_hour) in plans.items()}
+            total = sum(amounts.values())
+            tx_hash_approve = None
+            try:
+                if contract.get_allowance() < total:
+                    logging.info(f"Approving renewal payments for {total} wei")
+                    tx_hash_approve = contract.approve_payment(total)
+                nonce = contract.get_nonce()
+            except Exception as e:
+                logging.error(str(e) + traceback.format_exc())
+                for i in plans:
+                    batch.errors[i] = f"Failed to approve renewal payments, {str(e)}"
+                return batch
+
+            def confirm(i, tx_hash):
+                contract.wait_for_receipt(tx_hash)
+                return self._request_task_renewal(
+                    task_uuids[i], duration, tx_hash, tx_hash_approve, contract.from_wei(amounts[i])
+                )
+
+            renewal_futures = {}
+            for i in sorted(plans):
+                hardware_id, price_per_hour = plans[i]
+                try:
+                    tx_hash = contract.send_renew_payment(
+                        task_uuid=task_uuids[i],
+                        hardware_id=hardware_id,
+                        price_per_hour=price_per_hour,
+                        duration=duration,
+                        nonce=nonce
+                    )
+                except Exception as e:
+                    logging.error(str(e) + traceback.format_exc())
+                    batch.errors[i] = f"Renewal payment failed for task {task_uuids[i]}, {str(e)}"
+                    continue
+                nonce += 1
+                logging.info(f"Renewal payment sent, task_uuid={task_uuids[i]}, {tx_hash=}")
+                renewal_futures[pool.submit(confirm, i, tx_hash)] = i
+
+            for future in as_completed(renewal_futures):
+                i = renewal_futures[future]
+                try:
+                    batch.results[i] = future.result()
+                except Exception as e:
+                    logging.error(str(e) + traceback.format_exc())
+                    batch.errors[i] = f"Renewal failed for task {task_uuids[i]}, {str(e)}"
+
+        logging.info(f"Batch task renewal finished, {len(batch.succeeded)}/{count} renewed")
+        return batch
+
 
     def get_config_order_status(self, task_uuid: str, tx_hash: str):
         """
@@ -814,6 +1488,62 @@ class Orchestrator(OrchestratorAPIClient):
             return None
         
         
+    def get_config_order(self, task_uuid: str, tx_hash: str) -> Optional[ConfigOrder]:
+        """
+        Get the config order of a payment as a ConfigOrder object
+
+        Args:
+            task_uuid: uuid of task.
+            tx_hash: transaction hash of the payment.
+
+        Returns:
+            ConfigOrder object, None if the order is not (yet) known.
+        """
+        result = self.get_config_order_status(task_uuid, tx_hash)
+        data = result.get("data") if result else None
+        if not isinstance(data, dict) or not data:
+            return None
+        return dict_to_dataclass(ConfigOrder, data)
+
+    def wait_for_config_order(
+            self,
+            task_uuid: str,
+            tx_hash: str,
+            timeout: float = 120,
+            min_interval: float = 1,
+            max_interval: float = 15,
+        ) -> Optional[ConfigOrder]:
+        """
+        Wait until the config order of a payment leaves its pending state
+
+        Polls `get_config_order_status` with jittered exponential backoff and
+        returns as soon as the order is confirmed or failed (a status in
+        CONFIG_ORDER_FAILED_STATUSES or a non-empty `error_code`). To wait on
+        many orders at once, use a shared `ConfigOrderWatcher` instead.
+
+        Args:
+            task_uuid: uuid of task.
+            tx_hash: transaction hash of the payment.
+            timeout: maximum seconds to wait. (Default = 120)
+            min_interval: minimum seconds between polls. (Default = 1)
+            max_interval: maximum seconds between polls. (Default = 15)
+
+        Returns:
+            ConfigOrder object in a terminal state, None on timeout.
+        """
+        deadline = time.time() + timeout
+        interval = min_interval
+        while True:
+            config_order = self.get_config_order(task_uuid, tx_hash)
+            if config_order is not None and not config_order.pending:
+                return config_order
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                logging.warning(f"Config order still pending after {timeout} seconds, {task_uuid=}, {tx_hash=}")
+                return None
+            time.sleep(min(random.uniform(min_interval, interval), remaining))
+            interval = min(interval * 2, max_interval)
+
     def get_deployment_info(self, task_uuid: str) -> Optional[TaskDeploymentInfo]:
         """Retrieve deployment info of a deployed space with task_uuid.
 
@@ -866,6 +1596,161 @@ class Orchestrator(OrchestratorAPIClient):
             logging.error(str(e) + traceback.format_exc())
             return None
 
+    def iter_tasks(
+            self,
+            wallet_address: str,
+            page_size: int = 100,
+            prefetch: int = 2,
+        ) -> Iterator[TaskInfo]:
+        """
+        Lazily iterate over all tasks of a wallet address, page by page
+
+        Up to `prefetch` following pages (at least one) are fetched in the
+        background while the current page is consumed, so at most
+        `prefetch + 1` pages are held in memory regardless of how many tasks
+        the wallet has.
+
+        Args:
+            wallet_address: wallet address of the user
+            page_size: number of tasks per page request
+            prefetch: number of pages to load ahead
+
+        Yields:
+            TaskInfo objects in the order returned by the backend, nothing if page_size is not positive
+        """
+        if page_size <= 0:
+            logging.error(f"Invalid page_size {page_size}, must be positive")
+            return
+        prefetch = max(prefetch, 1)
+
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+        pending = deque()
+        page = 1
+        total_page = None
+        try:
+            pending.append(executor.submit(self.get_task_list, wallet_address, page, page_size))
+            while pending:
+                task_list = pending.popleft().result()
+                if task_list is None:
+                    logging.error(f"Stopped iterating tasks of {wallet_address}, page request failed")
+                    return
+                if not task_list.task_list:
+                    return
+                if task_list.total_page is not None:
+                    total_page = task_list.total_page
+                while len(pending) < prefetch:
+                    if total_page is not None and page >= total_page:
+                        break
+                    if total_page is None and len(task_list.task_list) < page_size:
+                        break
+                    page += 1
+                    pending.append(executor.submit(self.get_task_list, wallet_address, page, page_size))
+                yield from task_list.task_list
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+    def get_all_tasks(
+            self,
+            wallet_address: str,
+            page_size: int = 100,
+            concurrency: int = 8,
+        ) -> Optional[List[TaskInfo]]:
+        """
+        Fetch every task of a wallet address
+
+        The first page is read to learn `total_page`, the remaining pages are
+        then fetched in parallel and merged in page order. Tasks seen twice
+        because pages shifted during the fetch are kept only once.
+
+        Args:
+            wallet_address: wallet address of the user
+            page_size: number of tasks per page request
+            concurrency: maximum number of parallel page requests
+
+        Returns:
+            list of TaskInfo objects, or None if page_size is not positive or any page request failed
+        """
+        if page_size <= 0:
+            logging.error(f"Invalid page_size {page_size}, must be positive")
+            return None
+        first_page = self.get_task_list(wallet_address, page=1, size=page_size)
+        if first_page is None:
+            return None
+        pages = [first_page]
+        total_page = first_page.total_page or 1
+        if total_page > 1:
+            with ThreadPoolExecutor(max_workers=max(1, min(concurrency, total_page - 1))) as executor:
+                pages.extend(executor.map(
+                    lambda page: self.get_task_list(wallet_address, page=page, size=page_size),
+                    range(2, total_page + 1)
+                ))
+        if any(task_list is None for task_list in pages):
+            logging.error(f"Failed to fetch all {total_page} task pages of {wallet_address}")
+            return None
+
+        tasks = []
+        seen = set()
+        for task_list in pages:
+            for task_info in task_list.task_list:
+                task_uuid = task_info.task.uuid
+                if task_uuid is not None:
+                    if task_uuid in seen:
+                        continue
+                    seen.add(task_uuid)
+                tasks.append(task_info)
+        return tasks
+
+
+    def sync_task_store(
+            self,
+            store: TaskStore,
+            wallet_address: str,
+            page_size: int = 100,
+            concurrency: int = 8,
+        ) -> List[str]:
+        """
+        Bring a local TaskStore up to date with the tasks of a wallet address
+
+        The task list is walked page by page and each task's `updated_at` is
+        compared with the stored one; only new or changed tasks are re-fetched
+        with `get_deployment_info`.
+
+        Args:
+            store: TaskStore to update
+            wallet_address: wallet address of the user
+            page_size: number of tasks per page request
+            concurrency: maximum number of parallel deployment info requests
+
+        Returns:
+            uuids of the tasks that were (re)written to the store
+        """
+        versions = store.versions(wallet_address)
+        changed = []
+        for task_info in self.iter_tasks(wallet_address, page_size=page_size):
+            task = task_info.task
+            if not task.uuid:
+                continue
+            if task.uuid not in versions or task.updated_at is None or versions[task.uuid] != task.updated_at:
+                changed.append(task.uuid)
+
+        synced = []
+        if not changed:
+            return synced
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(changed)))) as executor:
+            futures = {executor.submit(self.get_deployment_info, task_uuid): task_uuid for task_uuid in changed}
+            for future in as_completed(futures):
+                task_info = future.result()
+                if not task_info or not task_info.task.uuid:
+                    logging.warning(f"Skipped syncing task {futures[future]}, deployment info unavailable")
+                    continue
+                store.save(task_info, wallet_address)
+                synced.append(task_info.task.uuid)
+        logging.info(f"Synced {len(synced)} of {len(changed)} changed tasks of {wallet_address}")
+        return synced
+
 
     def get_real_url(self, task_uuid: str) -> Optional[List[str]]:
         task_info: TaskDeploymentInfo = self.get_deployment_info(task_uuid)
@@ -883,6 +1768,113 @@ class Orchestrator(OrchestratorAPIClient):
             logging.error(str(e) + traceback.format_exc())
             return None
 
+    def stream_job_logs(
+            self,
+            task_uuid: str,
+            log_types=("build", "container"),
+            interval: float = 5,
+            refresh_interval: float = 30,
+            timeout: Optional[float] = None,
+        ) -> Iterator[JobLogLine]:
+        """
+        Follow the build and container logs of all jobs of a task, yielding only new lines.
+
+        `wss://` logs are kept open and deduplicated when a reconnect replays
+        them; HTTP(S) logs are polled with byte ranges and ETags where the log
+        server supports them. Jobs added to the task are picked up on refresh.
+
+        Args:
+            task_uuid: uuid of task.
+            log_types: `build` and/or `container`. (Default: both)
+            interval: seconds between polls of HTTP logs. (Default = 5)
+            refresh_interval: seconds between job list refreshes. (Default = 30)
+            timeout: Optional. Seconds after which streaming stops. By default
+                streaming stops shortly after the task reaches a terminal status.
+
+        Yields:
+            JobLogLine with job uuid, CP, log type and line.
+        """
+        streamer = JobLogStreamer(
+            self, task_uuid, log_types=log_types, interval=interval, refresh_interval=refresh_interval
+        )
+        yield from streamer.stream(timeout=timeout)
+
+    @staticmethod
+    def _task_condition_holds(task_info: TaskDeploymentInfo, condition) -> bool:
+        if callable(condition):
+            return bool(condition(task_info))
+        if condition == "has_real_url":
+            return any(job.job_real_uri for job in task_info.jobs or [])
+        status = task_info.task.status or ""
+        return status.lower() == str(condition).lower()
+
+    @staticmethod
+    def _next_poll_interval(now: float, expected_at: Optional[float], polls_after: int, min_interval: float, max_interval: float) -> float:
+        """Halve the distance to `expected_at` while before it, back off exponentially after it."""
+        if expected_at is not None and now < expected_at:
+            interval = (expected_at - now) / 2
+        else:
+            interval = min_interval * (1.5 ** polls_after)
+        return max(min_interval, min(interval, max_interval))
+
+    def wait_for_task(
+            self,
+            task_uuid: str,
+            until=("running", "has_real_url"),
+            timeout: float = 600,
+            min_interval: float = 2,
+            max_interval: float = 30,
+        ) -> Optional[TaskDeploymentInfo]:
+        """
+        Wait until a task reaches the given conditions.
+
+        Polls `get_deployment_info` often around the task's expected start
+        (`created_at + start_in`) and backs off before and after it.
+
+        Args:
+            task_uuid: uuid of task.
+            until: conditions that must all hold, each a task status (e.g. 'running'),
+                'has_real_url' or a callable taking a TaskDeploymentInfo. (Default: ('running', 'has_real_url'))
+            timeout: maximum seconds to wait. (Default = 600)
+            min_interval: minimum seconds between polls. (Default = 2)
+            max_interval: maximum seconds between polls. (Default = 30)
+
+        Returns:
+            TaskDeploymentInfo object once the conditions hold, None on timeout or if the task ended first.
+        """
+        try:
+            if not task_uuid:
+                raise SwanAPIException(f"Invalid task_uuid")
+            if isinstance(until, str) or callable(until):
+                until = (until,)
+
+            deadline = time.time() + timeout
+            expected_at = None
+            polls_after = 0
+            while True:
+                task_info = self.get_deployment_info(task_uuid)
+                if task_info and task_info.task.uuid:
+                    if all(self._task_condition_holds(task_info, condition) for condition in until):
+                        return task_info
+                    status = task_info.task.status
+                    if is_terminal_status(status):
+                        logging.warning(f"Task {task_uuid} ended with {status=} before reaching {until}")
+                        return None
+                    if expected_at is None and task_info.task.created_at and task_info.task.start_in:
+                        expected_at = task_info.task.created_at + task_info.task.start_in
+
+                now = time.time()
+                if now >= deadline:
+                    logging.warning(f"Timed out waiting for task {task_uuid} to reach {until}")
+                    return None
+                if expected_at is not None and now >= expected_at:
+                    polls_after += 1
+                interval = self._next_poll_interval(now, expected_at, polls_after, min_interval, max_interval)
+                time.sleep(min(interval, deadline - now))
+        except Exception as e:
+            logging.error(str(e) + traceback.format_exc())
+            return None
+
     def get_payment_info(self):
         """Retrieve payment information from the orchestrator after making the payment.
         """
@@ -895,18 +1887,20 @@ class Orchestrator(OrchestratorAPIClient):
             logging.error("An error occurred while executing get_payment_info()")
             return None
 
-    def _verify_hardware_region(self, instance_type: str, region: str):
+    def _verify_hardware_region(self, instance_type: str, region: str, refresh: bool = True):
         """Verify if the hardware exist in given region.
 
         Args:
             instance_type: cfg name (hardware name).
             region: geological regions.
+            refresh: fetch the latest hardware list first. (Default = True)
 
         Returns:
             True when hardware exist in given region.
             False when hardware does not exist or do not exit in given region.
         """
-        self._get_hardware_config()  # make sure all_hardware is updated all the time
+        if refresh:
+            self._get_hardware_config()  # make sure all_hardware is updated all the time
         for hardware in self.all_hardware:
             if hardware.instance_type == instance_type:
                 if region in hardware.region or (region.lower() == 'global' and hardware.status == 'available'):
@@ -928,6 +1922,25 @@ class Orchestrator(OrchestratorAPIClient):
             logging.error(str(e) + traceback.format_exc())
             return None
 
+    @staticmethod
+    def _task_detail_from_result(result) -> Optional[TaskDetail]:
+        """TaskDetail embedded in a task creation response, if it carries what payments need."""
+        try:
+            task_detail = dict_to_dataclass(TaskDetail, result['data']['task']['task_detail'])
+        except Exception:
+            return None
+        if not task_detail.hardware or task_detail.price_per_hour is None:
+            return None
+        return task_detail
+
+    def _resolve_task_detail(self, task_uuid: str, task_detail: Optional[TaskDetail] = None) -> TaskDetail:
+        """Return `task_detail` if given, otherwise fetch it once."""
+        if task_detail is None:
+            task_detail = self.get_task_detail(task_uuid)
+        if task_detail is None:
+            raise SwanAPIException(f"Get task {task_uuid} failed")
+        return task_detail
+
     def get_task_detail(self, task_uuid: str) -> Optional[TaskDetail]:
         try:
             if not task_uuid:
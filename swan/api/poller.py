@@ -0,0 +1,86 @@
+# ./swan/api/poller.py
+
+import logging
+import threading
+import traceback
+from typing import Callable, Iterable, List, Optional
+
+
+class Poller:
+    """Base class for background pollers that dispatch events to subscribers.
+
+    Subclasses implement `poll()` (returning the events it dispatched) and
+    `next_delay()`. Events are expected to have a `type` attribute. `wake()`
+    polls again without waiting for the rest of the current delay.
+    """
+
+    thread_name = "swan-poller"
+
+    def __init__(self):
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def subscribe(self, callback: Callable, event_types: Optional[Iterable[str]] = None):
+        """Register `callback` for all events, or only for the given event types.
+
+        Returns:
+            the callback, so it can be passed to `unsubscribe`.
+        """
+        types = set(event_types) if event_types else None
+        with self._lock:
+            self._subscribers.append((callback, types))
+        return callback
+
+    def unsubscribe(self, callback: Callable):
+        with self._lock:
+            self._subscribers = [(cb, types) for cb, types in self._subscribers if cb is not callback]
+
+    def _dispatch(self, events: List):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for event in events:
+            for callback, types in subscribers:
+                if types is not None and event.type not in types:
+                    continue
+                try:
+                    callback(event)
+                except Exception as e:
+                    logging.error(str(e) + traceback.format_exc())
+
+    def poll(self) -> List:
+        raise NotImplementedError
+
+    def next_delay(self) -> float:
+        raise NotImplementedError
+
+    def wake(self):
+        self._wakeup.set()
+
+    def run(self):
+        """Poll until `stop` is called. Blocks the calling thread."""
+        while not self._stop_event.is_set():
+            self._wakeup.clear()
+            try:
+                self.poll()
+            except Exception as e:
+                logging.error(str(e) + traceback.format_exc())
+            self._wakeup.wait(self.next_delay())
+
+    def start(self):
+        """Start polling in a background daemon thread."""
+        if self._thread and self._thread.is_alive():
+            return self
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, name=self.thread_name, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop_event.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,227 @@
+# ./swan/api/renewal_manager.py
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from swan.api.poller import Poller
+from swan.common.utils import is_terminal_status
+from swan.object.models import Base
+
+RENEWAL_SUBMITTED = "renewal_submitted"
+RENEWAL_CONFIRMED = "renewal_confirmed"
+RENEWAL_FAILED = "renewal_failed"
+TASK_EXPIRED = "task_expired"
+
+
+@dataclass
+class RenewalEvent(Base):
+    type: Optional[str] = None
+    task_uuid: Optional[str] = None
+    end_at: Optional[int] = None
+    tx_hash: Optional[str] = None
+    error: Optional[str] = None
+
+
+class RenewalManager(Poller):
+    """Renew tracked tasks shortly before their `end_at`.
+
+    A task becomes due `lead_time` seconds before it ends. When one task is
+    due, every task ending within the following `batch_window` seconds is
+    renewed with it through a single `Orchestrator.renew_tasks` call (one
+    allowance approval, pipelined payments). Each renewal is then confirmed
+    with `get_config_order` before the task's new `end_at` is read; a
+    refreshed `end_at` that is not past the renewed one is treated as stale
+    and advanced locally by `duration`, so a renewal is never paid twice.
+    Renewals not confirmed within `confirm_timeout` are reported as failed
+    and attempted again.
+    """
+
+    thread_name = "swan-renewal-manager"
+
+    def __init__(
+            self,
+            orchestrator,
+            private_key: str,
+            duration: int = 3600,
+            lead_time: float = 600,
+            batch_window: float = 300,
+            interval: float = 300,
+            min_interval: float = 5,
+            confirm_interval: float = 10,
+            retry_interval: float = 60,
+            confirm_timeout: float = 600,
+        ):
+        """
+        Args:
+            orchestrator: Orchestrator used to read and renew tasks.
+            private_key: private key of the wallet paying for renewals.
+            duration: seconds each renewal extends a task by. (Default = 3600)
+            lead_time: seconds before `end_at` a task is renewed. (Default = 600)
+            batch_window: tasks due within this many seconds of each other share a batch. (Default = 300)
+            interval: maximum seconds between checks. (Default = 300)
+            min_interval: minimum seconds between checks. (Default = 5)
+            confirm_interval: seconds between config order status checks. (Default = 10)
+            retry_interval: seconds before a failed renewal is attempted again. (Default = 60)
+            confirm_timeout: seconds a renewal may stay unconfirmed before it counts as failed. (Default = 600)
+        """
+        super().__init__()
+        self.orchestrator = orchestrator
+        self.private_key = private_key
+        self.duration = duration
+        self.lead_time = lead_time
+        self.batch_window = batch_window
+        self.interval = interval
+        self.min_interval = min_interval
+        self.confirm_interval = confirm_interval
+        self.retry_interval = retry_interval
+        self.confirm_timeout = confirm_timeout
+        self._end_at: Dict[str, Optional[int]] = {}
+        self._confirming: Dict[str, str] = {}
+        self._confirm_deadline: Dict[str, float] = {}
+        self._renewed_from: Dict[str, Optional[int]] = {}
+        self._retry_at: Dict[str, float] = {}
+        self._track_lock = threading.Lock()
+
+    def track(self, task_uuids: Iterable[str]):
+        """Start renewing tasks. Their `end_at` is read from `TaskDetail` on the next check."""
+        with self._track_lock:
+            for task_uuid in task_uuids:
+                self._end_at.setdefault(task_uuid, None)
+
+    def untrack(self, task_uuids: Iterable[str]):
+        with self._track_lock:
+            for task_uuid in task_uuids:
+                self._end_at.pop(task_uuid, None)
+                self._confirming.pop(task_uuid, None)
+                self._confirm_deadline.pop(task_uuid, None)
+                self._renewed_from.pop(task_uuid, None)
+                self._retry_at.pop(task_uuid, None)
+
+    @property
+    def tracked(self) -> Dict[str, Optional[int]]:
+        """`end_at` of every tracked task, keyed by uuid (None until known)."""
+        with self._track_lock:
+            return dict(self._end_at)
+
+    def _refresh_end_at(self, events: List[RenewalEvent]):
+        for task_uuid, end_at in self.tracked.items():
+            if end_at is not None or task_uuid in self._confirming:
+                continue
+            task_detail = self.orchestrator.get_task_detail(task_uuid)
+            if not task_detail:
+                continue
+            if is_terminal_status(task_detail.status):
+                self.untrack([task_uuid])
+                events.append(RenewalEvent(type=TASK_EXPIRED, task_uuid=task_uuid, end_at=task_detail.end_at))
+                continue
+            end_at = task_detail.end_at
+            renewed_from = self._renewed_from.pop(task_uuid, None)
+            if renewed_from is not None and (end_at is None or end_at <= renewed_from):
+                logging.warning(f"Task {task_uuid} still ends at {end_at} after renewal, assuming {renewed_from + self.duration}")
+                end_at = renewed_from + self.duration
+            with self._track_lock:
+                if task_uuid in self._end_at:
+                    self._end_at[task_uuid] = end_at
+
+    def _confirm(self, events: List[RenewalEvent], now: float):
+        for task_uuid, tx_hash in list(self._confirming.items()):
+            config_order = self.orchestrator.get_config_order(task_uuid, tx_hash)
+            if config_order is None or config_order.pending:
+                if now < self._confirm_deadline.get(task_uuid, now):
+                    continue
+                # unknown outcome: re-read the task and let the next check renew it again if needed
+                self._confirming.pop(task_uuid, None)
+                self._confirm_deadline.pop(task_uuid, None)
+                self._renewed_from.pop(task_uuid, None)
+                with self._track_lock:
+                    if task_uuid in self._end_at:
+                        self._end_at[task_uuid] = None
+                events.append(RenewalEvent(
+                    type=RENEWAL_FAILED, task_uuid=task_uuid, tx_hash=tx_hash,
+                    error=f"Renewal not confirmed within {self.confirm_timeout} seconds"
+                ))
+                continue
+            self._confirming.pop(task_uuid, None)
+            self._confirm_deadline.pop(task_uuid, None)
+            with self._track_lock:
+                if task_uuid in self._end_at:
+                    self._end_at[task_uuid] = None
+            if config_order.failed:
+                self._renewed_from.pop(task_uuid, None)
+                events.append(RenewalEvent(
+                    type=RENEWAL_FAILED, task_uuid=task_uuid, tx_hash=tx_hash,
+                    error=f"Config order {config_order.status}, error_code={config_order.error_code}"
+                ))
+            else:
+                events.append(RenewalEvent(type=RENEWAL_CONFIRMED, task_uuid=task_uuid, tx_hash=tx_hash))
+
+    def _renew_at(self) -> Dict[str, float]:
+        return {
+            task_uuid: end_at - self.lead_time
+            for task_uuid, end_at in self.tracked.items()
+            if end_at is not None and task_uuid not in self._confirming
+        }
+
+    def due(self, now: Optional[float] = None) -> List[str]:
+        """Tasks to renew now: those past their lead time plus every task due within the batch window."""
+        now = now if now is not None else time.time()
+        renew_at = self._renew_at()
+        renew_at = {task_uuid: at for task_uuid, at in renew_at.items() if self._retry_at.get(task_uuid, 0) <= now}
+        if not renew_at or min(renew_at.values()) > now:
+            return []
+        return sorted(
+            (task_uuid for task_uuid, at in renew_at.items() if at <= now + self.batch_window),
+            key=renew_at.get
+        )
+
+    def poll(self, now: Optional[float] = None) -> List[RenewalEvent]:
+        """Confirm pending renewals, refresh unknown `end_at` values and renew due tasks.
+
+        Returns:
+            list of RenewalEvent produced by this check.
+        """
+        now = now if now is not None else time.time()
+        events = []
+        self._confirm(events, now)
+        self._refresh_end_at(events)
+
+        due = self.due(now)
+        if due:
+            end_at = self.tracked
+            logging.info(f"Renewing {len(due)} tasks in one batch, {self.duration=}")
+            batch = self.orchestrator.renew_tasks(due, duration=self.duration, private_key=self.private_key)
+            for task_uuid, result, error in zip(due, batch.results, batch.errors):
+                if error is None and result is not None and result.tx_hash:
+                    self._retry_at.pop(task_uuid, None)
+                    self._confirming[task_uuid] = result.tx_hash
+                    self._confirm_deadline[task_uuid] = now + self.confirm_timeout
+                    self._renewed_from[task_uuid] = end_at.get(task_uuid)
+                    events.append(RenewalEvent(
+                        type=RENEWAL_SUBMITTED, task_uuid=task_uuid, end_at=end_at.get(task_uuid), tx_hash=result.tx_hash
+                    ))
+                else:
+                    # re-read the task before retrying, it may have ended meanwhile
+                    self._retry_at[task_uuid] = now + self.retry_interval
+                    with self._track_lock:
+                        if task_uuid in self._end_at:
+                            self._end_at[task_uuid] = None
+                    events.append(RenewalEvent(
+                        type=RENEWAL_FAILED, task_uuid=task_uuid, end_at=end_at.get(task_uuid), error=error
+                    ))
+
+        self._dispatch(events)
+        return events
+
+    def next_delay(self, now: Optional[float] = None) -> float:
+        """Seconds until the next check: the interval, the next lead time or the next confirmation check."""
+        now = now if now is not None else time.time()
+        delay = self.interval
+        if self._confirming or any(end_at is None for end_at in self.tracked.values()):
+            delay = min(delay, self.confirm_interval)
+        renew_at = [max(at, self._retry_at.get(task_uuid, 0)) for task_uuid, at in self._renew_at().items()]
+        if renew_at:
+            delay = min(delay, min(renew_at) - now)
+        return max(delay, self.min_interval)
@@ -0,0 +1,158 @@
+# ./swan/api/task_watcher.py
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from swan.api.poller import Poller
+from swan.object.models import Base, TaskDeploymentInfo
+
+TASK_STATUS_CHANGED = "status_changed"
+TASK_UPDATED = "updated"
+TASK_NOT_FOUND = "not_found"
+
+
+@dataclass
+class TaskEvent(Base):
+    type: Optional[str] = None
+    task_uuid: Optional[str] = None
+    wallet_address: Optional[str] = None
+    old_status: Optional[str] = None
+    new_status: Optional[str] = None
+    updated_at: Optional[int] = None
+    task_info: Optional[Any] = None
+
+
+class TaskFleetWatcher(Poller):
+    """Track state transitions of many tasks with as few backend calls as possible.
+
+    Every poll sweeps `get_task_list` page by page per wallet (stopping once
+    all watched tasks of that wallet were seen) and only falls back to a
+    per-task `get_deployment_info` for watched tasks the sweep did not reach.
+    A task is reported when its status or `updated_at` changed, and as
+    `not_found` when the backend answers without it. Failed requests are
+    logged and leave the last known state untouched.
+    """
+
+    thread_name = "swan-task-watcher"
+
+    def __init__(
+            self,
+            orchestrator,
+            page_size: int = 100,
+            max_pages: Optional[int] = None,
+            interval: float = 30,
+            fetch_details: bool = False,
+        ):
+        """
+        Args:
+            orchestrator: Orchestrator used to query tasks.
+            page_size: tasks per `get_task_list` page. (Default = 100)
+            max_pages: Optional. Maximum pages swept per wallet and poll.
+            interval: seconds between polls. (Default = 30)
+            fetch_details: re-fetch `get_deployment_info` for tasks that changed. (Default = False)
+        """
+        super().__init__()
+        self.orchestrator = orchestrator
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.interval = interval
+        self.fetch_details = fetch_details
+        self._watched: Dict[str, Optional[str]] = {}
+        self._state: Dict[str, tuple] = {}
+        self._watch_lock = threading.Lock()
+
+    def watch(self, task_uuids: Iterable[str], wallet_address: Optional[str] = None):
+        """Start tracking tasks. Tasks without a wallet are polled one by one."""
+        with self._watch_lock:
+            for task_uuid in task_uuids:
+                self._watched[task_uuid] = wallet_address
+
+    def unwatch(self, task_uuids: Iterable[str]):
+        with self._watch_lock:
+            for task_uuid in task_uuids:
+                self._watched.pop(task_uuid, None)
+                self._state.pop(task_uuid, None)
+
+    @property
+    def watched(self) -> Dict[str, Optional[str]]:
+        with self._watch_lock:
+            return dict(self._watched)
+
+    def status(self, task_uuid: str) -> Optional[str]:
+        state = self._state.get(task_uuid)
+        return state[0] if state else None
+
+    def _sweep(self, wallet_address: str, task_uuids: set) -> Dict[str, Any]:
+        found = {}
+        page = 1
+        while task_uuids - found.keys():
+            task_list = self.orchestrator.get_task_list(wallet_address, page=page, size=self.page_size)
+            if not task_list or not task_list.task_list:
+                break
+            for task_info in task_list.task_list:
+                if task_info.task.uuid in task_uuids:
+                    found[task_info.task.uuid] = task_info
+            if not task_list.total_page or page >= task_list.total_page:
+                break
+            if self.max_pages and page >= self.max_pages:
+                break
+            page += 1
+        return found
+
+    def _observe(self, task_uuid: str, wallet_address: Optional[str], task_info) -> Optional[TaskEvent]:
+        task = task_info.task
+        state = (task.status, task.updated_at)
+        old_state = self._state.get(task_uuid)
+        if old_state == state:
+            return None
+        self._state[task_uuid] = state
+        if self.fetch_details and not isinstance(task_info, TaskDeploymentInfo):
+            task_info = self.orchestrator.get_deployment_info(task_uuid) or task_info
+        old_status = old_state[0] if old_state else None
+        return TaskEvent(
+            type=TASK_STATUS_CHANGED if old_status != task.status else TASK_UPDATED,
+            task_uuid=task_uuid,
+            wallet_address=wallet_address,
+            old_status=old_status,
+            new_status=task.status,
+            updated_at=task.updated_at,
+            task_info=task_info
+        )
+
+    def poll(self) -> List[TaskEvent]:
+        """Sweep all watched tasks once and dispatch transition events.
+
+        Returns:
+            list of TaskEvent produced by this poll.
+        """
+        by_wallet: Dict[Optional[str], set] = {}
+        for task_uuid, wallet_address in self.watched.items():
+            by_wallet.setdefault(wallet_address, set()).add(task_uuid)
+
+        events = []
+        for wallet_address, task_uuids in by_wallet.items():
+            found = self._sweep(wallet_address, task_uuids) if wallet_address else {}
+            for task_uuid in task_uuids:
+                task_info = found.get(task_uuid)
+                if task_info is None:
+                    task_info = self.orchestrator.get_deployment_info(task_uuid)
+                if task_info is None:
+                    # a failed request says nothing about the task, keep its last state
+                    logging.warning(f"Failed to fetch task {task_uuid}, keeping its last state")
+                    continue
+                if not task_info.task or not task_info.task.uuid:
+                    if self._state.get(task_uuid) != (None, None):
+                        self._state[task_uuid] = (None, None)
+                        events.append(TaskEvent(type=TASK_NOT_FOUND, task_uuid=task_uuid, wallet_address=wallet_address))
+                    continue
+                if event := self._observe(task_uuid, wallet_address, task_info):
+                    events.append(event)
+
+        logging.debug(f"Task watcher poll produced {len(events)} events for {len(self.watched)} tasks")
+        self._dispatch(events)
+        return events
+
+    def next_delay(self) -> float:
+        return self.interval
@@ -0,0 +1,118 @@
+# ./swan/common/cache.py
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe key/value cache whose entries expire after `ttl` seconds.
+
+    Keys may be strings or tuples of JSON-serializable values. When `path` is
+    given, entries are also persisted to that JSON file and reloaded on start,
+    so they survive process restarts.
+    """
+
+    def __init__(self, ttl: float = 600, path: Optional[str] = None):
+        """
+        Args:
+            ttl: seconds an entry stays valid.
+            path: Optional. JSON file used as on-disk tier.
+        """
+        self.ttl = ttl
+        self.path = path
+        self._entries = {}
+        self._lock = threading.Lock()
+        if path:
+            self._load()
+
+    @staticmethod
+    def _key(key) -> str:
+        return json.dumps(list(key) if isinstance(key, tuple) else key)
+
+    def _load(self):
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, "r") as cache_file:
+                    entries = json.load(cache_file)
+                now = time.time()
+                self._entries = {key: tuple(entry) for key, entry in entries.items() if entry[0] > now}
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable cache file {self.path}, {str(e)}")
+            self._entries = {}
+
+    def _save(self):
+        if not self.path:
+            return
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w") as cache_file:
+                json.dump(self._entries, cache_file)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logging.warning(f"Failed to write cache file {self.path}, {str(e)}")
+
+    def get(self, key, default=None) -> Any:
+        with self._lock:
+            entry = self._entries.get(self._key(key))
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[self._key(key)]
+                return default
+            return value
+
+    def set(self, key, value, ttl: Optional[float] = None):
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[self._key(key)] = (time.time() + ttl, value)
+            self._save()
+
+    def get_or_set(self, key, factory: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """Return the cached value for `key`, or compute it with `factory` and cache it if truthy."""
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = factory()
+        if value:
+            self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, key=None, predicate: Optional[Callable[[Any], bool]] = None) -> int:
+        """Drop `key`, every key matching `predicate`, or (with neither) everything.
+
+        Args:
+            key: Optional. Key to drop.
+            predicate: Optional. Called with each key (tuples come back as lists).
+
+        Returns:
+            number of entries dropped.
+        """
+        with self._lock:
+            if key is not None:
+                dropped = 1 if self._entries.pop(self._key(key), None) is not None else 0
+            elif predicate is not None:
+                keys = [k for k in self._entries if predicate(json.loads(k))]
+                for k in keys:
+                    del self._entries[k]
+                dropped = len(keys)
+            else:
+                dropped = len(self._entries)
+                self._entries = {}
+            if dropped:
+                self._save()
+            return dropped
+
+    def __len__(self):
+        with self._lock:
+            now = time.time()
+            return sum(1 for expires_at, _ in self._entries.values() if expires_at > now)
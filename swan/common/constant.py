@@ -36,6 +36,12 @@ CLIENT_CONTRACT_ABI = "ClientPayment.json"
 # Other
 CONTRACT_TIMEOUT = 300
 MAX_DURATION = 1209600
+SOURCE_URI_CACHE_TTL = 600
+APP_REPO_IMAGE_CACHE_TTL = 600
+TASK_TERMINAL_STATUSES = ("terminated", "finished", "completed", "complete", "ended", "failed", "cancelled")
+CONFIG_ORDER_PENDING_STATUSES = ("pending", "pending_payment_confirm")
+CONFIG_ORDER_FAILED_STATUSES = ("failed", "payment_failed", "cancelled")
+PAYMENT_CONFIRM_TIMEOUT = 60
 
 # bucket API stuff
 
@@ -63,4 +63,8 @@ class SwanParamsException(Exception):
 
 
 class SwanEnvironmentValueException(Exception):
-    pass
\ No newline at end of file
+    pass
+
+
+class SwanContractException(Exception):
+    pass
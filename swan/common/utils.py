@@ -1,8 +1,9 @@
 import requests
-from swan.common.constant import FIL_PRICE_API
+from swan.common.constant import FIL_PRICE_API, TASK_TERMINAL_STATUSES
 import json
 import os
 import datetime
+import math
 import re
 
 
@@ -110,3 +111,19 @@ def validate_ip_or_cidr(entry):
     if '/' in entry:
         return is_valid_cidr(entry)
     return is_valid_ipv4(entry) or is_valid_ipv6(entry)
+
+
+def is_terminal_status(status) -> bool:
+    """True when a task or job status (any capitalization, e.g. `Ended`) means it will not run again."""
+    return bool(status) and str(status).lower() in TASK_TERMINAL_STATUSES
+
+
+def percentile(values, q: float):
+    """Linear-interpolated percentile of `values`, `q` in [0, 100]; None if `values` is empty."""
+    if not values:
+        return None
+    values = sorted(values)
+    rank = (len(values) - 1) * q / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return values[low] + (values[high] - values[low]) * (rank - low)
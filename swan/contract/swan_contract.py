@@ -9,7 +9,7 @@ from web3 import Web3
 from web3.middleware import geth_poa_middleware
 
 from swan.common.constant import *
-from swan.common.exception import SwanEnvironmentValueException
+from swan.common.exception import SwanContractException, SwanEnvironmentValueException
 from swan.common.utils import get_contract_abi
 from swan.object import PaymentResult
 
@@ -137,6 +137,14 @@ class SwanContract():
         ).call()
     
 
+    def get_balance(self):
+        """Get swan token balance of the wallet.
+
+        Returns:
+            int balance in wei.
+        """
+        return self.token_contract.functions.balanceOf(self.account.address).call()
+
     def submit_payment(
             self, 
             task_uuid: str, 
@@ -259,18 +267,72 @@ class SwanContract():
         Args:
             amount: amount in wei
         """
-        nonce = self.w3.eth.get_transaction_count(self.account.address)
-        tx = self.token_contract.functions.approve(
-            self.client_contract.address,
-            amount
-        ).build_transaction({
+        return self._send_transaction(
+            self.token_contract.functions.approve(self.client_contract.address, amount)
+        )
+
+    def get_nonce(self) -> int:
+        """Next nonce of the account, counting transactions still pending."""
+        return self.w3.eth.get_transaction_count(self.account.address, "pending")
+
+    def wait_for_receipt(self, tx_hash: str, timeout: float = CONTRACT_TIMEOUT):
+        """Wait until `tx_hash` is mined and raise if the transaction reverted.
+
+        Returns:
+            transaction receipt
+        """
+        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+        if receipt.get("status") == 0:
+            raise SwanContractException(f"Transaction {tx_hash} reverted")
+        return receipt
+
+    def send_renew_payment(
+            self,
+            task_uuid: str,
+            hardware_id: int,
+            price_per_hour: float,
+            duration: int,
+            nonce: int
+        ) -> str:
+        """
+        Send a renewal payment without approving or waiting for its receipt
+
+        The allowance must already cover the payment; used to pipeline many
+        renewals with consecutive nonces.
+
+        Args:
+            task_uuid: unique id returned by `swan_api.create_task`
+            hardware_id: id of cp/hardware configuration set
+            price_per_hour: price per hour (in ether)
+            duration: duration of service runtime (seconds).
+            nonce: nonce of the transaction
+
+        Returns:
+            tx_hash
+        """
+        return self._send_transaction(
+            self.client_contract.functions.renewPayment(
+                task_uuid,
+                hardware_id,
+                self.to_wei(price_per_hour),
+                duration
+            ),
+            nonce=nonce,
+            wait=False
+        )
+
+    def _send_transaction(self, function, nonce: int = None, wait: bool = True) -> str:
+        if nonce is None:
+            nonce = self.w3.eth.get_transaction_count(self.account.address)
+        tx = function.build_transaction({
             'from': self.account.address,
             'nonce': nonce,
             **self._get_fee_per_gas(),
         })
         signed_tx = self.w3.eth.account.sign_transaction(tx, self.account._private_key)
         tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
-        self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=CONTRACT_TIMEOUT)
+        if wait:
+            self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=CONTRACT_TIMEOUT)
         return self.w3.to_hex(tx_hash)
 
     
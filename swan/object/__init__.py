@@ -6,10 +6,19 @@ from swan.object.models import (
     ConfigOrder,
     TaskDeploymentInfo,
     TaskList,
+    TaskInfo,
     Job,
     CPAccount,
     TaskRenewalResult,
     TaskTerminationMessage,
     PaymentResult,
-    TaskDetail
+    TaskDetail,
+    BatchResult
 )
+
+from swan.object.catalog import InstanceCatalog, InstanceQuote, InstanceChange, CatalogDiff, CatalogEvent
+from swan.object.price_history import PriceHistory, PricePoint, PriceStats
+from swan.object.task_store import TaskStore
+from swan.object.placement import CPPlacement, CPCandidate
+from swan.object.deployment_timeline import DeploymentAnalytics, DeploymentTimeline, LatencyStats
+from swan.object.cost_planner import CostPlanner, CostPlan, CostPlanRow
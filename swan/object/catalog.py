@@ -0,0 +1,366 @@
+# ./swan/object/catalog.py
+
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+
+from swan.object.cp_config import InstanceResource
+from swan.object.models import Base
+
+
+def _normalize_gpu_model(model):
+    if not model:
+        return None
+    return " ".join(str(model).lower().split())
+
+
+def _to_price(price):
+    try:
+        return float(price)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_region_list(region):
+    if not region:
+        return []
+    if isinstance(region, str):
+        return [region]
+    return list(region)
+
+
+@dataclass
+class InstanceQuote(Base):
+    instance_type: Optional[str] = None
+    hardware_id: Optional[int] = None
+    price: Optional[float] = None
+    duration: Optional[int] = None
+    amount: Optional[float] = None
+    vcpu: Optional[int] = None
+    memory: Optional[float] = None
+    gpu_model: Optional[str] = None
+    gpu_count: Optional[int] = None
+    regions: Optional[List[str]] = field(default_factory=list)
+
+
+@dataclass
+class InstanceChange(Base):
+    instance_type: Optional[str] = None
+    old_price: Optional[float] = None
+    new_price: Optional[float] = None
+    old_status: Optional[str] = None
+    new_status: Optional[str] = None
+    added_regions: Optional[List[str]] = field(default_factory=list)
+    removed_regions: Optional[List[str]] = field(default_factory=list)
+
+    @property
+    def price_changed(self) -> bool:
+        return self.old_price != self.new_price
+
+    @property
+    def status_changed(self) -> bool:
+        return self.old_status != self.new_status
+
+
+@dataclass
+class CatalogDiff(Base):
+    old_snapshot_id: Optional[int] = None
+    snapshot_id: Optional[int] = None
+    changed: bool = False
+    added: Optional[List[str]] = field(default_factory=list)
+    removed: Optional[List[str]] = field(default_factory=list)
+    changes: Optional[List[InstanceChange]] = field(default_factory=list)
+
+
+INSTANCE_AVAILABLE = "instance_available"
+INSTANCE_UNAVAILABLE = "instance_unavailable"
+PRICE_CHANGED = "price_changed"
+REGION_ADDED = "region_added"
+REGION_REMOVED = "region_removed"
+SNAPSHOT_EXPIRING = "snapshot_expiring"
+
+
+@dataclass
+class CatalogEvent(Base):
+    type: Optional[str] = None
+    instance_type: Optional[str] = None
+    snapshot_id: Optional[int] = None
+    region: Optional[str] = None
+    old_price: Optional[float] = None
+    new_price: Optional[float] = None
+    expiry_time: Optional[int] = None
+
+
+def diff_to_events(diff: CatalogDiff, catalog: 'InstanceCatalog') -> List[CatalogEvent]:
+    """Translate a CatalogDiff into typed CatalogEvent objects."""
+    events = []
+    if not diff.changed:
+        return events
+    snapshot_id = diff.snapshot_id
+    for name in diff.added:
+        instance = catalog.get(name)
+        if instance is not None and instance.status == "available":
+            events.append(CatalogEvent(type=INSTANCE_AVAILABLE, instance_type=name, snapshot_id=snapshot_id))
+    for name in diff.removed:
+        events.append(CatalogEvent(type=INSTANCE_UNAVAILABLE, instance_type=name, snapshot_id=snapshot_id))
+    for change in diff.changes:
+        name = change.instance_type
+        if change.status_changed:
+            if change.new_status == "available":
+                events.append(CatalogEvent(type=INSTANCE_AVAILABLE, instance_type=name, snapshot_id=snapshot_id))
+            elif change.old_status == "available":
+                events.append(CatalogEvent(type=INSTANCE_UNAVAILABLE, instance_type=name, snapshot_id=snapshot_id))
+        if change.price_changed:
+            events.append(CatalogEvent(
+                type=PRICE_CHANGED,
+                instance_type=name,
+                snapshot_id=snapshot_id,
+                old_price=change.old_price,
+                new_price=change.new_price
+            ))
+        for region in change.added_regions:
+            events.append(CatalogEvent(type=REGION_ADDED, instance_type=name, snapshot_id=snapshot_id, region=region))
+        for region in change.removed_regions:
+            events.append(CatalogEvent(type=REGION_REMOVED, instance_type=name, snapshot_id=snapshot_id, region=region))
+    return events
+
+
+def _snapshot_id(hardware) -> Optional[int]:
+    snapshot_ids = [config.get("snapshot_id") for config in hardware]
+    snapshot_ids = [snapshot_id for snapshot_id in snapshot_ids if snapshot_id is not None]
+    return max(snapshot_ids) if snapshot_ids else None
+
+
+class _CatalogColumns:
+    """One immutable catalog snapshot: the parsed instances and their parallel columns."""
+
+    __slots__ = (
+        "snapshot_id", "instances", "index", "prices", "vcpus", "memories",
+        "gpu_models", "gpu_counts", "available", "regions", "mapping"
+    )
+
+    def __init__(self, instances: List[InstanceResource]):
+        self.instances = instances
+        self.snapshot_id = _snapshot_id(instances)
+        self.index = {instance.instance_type: i for i, instance in enumerate(instances)}
+        self.prices = [_to_price(instance.price) for instance in instances]
+        self.vcpus = [instance.vcpu or 0 for instance in instances]
+        self.memories = [instance.memory or 0 for instance in instances]
+        self.gpu_models = [_normalize_gpu_model(instance.gpu_model) for instance in instances]
+        self.gpu_counts = [instance.gpu_count or 0 for instance in instances]
+        self.available = [instance.status == "available" for instance in instances]
+        self.regions = [_to_region_list(instance.region) for instance in instances]
+        self.mapping = MappingProxyType({instance.instance_type: instance for instance in instances})
+
+
+class InstanceCatalog:
+    """Parsed, column-oriented view of the hardware catalog.
+
+    Instance resources are parsed once per load and kept as parallel columns
+    (price, vcpu, memory, gpu model, ...) so that queries over the whole
+    catalog are single passes over flat lists.
+
+    A load builds the columns of the new snapshot aside and swaps them in
+    with a single assignment, so readers on other threads (e.g. while a
+    `CatalogWatcher` refreshes it) always see one consistent snapshot.
+    """
+
+    def __init__(self, hardware: Optional[Iterable[Dict[str, Any]]] = None):
+        self._columns = _CatalogColumns([])
+        self._update_lock = threading.Lock()
+        if hardware is not None:
+            self.load(hardware)
+
+    @property
+    def snapshot_id(self) -> Optional[int]:
+        return self._columns.snapshot_id
+
+    @property
+    def instances(self) -> List[InstanceResource]:
+        return self._columns.instances
+
+    @property
+    def index(self) -> Dict[str, int]:
+        return self._columns.index
+
+    def load(self, hardware: Iterable[Dict[str, Any]]) -> 'InstanceCatalog':
+        """Replace the catalog with raw `hardware` entries from the backend."""
+        return self.load_instances([InstanceResource(config) for config in hardware])
+
+    def update(self, hardware: Iterable[Dict[str, Any]]) -> CatalogDiff:
+        """Incrementally update the catalog from raw `hardware` entries.
+
+        When the snapshot_id of `hardware` matches the loaded one, nothing is
+        parsed or re-indexed. Otherwise the catalog is rebuilt and the
+        per-instance-type differences are reported.
+
+        Returns:
+            CatalogDiff object, with `changed` False when the snapshot was unchanged.
+        """
+        hardware = list(hardware)
+        snapshot_id = _snapshot_id(hardware)
+        with self._update_lock:
+            old = self._columns
+            if snapshot_id is not None and snapshot_id == old.snapshot_id and old.instances:
+                return CatalogDiff(old_snapshot_id=old.snapshot_id, snapshot_id=snapshot_id)
+            new = _CatalogColumns([InstanceResource(config) for config in hardware])
+            self._columns = new
+
+        old_values = {instance.instance_type: (old.prices[i], instance.status, old.regions[i])
+                      for i, instance in enumerate(old.instances)}
+        diff = CatalogDiff(old_snapshot_id=old.snapshot_id, snapshot_id=new.snapshot_id, changed=True)
+        for i, instance in enumerate(new.instances):
+            name = instance.instance_type
+            if name not in old_values:
+                diff.added.append(name)
+                continue
+            old_price, old_status, old_regions = old_values.pop(name)
+            new_regions = new.regions[i]
+            added_regions = [region for region in new_regions if region not in old_regions]
+            removed_regions = [region for region in old_regions if region not in new_regions]
+            if old_price != new.prices[i] or old_status != instance.status or added_regions or removed_regions:
+                diff.changes.append(InstanceChange(
+                    instance_type=name,
+                    old_price=old_price,
+                    new_price=new.prices[i],
+                    old_status=old_status,
+                    new_status=instance.status,
+                    added_regions=added_regions,
+                    removed_regions=removed_regions,
+                ))
+        diff.removed = list(old_values)
+        return diff
+
+    def load_instances(self, instances: List[InstanceResource]) -> 'InstanceCatalog':
+        """Replace the catalog with already parsed instance resources."""
+        columns = _CatalogColumns(list(instances))
+        with self._update_lock:
+            self._columns = columns
+        return self
+
+    def __len__(self):
+        return len(self._columns.instances)
+
+    def __iter__(self):
+        return iter(self._columns.instances)
+
+    def __contains__(self, instance_type):
+        return instance_type in self._columns.index
+
+    @property
+    def expiry_time(self) -> Optional[int]:
+        expiry_times = [instance.expiry_time for instance in self._columns.instances if instance.expiry_time is not None]
+        return min(expiry_times) if expiry_times else None
+
+    def get(self, instance_type: str, default=None) -> Optional[InstanceResource]:
+        columns = self._columns
+        i = columns.index.get(instance_type)
+        return columns.instances[i] if i is not None else default
+
+    def price(self, instance_type: str) -> Optional[float]:
+        """Hourly price of an instance type, None if it is unknown or has no valid price."""
+        columns = self._columns
+        i = columns.index.get(instance_type)
+        return columns.prices[i] if i is not None else None
+
+    def regions(self, instance_type: str) -> List[str]:
+        """Regions with a machine of an instance type, empty if it is unknown."""
+        columns = self._columns
+        i = columns.index.get(instance_type)
+        return list(columns.regions[i]) if i is not None else []
+
+    def is_available(self, instance_type: str, region: str = "global") -> bool:
+        """Whether an instance type has status 'available' and, unless `region` is global, a machine in `region`."""
+        columns = self._columns
+        i = columns.index.get(instance_type)
+        if i is None or not columns.available[i]:
+            return False
+        return region.lower() == "global" or region in columns.regions[i]
+
+    def instance_mapping(self, copy: bool = False) -> Mapping[str, Union[InstanceResource, dict]]:
+        """Map instance type to its InstanceResource.
+
+        Args:
+            copy: return `to_dict()` copies, with `expiry_time` formatted, instead of
+                a read-only view of the stored objects. (Default = False)
+        """
+        columns = self._columns
+        if copy:
+            return {instance.instance_type: instance.to_dict() for instance in columns.instances}
+        return columns.mapping
+
+    def find_cheapest(
+            self,
+            min_vcpu: int = 0,
+            min_memory: float = 0,
+            gpu_models: Optional[Iterable[str]] = None,
+            min_gpu_count: int = 0,
+            regions: Optional[Iterable[str]] = None,
+            duration: float = 3600,
+            available: bool = True,
+            limit: Optional[int] = None,
+            max_gpu_count: Optional[int] = None,
+        ) -> List[InstanceQuote]:
+        """Rank feasible instance types by total cost.
+
+        Args:
+            min_vcpu: minimum number of vCPUs.
+            min_memory: minimum memory in GiB.
+            gpu_models: Optional. Accepted GPU models (case-insensitive), e.g. ['Nvidia 4090'].
+            min_gpu_count: minimum number of GPUs.
+            regions: Optional. Acceptable regions. None or 'global' accepts any region.
+            duration: duration in seconds, priced like `Orchestrator.estimate_payment`.
+            available: only consider instance types with status 'available'.
+            limit: Optional. Maximum number of quotes to return.
+            max_gpu_count: Optional. Maximum number of GPUs; 0 only accepts CPU instance types.
+
+        Returns:
+            list of InstanceQuote, cheapest first.
+        """
+        model_set = None
+        if gpu_models:
+            model_set = {_normalize_gpu_model(model) for model in gpu_models}
+        region_set = None
+        if regions:
+            region_set = set(_to_region_list(regions))
+            if any(region.lower() == "global" for region in region_set):
+                region_set = None
+        duration_hour = duration / 3600
+
+        columns = self._columns
+        feasible = [
+            i for i in range(len(columns.instances))
+            if columns.prices[i] is not None
+            and columns.vcpus[i] >= min_vcpu
+            and columns.memories[i] >= min_memory
+            and columns.gpu_counts[i] >= min_gpu_count
+            and (max_gpu_count is None or columns.gpu_counts[i] <= max_gpu_count)
+            and (model_set is None or columns.gpu_models[i] in model_set)
+            and (not available or columns.available[i])
+            and (region_set is None or not region_set.isdisjoint(columns.regions[i]))
+        ]
+        feasible.sort(key=lambda i: (columns.prices[i], columns.instances[i].instance_type))
+        if limit is not None:
+            feasible = feasible[:limit]
+
+        quotes = []
+        for i in feasible:
+            instance = columns.instances[i]
+            if region_set is None:
+                matched_regions = list(columns.regions[i])
+            else:
+                matched_regions = [region for region in columns.regions[i] if region in region_set]
+            quotes.append(InstanceQuote(
+                instance_type=instance.instance_type,
+                hardware_id=instance.hardware_id,
+                price=columns.prices[i],
+                duration=duration,
+                amount=columns.prices[i] * duration_hour,
+                vcpu=instance.vcpu,
+                memory=instance.memory,
+                gpu_model=instance.gpu_model,
+                gpu_count=instance.gpu_count,
+                regions=matched_regions,
+            ))
+        return quotes
@@ -0,0 +1,174 @@
+# ./swan/object/cost_planner.py
+
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from swan.object.catalog import InstanceCatalog, InstanceQuote
+from swan.object.cp_config import InstanceResource
+from swan.object.models import Base
+
+PlanRow = Union[Tuple, Dict]
+
+
+@dataclass
+class CostPlanRow(Base):
+    instance_type: Optional[str] = None
+    region: Optional[str] = None
+    duration: Optional[float] = None
+    replicas: int = 1
+    hardware_id: Optional[int] = None
+    price: Optional[float] = None
+    amount: Optional[float] = None
+    error: Optional[str] = None
+    alternatives: List[InstanceQuote] = field(default_factory=list)
+
+    @property
+    def savings(self) -> float:
+        """How much cheaper the cheapest alternative is than this row, 0 if none is."""
+        if self.amount is None or not self.alternatives:
+            return 0
+        return max(self.amount - self.alternatives[0].amount, 0)
+
+
+@dataclass
+class CostPlan(Base):
+    rows: List[CostPlanRow] = field(default_factory=list)
+    total: float = 0
+    allowance: Optional[float] = None
+    balance: Optional[float] = None
+
+    @property
+    def unpriced(self) -> List[int]:
+        """Indices of rows that could not be priced."""
+        return [i for i, row in enumerate(self.rows) if row.error]
+
+    @property
+    def savings(self) -> float:
+        return sum(row.savings for row in self.rows)
+
+    @property
+    def allowance_shortfall(self) -> float:
+        """SWAN to approve before the plan can be paid, 0 if the allowance is unknown or enough."""
+        return max(self.total - self.allowance, 0) if self.allowance is not None else 0
+
+    @property
+    def balance_shortfall(self) -> float:
+        return max(self.total - self.balance, 0) if self.balance is not None else 0
+
+    @property
+    def affordable(self) -> bool:
+        """Every row priced and the wallet balance covers the total."""
+        return not self.unpriced and self.balance_shortfall == 0
+
+
+def _normalize_row(row: PlanRow) -> Tuple[str, str, float, int]:
+    if isinstance(row, dict):
+        instance_type = row.get("instance_type")
+        region = row.get("region")
+        duration = row.get("duration", 3600)
+        replicas = row.get("replicas", 1)
+    else:
+        defaults = (None, None, 3600, 1)
+        instance_type, region, duration, replicas = (tuple(row) + defaults[len(row):])[:4]
+    return instance_type, region or "global", duration, replicas
+
+
+class CostPlanner:
+    """Price many (instance type, region, duration, replicas) rows against one catalog.
+
+    Rows are normalized into columns and priced in one pass over them, with
+    catalog lookups done once per distinct instance type and region. Prices
+    follow `Orchestrator.estimate_payment`: hourly price * duration / 3600,
+    times the number of replicas.
+    """
+
+    def __init__(self, catalog: InstanceCatalog):
+        self.catalog = catalog
+
+    def _check(self, instance_type: str, region: str) -> Tuple[Optional[InstanceResource], Optional[float], Optional[str]]:
+        """Instance resource and hourly price of an instance type orderable in `region`, or an error."""
+        instance = self.catalog.get(instance_type)
+        if instance is None:
+            return None, None, f"Unknown instance type {instance_type}"
+        price = self.catalog.price(instance_type)
+        if price is None:
+            return None, None, f"No price for {instance_type}"
+        if not self.catalog.is_available(instance_type):
+            return None, None, f"{instance_type} is not available"
+        if not self.catalog.is_available(instance_type, region):
+            return None, None, f"No {instance_type} machine in {region}"
+        return instance, price, None
+
+    def _alternatives(self, instance: InstanceResource, region: str, limit: int) -> List[InstanceQuote]:
+        """Instance types at least as large as `instance`, same GPU model (or CPU only), cheapest first, priced per hour."""
+        quotes = self.catalog.find_cheapest(
+            min_vcpu=instance.vcpu or 0,
+            min_memory=instance.memory or 0,
+            gpu_models=[instance.gpu_model] if instance.gpu_model else None,
+            min_gpu_count=instance.gpu_count or 0,
+            max_gpu_count=None if instance.gpu_model or instance.gpu_count else 0,
+            regions=[region],
+        )
+        return [quote for quote in quotes if quote.instance_type != instance.instance_type][:limit]
+
+    def plan(
+            self,
+            rows: Iterable[PlanRow],
+            alternatives: int = 0,
+            allowance: Optional[float] = None,
+            balance: Optional[float] = None,
+        ) -> CostPlan:
+        """
+        Price every row and the plan total.
+
+        Args:
+            rows: (instance_type, region, duration, replicas) tuples or dicts with these keys;
+                region defaults to global, duration to 3600 seconds and replicas to 1.
+            alternatives: number of alternative instance types to quote per row,
+                at least as large, with the same GPU model (CPU only for CPU rows) and in the same region. (Default = 0)
+            allowance: Optional. Approved SWAN allowance to check the total against.
+            balance: Optional. SWAN balance to check the total against.
+
+        Returns:
+            CostPlan with one CostPlanRow per row, in order. Rows that cannot be
+            priced carry an `error` and are left out of the total.
+        """
+        instance_types, regions, durations, replicas = [], [], [], []
+        for row in rows:
+            instance_type, region, duration, count = _normalize_row(row)
+            instance_types.append(instance_type)
+            regions.append(region)
+            durations.append(duration)
+            replicas.append(count)
+
+        keys = list(zip(instance_types, regions))
+        checks = {key: self._check(*key) for key in set(keys)}
+        prices = [checks[key][1] for key in keys]
+        hours = [duration * count / 3600 for duration, count in zip(durations, replicas)]
+        amounts = [price * hour if price is not None else None for price, hour in zip(prices, hours)]
+
+        quotes: Dict[Tuple[str, str], List[InstanceQuote]] = {}
+        if alternatives > 0:
+            for key, (instance, _, _) in checks.items():
+                if instance is not None:
+                    quotes[key] = self._alternatives(instance, key[1], alternatives)
+
+        plan = CostPlan(allowance=allowance, balance=balance)
+        for k, key in enumerate(keys):
+            instance, _, error = checks[key]
+            plan.rows.append(CostPlanRow(
+                instance_type=instance_types[k],
+                region=regions[k],
+                duration=durations[k],
+                replicas=replicas[k],
+                hardware_id=instance.hardware_id if instance is not None else None,
+                price=prices[k],
+                amount=amounts[k],
+                error=error,
+                alternatives=[
+                    replace(quote, duration=durations[k], amount=quote.price * hours[k])
+                    for quote in quotes.get(key, [])
+                ]
+            ))
+        plan.total = sum(amount for amount in amounts if amount is not None)
+        return plan
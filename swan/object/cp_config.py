@@ -1,10 +1,59 @@
 # ./swan/object/cp_config.py
 
 import json
+import re
 from datetime import datetime, timezone
 
+
+_VCPU_PATTERN = re.compile(r'^(\d+)\s*vCPU$', re.IGNORECASE)
+_MEMORY_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)\s*(GiB|GB|TiB|TB)$', re.IGNORECASE)
+_GPU_COUNT_PATTERN = re.compile(r'^(\d+)\s*[x\u00d7*]\s*(.+)$', re.IGNORECASE)
+
+
+def parse_hardware_description(description):
+    """Parse a hardware description into structured resource fields.
+
+    Args:
+        description: hardware description, e.g. 'CPU only · 2 vCPU · 2 GiB'
+            or '2 x Nvidia 4090 · 16 vCPU · 64 GiB'.
+
+    Returns:
+        dict with 'vcpu', 'memory' (GiB), 'gpu_model' and 'gpu_count'.
+        Fields that cannot be parsed are left as None (gpu_count as 0).
+    """
+    spec = {"vcpu": None, "memory": None, "gpu_model": None, "gpu_count": 0}
+    if not description or not isinstance(description, str):
+        return spec
+
+    for part in description.split("\u00b7"):
+        part = part.strip()
+        if not part or part.lower() == "cpu only":
+            continue
+        if match := _VCPU_PATTERN.match(part):
+            spec["vcpu"] = int(match.group(1))
+        elif match := _MEMORY_PATTERN.match(part):
+            memory = float(match.group(1))
+            if match.group(2).upper().startswith("T"):
+                memory *= 1024
+            spec["memory"] = memory
+        elif spec["gpu_model"] is None:
+            if match := _GPU_COUNT_PATTERN.match(part):
+                spec["gpu_count"] = int(match.group(1))
+                spec["gpu_model"] = match.group(2).strip()
+            else:
+                spec["gpu_count"] = 1
+                spec["gpu_model"] = part
+    return spec
+
+
+def _slots_to_dict(obj):
+    return {name: getattr(obj, name) for name in obj.__slots__}
+
+
 class HardwareConfig:
 
+    __slots__ = ("id", "name", "description", "type", "region", "price", "status")
+
     def __init__(self, config):
         self.id = config["hardware_id"]
         self.name = config["hardware_name"]
@@ -26,7 +75,7 @@ class HardwareConfig:
         }
 
     def to_json(self):
-        return json.dumps(self, default=lambda o: o.__dict__, indent=2)
+        return json.dumps(self, default=_slots_to_dict, indent=2)
     
 
     def to_instance_dict(self):
@@ -43,6 +92,11 @@ class HardwareConfig:
 
 class InstanceResource:
 
+    __slots__ = (
+        "hardware_id", "instance_type", "description", "type", "region", "price", "status",
+        "snapshot_id", "expiry_time", "ssh_ready", "vcpu", "memory", "gpu_model", "gpu_count"
+    )
+
     def __init__(self, config):
         self.hardware_id = config["hardware_id"]
         self.instance_type = config["hardware_name"]
@@ -54,6 +108,11 @@ class InstanceResource:
         self.snapshot_id = config.get("snapshot_id", None)
         self.expiry_time = config.get("expiry_time", None)
         self.ssh_ready = config.get("ssh_ready", [])
+        spec = parse_hardware_description(self.description)
+        self.vcpu = spec["vcpu"]
+        self.memory = spec["memory"]
+        self.gpu_model = spec["gpu_model"]
+        self.gpu_count = spec["gpu_count"]
     
     def to_dict(self):
         return {
@@ -66,7 +125,11 @@ class InstanceResource:
             "status": self.status,
             "snapshot_id": self.snapshot_id,
             "expiry_time": self.time_str(self.expiry_time),
-            "ssh_ready": self.ssh_ready
+            "ssh_ready": self.ssh_ready,
+            "vcpu": self.vcpu,
+            "memory": self.memory,
+            "gpu_model": self.gpu_model,
+            "gpu_count": self.gpu_count
         }
     
     def time_str(self, timestamp):
@@ -78,7 +141,7 @@ class InstanceResource:
         return timestamp
     
     def to_json(self):
-        return json.dumps(self, default=lambda o: o.__dict__, indent=2)
+        return json.dumps(self, default=_slots_to_dict, indent=2)
     
     def __str__(self) -> str:
         return str(self.to_json())
@@ -87,7 +150,11 @@ class InstanceResource:
         return f"{self.__class__.__name__}({self.to_json()})"
     
     def __getitem__(self, key):
-        return self.__dict__[key]
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
 
     def get(self, key, default=None):
-        return self.__dict__.get(key, default)
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key, default)
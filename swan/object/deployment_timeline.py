@@ -0,0 +1,173 @@
+# ./swan/object/deployment_timeline.py
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from swan.common.utils import percentile
+from swan.object.models import Base, TaskDeploymentInfo
+
+METRICS = ("time_to_payment", "time_to_cp_assignment", "time_to_running", "time_to_url")
+GROUP_KEYS = ("instance_type", "region", "cp_account_address")
+
+
+@dataclass
+class DeploymentTimeline(Base):
+    task_uuid: Optional[str] = None
+    instance_type: Optional[str] = None
+    region: Optional[str] = None
+    cp_account_address: Optional[str] = None
+    created_at: Optional[int] = None
+    time_to_payment: Optional[float] = None
+    time_to_cp_assignment: Optional[float] = None
+    time_to_running: Optional[float] = None
+    time_to_url: Optional[float] = None
+
+
+@dataclass
+class LatencyStats(Base):
+    metric: Optional[str] = None
+    group: Optional[str] = None
+    count: int = 0
+    mean: Optional[float] = None
+    percentiles: Dict[float, float] = field(default_factory=dict)
+
+
+def _elapsed(start, end) -> Optional[float]:
+    if start is None or end is None or end < start:
+        return None
+    return float(end - start)
+
+
+def _first(values) -> Optional[int]:
+    values = [value for value in values if value]
+    return min(values) if values else None
+
+
+def _url_updated_at(task_info: TaskDeploymentInfo) -> Optional[int]:
+    """Earliest `updated_at` of a job with a `job_real_uri`, skipping jobs updated after they or the task ended."""
+    end_at = task_info.task.end_at
+    updated_at = [
+        job.updated_at for job in task_info.jobs or []
+        if job.job_real_uri and job.updated_at
+        and not (job.ended_at and job.updated_at >= job.ended_at)
+        and not (end_at and job.updated_at >= end_at)
+    ]
+    return min(updated_at) if updated_at else None
+
+
+def deployment_timeline(task_info: TaskDeploymentInfo, url_ready_at: Optional[int] = None) -> DeploymentTimeline:
+    """Seconds from task creation to payment, CP assignment, first running job and first reachable URL.
+
+    Payment is the earliest config order `started_at`, CP assignment the
+    earliest job `created_at` and running the earliest job `start_at` (or the
+    task's `start_at`). Unknown or inconsistent steps are None.
+
+    The backend does not report when a URL became reachable. Pass `url_ready_at`
+    when it was observed, e.g. the time `Orchestrator.wait_for_task` returned.
+    Otherwise `time_to_url` falls back to the `updated_at` of the earliest job
+    with a `job_real_uri`. That value is only an upper bound, because any later
+    update of the job moves it. Jobs updated after they or the task ended are
+    ignored.
+    """
+    task = task_info.task
+    task_detail = task.task_detail
+    jobs = task_info.jobs or []
+    created_at = task.created_at
+
+    requirements = task_detail.requirements if task_detail else None
+    region = requirements.get("region") if isinstance(requirements, dict) else getattr(requirements, "region", None)
+    cp_account_address = next((job.cp_account_address for job in jobs if job.cp_account_address), None)
+
+    return DeploymentTimeline(
+        task_uuid=task.uuid,
+        instance_type=task_detail.hardware if task_detail else None,
+        region=region,
+        cp_account_address=cp_account_address,
+        created_at=created_at,
+        time_to_payment=_elapsed(created_at, _first(order.started_at for order in task_info.config_orders or [])),
+        time_to_cp_assignment=_elapsed(created_at, _first(job.created_at for job in jobs)),
+        time_to_running=_elapsed(created_at, _first(job.start_at for job in jobs) or task.start_at),
+        time_to_url=_elapsed(created_at, url_ready_at if url_ready_at is not None else _url_updated_at(task_info)),
+    )
+
+
+class DeploymentAnalytics:
+    """Latency percentiles of deployment timelines, grouped by instance type, region or CP.
+
+    Timelines are stored column-wise: one list per group key and per metric,
+    so an aggregation walks each column once.
+    """
+
+    def __init__(self, task_infos: Optional[Iterable[TaskDeploymentInfo]] = None):
+        self._columns: Dict[str, list] = {name: [] for name in GROUP_KEYS + METRICS + ("task_uuid",)}
+        if task_infos is not None:
+            self.extend(task_infos)
+
+    def __len__(self):
+        return len(self._columns["task_uuid"])
+
+    def add(self, task_info: TaskDeploymentInfo, url_ready_at: Optional[int] = None) -> DeploymentTimeline:
+        """Add the timeline of one deployment; see `deployment_timeline` for `url_ready_at`."""
+        timeline = deployment_timeline(task_info, url_ready_at)
+        for name, column in self._columns.items():
+            column.append(getattr(timeline, name))
+        return timeline
+
+    def extend(self, task_infos: Iterable[TaskDeploymentInfo]):
+        for task_info in task_infos:
+            self.add(task_info)
+
+    def timelines(self) -> List[DeploymentTimeline]:
+        names = list(self._columns)
+        return [DeploymentTimeline(**dict(zip(names, row))) for row in zip(*self._columns.values())]
+
+    def stats(
+            self,
+            metric: str = "time_to_url",
+            by: Optional[str] = None,
+            qs: Sequence[float] = (50, 90, 99),
+        ) -> List[LatencyStats]:
+        """
+        Aggregate one metric, overall or per group.
+
+        Args:
+            metric: one of METRICS. (Default = `time_to_url`)
+            by: Optional. One of GROUP_KEYS; None aggregates all tasks.
+            qs: percentiles to compute, in [0, 100].
+
+        Returns:
+            list of LatencyStats, one per group with at least one value.
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric}, expected one of {METRICS}")
+        if by is not None and by not in GROUP_KEYS:
+            raise ValueError(f"Unknown group {by}, expected one of {GROUP_KEYS}")
+
+        values = self._columns[metric]
+        groups = self._columns[by] if by else [None] * len(values)
+        grouped: Dict[Optional[str], List[float]] = {}
+        for group, value in zip(groups, values):
+            if value is not None:
+                grouped.setdefault(group, []).append(value)
+
+        return [
+            LatencyStats(
+                metric=metric,
+                group=group,
+                count=len(group_values),
+                mean=sum(group_values) / len(group_values),
+                percentiles={q: percentile(group_values, q) for q in qs}
+            )
+            for group, group_values in grouped.items()
+        ]
+
+    def fastest(
+            self,
+            by: str,
+            metric: str = "time_to_url",
+            q: float = 50,
+            min_count: int = 1,
+        ) -> List[LatencyStats]:
+        """Groups ordered by their `q`-th percentile of `metric`, fastest first."""
+        stats = [stat for stat in self.stats(metric, by=by, qs=(q,)) if stat.count >= min_count]
+        return sorted(stats, key=lambda stat: stat.percentiles[q])
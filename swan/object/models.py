@@ -2,6 +2,8 @@
 from dataclasses import dataclass, field, asdict
 from typing import Optional, Any, Dict, List
 
+from swan.common.constant import CONFIG_ORDER_FAILED_STATUSES, CONFIG_ORDER_PENDING_STATUSES
+
 
 
 @dataclass
@@ -136,6 +138,14 @@ class ConfigOrder(Base):
     updated_at: Optional[int] = None
     uuid: Optional[str] = None
 
+    @property
+    def failed(self) -> bool:
+        return bool(self.error_code) or self.status in CONFIG_ORDER_FAILED_STATUSES
+
+    @property
+    def pending(self) -> bool:
+        return not self.failed and (not self.status or self.status in CONFIG_ORDER_PENDING_STATUSES)
+
 @dataclass
 class TaskCreationResult(Base):
     task: Task = field(default_factory=Task)
@@ -331,7 +341,9 @@ class TaskRenewalResult(Base):
                 task=task,
                 config_order=config_order,
                 task_uuid=result.get('task_uuid'),
+                tx_hash_approve=result.get('tx_hash_approve'),
                 tx_hash=result.get('tx_hash'),
+                price=result.get('price'),
                 status=result.get('status'),
                 message=result.get('message')
             )
@@ -362,4 +374,18 @@ class TaskTerminationMessage(Base):
 class PaymentResult(Base):
     tx_hash_approve: Optional[str] = None
     tx_hash: Optional[str] = None
-    amount: Optional[float] = None
\ No newline at end of file
+    amount: Optional[float] = None
+
+
+@dataclass
+class BatchResult(Base):
+    results: Optional[List[Any]] = field(default_factory=list)
+    errors: Optional[List[Optional[str]]] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> List[Any]:
+        return [result for result, error in zip(self.results, self.errors) if result is not None and error is None]
+
+    @property
+    def failed(self) -> List[int]:
+        return [i for i, error in enumerate(self.errors) if error is not None]
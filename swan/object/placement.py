@@ -0,0 +1,185 @@
+# ./swan/object/placement.py
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from swan.object.models import Base, CPAccount, TaskDeploymentInfo
+
+EARTH_RADIUS_KM = 6371.0088
+
+_FAILED_JOB_STATUSES = ("failed", "error")
+
+
+def great_circle_km(lats: Sequence[float], lons: Sequence[float], lat: float, lon: float) -> List[float]:
+    """Haversine distance in km from (`lat`, `lon`) to every point of the `lats`/`lons` columns."""
+    lat_r = math.radians(lat)
+    lon_r = math.radians(lon)
+    cos_lat = math.cos(lat_r)
+    distances = []
+    for point_lat, point_lon in zip(lats, lons):
+        point_lat_r = math.radians(point_lat)
+        h = (math.sin((point_lat_r - lat_r) / 2) ** 2
+             + cos_lat * math.cos(point_lat_r) * math.sin((math.radians(point_lon) - lon_r) / 2) ** 2)
+        distances.append(2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h))))
+    return distances
+
+
+@dataclass
+class CPCandidate(Base):
+    cp_account_address: Optional[str] = None
+    name: Optional[str] = None
+    region: Optional[str] = None
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+    distance_km: Optional[float] = None
+    successes: int = 0
+    failures: int = 0
+    success_rate: Optional[float] = None
+    score: Optional[float] = None
+
+
+class CPPlacement:
+    """Rank computing providers by distance to clients and observed deployment success.
+
+    CP coordinates are kept in columns so a ranking computes all distances in
+    one pass. The score of a CP is its great-circle distance (km) to the
+    nearest client location plus `failure_penalty_km` times its smoothed
+    failure rate, so a nearby but unreliable CP can lose to a farther one.
+    """
+
+    def __init__(self, failure_penalty_km: float = 2000):
+        """
+        Args:
+            failure_penalty_km: distance added for a CP that always fails. (Default = 2000)
+        """
+        self.failure_penalty_km = failure_penalty_km
+        self.providers: Dict[str, CPAccount] = {}
+        self._index: Dict[str, int] = {}
+        self._addresses: List[str] = []
+        self._lats: List[Optional[float]] = []
+        self._lons: List[Optional[float]] = []
+        self._successes: Dict[str, int] = {}
+        self._failures: Dict[str, int] = {}
+
+    @classmethod
+    def from_tasks(cls, task_infos: Iterable[TaskDeploymentInfo], **kwargs) -> 'CPPlacement':
+        """Build a placement from past deployments, e.g. `TaskStore.query()` or `get_all_tasks`."""
+        placement = cls(**kwargs)
+        for task_info in task_infos:
+            placement.observe(task_info)
+        return placement
+
+    def __len__(self):
+        return len(self._addresses)
+
+    def add_providers(self, providers: Iterable[CPAccount]):
+        """Add or update CPs; the latest coordinates of an address win."""
+        for cp in providers:
+            address = cp.cp_account_address
+            if not address:
+                continue
+            lat, lon = _to_float(cp.lat), _to_float(cp.lon)
+            if address in self._index:
+                i = self._index[address]
+                self._lats[i], self._lons[i] = lat, lon
+            else:
+                self._index[address] = len(self._addresses)
+                self._addresses.append(address)
+                self._lats.append(lat)
+                self._lons.append(lon)
+            self.providers[address] = cp
+
+    def record(self, cp_account_address: str, success: bool):
+        counts = self._successes if success else self._failures
+        counts[cp_account_address] = counts.get(cp_account_address, 0) + 1
+
+    def observe(self, task_info: TaskDeploymentInfo):
+        """Add a deployment's CPs and record, per job, whether it came up (has a `job_real_uri`) or failed."""
+        self.add_providers(task_info.computing_providers or [])
+        for job in task_info.jobs or []:
+            if not job.cp_account_address:
+                continue
+            if job.job_real_uri:
+                self.record(job.cp_account_address, True)
+            elif job.status and job.status.lower() in _FAILED_JOB_STATUSES:
+                self.record(job.cp_account_address, False)
+
+    def success_rate(self, cp_account_address: str) -> float:
+        """Observed success rate with one prior success and one prior failure."""
+        successes = self._successes.get(cp_account_address, 0)
+        failures = self._failures.get(cp_account_address, 0)
+        return (successes + 1) / (successes + failures + 2)
+
+    def rank(
+            self,
+            locations: Iterable[Tuple[float, float]],
+            regions: Optional[Iterable[str]] = None,
+            limit: Optional[int] = None,
+        ) -> List[CPCandidate]:
+        """
+        Rank CPs for clients at `locations`.
+
+        Args:
+            locations: (lat, lon) of one or more client locations; each CP is scored by its nearest one.
+            regions: Optional. Only consider CPs in these regions.
+            limit: Optional. Maximum number of candidates returned.
+
+        Returns:
+            list of CPCandidate, best first. CPs without coordinates come last.
+        """
+        locations = list(locations)
+        if not locations:
+            raise ValueError("At least one client location is required")
+        regions = set(regions) if regions else None
+
+        indices = [i for i, address in enumerate(self._addresses)
+                   if regions is None or self.providers[address].region in regions]
+        located = [i for i in indices if self._lats[i] is not None and self._lons[i] is not None]
+        lats = [self._lats[i] for i in located]
+        lons = [self._lons[i] for i in located]
+        nearest = [math.inf] * len(located)
+        for lat, lon in locations:
+            nearest = list(map(min, nearest, great_circle_km(lats, lons, lat, lon)))
+        distances = dict(zip(located, nearest))
+
+        candidates = []
+        for i in indices:
+            address = self._addresses[i]
+            cp = self.providers[address]
+            rate = self.success_rate(address)
+            distance = distances.get(i)
+            candidates.append(CPCandidate(
+                cp_account_address=address,
+                name=cp.name,
+                region=cp.region,
+                lat=self._lats[i],
+                lon=self._lons[i],
+                distance_km=distance,
+                successes=self._successes.get(address, 0),
+                failures=self._failures.get(address, 0),
+                success_rate=rate,
+                score=distance + self.failure_penalty_km * (1 - rate) if distance is not None else math.inf
+            ))
+        candidates.sort(key=lambda candidate: candidate.score)
+        return candidates[:limit] if limit else candidates
+
+    def preferred_cp_list(
+            self,
+            locations: Iterable[Tuple[float, float]],
+            limit: int = 3,
+            regions: Optional[Iterable[str]] = None,
+        ) -> List[str]:
+        """CP account addresses of the best `limit` candidates, for `create_task(preferred_cp_list=...)`.
+
+        CPs without coordinates are left out, so the list may be shorter than `limit` or empty.
+        """
+        candidates = [candidate for candidate in self.rank(locations, regions=regions) if candidate.distance_km is not None]
+        return [candidate.cp_account_address for candidate in candidates[:limit]]
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,172 @@
+# ./swan/object/price_history.py
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from swan.common.utils import percentile
+from swan.object.catalog import _to_price, _to_region_list
+from swan.object.cp_config import InstanceResource
+from swan.object.models import Base
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS instance_prices (
+    snapshot_id INTEGER NOT NULL,
+    recorded_at INTEGER NOT NULL,
+    instance_type TEXT NOT NULL,
+    hardware_id INTEGER,
+    price REAL,
+    status TEXT,
+    PRIMARY KEY (snapshot_id, instance_type)
+);
+CREATE TABLE IF NOT EXISTS instance_regions (
+    snapshot_id INTEGER NOT NULL,
+    instance_type TEXT NOT NULL,
+    region TEXT NOT NULL,
+    PRIMARY KEY (snapshot_id, instance_type, region)
+);
+CREATE INDEX IF NOT EXISTS idx_instance_prices_type_time ON instance_prices (instance_type, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_instance_regions_region ON instance_regions (region, instance_type);
+"""
+
+
+@dataclass
+class PricePoint(Base):
+    snapshot_id: Optional[int] = None
+    recorded_at: Optional[int] = None
+    instance_type: Optional[str] = None
+    price: Optional[float] = None
+    status: Optional[str] = None
+
+
+@dataclass
+class PriceStats(Base):
+    instance_type: Optional[str] = None
+    region: Optional[str] = None
+    count: int = 0
+    min: Optional[float] = None
+    max: Optional[float] = None
+    avg: Optional[float] = None
+
+
+class PriceHistory:
+    """Append-only SQLite store of instance prices and statuses per catalog snapshot.
+
+    Each snapshot is written once; recording the same snapshot_id again is a
+    no-op. Prices are stored per instance type, regions in a side table so that
+    region filters do not multiply price rows.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Args:
+            path: SQLite database file. (Default: in-memory)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def record(self, instances: Iterable[InstanceResource], recorded_at: Optional[int] = None) -> int:
+        """Record a catalog snapshot.
+
+        Args:
+            instances: InstanceResource objects (or an InstanceCatalog) from one fetch.
+            recorded_at: Optional. Unix time of the fetch. (Default: now)
+
+        Returns:
+            number of new price rows written.
+        """
+        recorded_at = int(recorded_at if recorded_at is not None else time.time())
+        price_rows = []
+        region_rows = []
+        for instance in instances:
+            snapshot_id = instance.snapshot_id if instance.snapshot_id is not None else recorded_at
+            price_rows.append((
+                snapshot_id, recorded_at, instance.instance_type,
+                instance.hardware_id, _to_price(instance.price), instance.status
+            ))
+            for region in _to_region_list(instance.region):
+                region_rows.append((snapshot_id, instance.instance_type, region))
+
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO instance_prices VALUES (?, ?, ?, ?, ?, ?)", price_rows
+            )
+            written = self._conn.total_changes - before
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO instance_regions VALUES (?, ?, ?)", region_rows
+            )
+        return written
+
+    def _query(self, columns, instance_type, region, start, end, available_only):
+        sql = f"SELECT {columns} FROM instance_prices p"
+        clauses = ["p.instance_type = ?", "p.price IS NOT NULL"]
+        params = [instance_type]
+        if region:
+            sql += " JOIN instance_regions r ON r.snapshot_id = p.snapshot_id AND r.instance_type = p.instance_type"
+            clauses.append("r.region = ?")
+            params.append(region)
+        if start is not None:
+            clauses.append("p.recorded_at >= ?")
+            params.append(int(start))
+        if end is not None:
+            clauses.append("p.recorded_at <= ?")
+            params.append(int(end))
+        if available_only:
+            clauses.append("p.status = 'available'")
+        sql += " WHERE " + " AND ".join(clauses)
+        with self._lock:
+            return self._conn.execute(sql + " ORDER BY p.recorded_at", params).fetchall()
+
+    def history(
+            self,
+            instance_type: str,
+            region: Optional[str] = None,
+            start: Optional[int] = None,
+            end: Optional[int] = None,
+            available_only: bool = False,
+        ) -> List[PricePoint]:
+        """Recorded prices of `instance_type` (offered in `region`, if given) between `start` and `end`."""
+        rows = self._query(
+            "p.snapshot_id, p.recorded_at, p.instance_type, p.price, p.status",
+            instance_type, region, start, end, available_only
+        )
+        return [PricePoint(*row) for row in rows]
+
+    def price_stats(
+            self,
+            instance_type: str,
+            region: Optional[str] = None,
+            start: Optional[int] = None,
+            end: Optional[int] = None,
+            available_only: bool = False,
+        ) -> PriceStats:
+        """Min, max and average price over a time window."""
+        rows = self._query(
+            "COUNT(p.price), MIN(p.price), MAX(p.price), AVG(p.price)",
+            instance_type, region, start, end, available_only
+        )
+        count, low, high, avg = rows[0] if rows else (0, None, None, None)
+        return PriceStats(instance_type=instance_type, region=region, count=count, min=low, max=high, avg=avg)
+
+    def price_percentile(
+            self,
+            instance_type: str,
+            q: float,
+            region: Optional[str] = None,
+            start: Optional[int] = None,
+            end: Optional[int] = None,
+            available_only: bool = False,
+        ) -> Optional[float]:
+        """`q`-th percentile (0-100) of recorded prices over a time window."""
+        rows = self._query("p.price", instance_type, region, start, end, available_only)
+        return percentile([row[0] for row in rows], q)
@@ -0,0 +1,301 @@
+# ./swan/object/task_store.py
+
+import json
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from swan.object.models import ConfigOrder, CPAccount, Job, TaskDeploymentInfo, TaskInfo, dict_to_dataclass
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    uuid TEXT PRIMARY KEY,
+    wallet_address TEXT,
+    status TEXT,
+    hardware TEXT,
+    region TEXT,
+    created_at INTEGER,
+    updated_at INTEGER,
+    start_at INTEGER,
+    end_at INTEGER,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    uuid TEXT NOT NULL,
+    task_uuid TEXT NOT NULL,
+    cp_account_address TEXT,
+    status TEXT,
+    hardware TEXT,
+    created_at INTEGER,
+    updated_at INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (task_uuid, uuid)
+);
+CREATE TABLE IF NOT EXISTS config_orders (
+    uuid TEXT NOT NULL,
+    task_uuid TEXT NOT NULL,
+    status TEXT,
+    order_type TEXT,
+    tx_hash TEXT,
+    created_at INTEGER,
+    updated_at INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (task_uuid, uuid)
+);
+CREATE TABLE IF NOT EXISTS computing_providers (
+    cp_account_address TEXT PRIMARY KEY,
+    name TEXT,
+    region TEXT,
+    updated_at INTEGER,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS task_computing_providers (
+    task_uuid TEXT NOT NULL,
+    cp_account_address TEXT NOT NULL,
+    PRIMARY KEY (task_uuid, cp_account_address)
+);
+CREATE TABLE IF NOT EXISTS task_owners (
+    task_uuid TEXT PRIMARY KEY,
+    owner TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_wallet_status ON tasks (wallet_address, status);
+CREATE INDEX IF NOT EXISTS idx_tasks_hardware ON tasks (hardware);
+CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_cp ON jobs (cp_account_address);
+CREATE INDEX IF NOT EXISTS idx_config_orders_tx_hash ON config_orders (tx_hash);
+CREATE INDEX IF NOT EXISTS idx_task_cps_cp ON task_computing_providers (cp_account_address);
+CREATE INDEX IF NOT EXISTS idx_task_owners_owner ON task_owners (owner);
+"""
+
+
+def _region(task) -> Optional[str]:
+    requirements = task.task_detail.requirements if task.task_detail else None
+    if isinstance(requirements, dict):
+        return requirements.get("region")
+    return requirements.region if requirements else None
+
+
+def _row_key(row, index: int) -> str:
+    """Key of a job or config order within its task: uuid, else id, else its position in the task."""
+    if row.uuid:
+        return row.uuid
+    return str(row.id) if row.id is not None else f"#{index}"
+
+
+class TaskStore:
+    """Local SQLite copy of a wallet's tasks with their jobs, config orders and CPs.
+
+    Tasks are written whole (the full `TaskDeploymentInfo`) and keyed by uuid;
+    their `updated_at` is kept so `Orchestrator.sync_task_store` only
+    re-fetches tasks that changed since the last sync.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Args:
+            path: SQLite database file. (Default: in-memory)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def versions(self, wallet_address: Optional[str] = None) -> Dict[str, Optional[int]]:
+        """`updated_at` of every stored task (of `wallet_address`, if given), keyed by uuid."""
+        sql = "SELECT uuid, updated_at FROM tasks"
+        params = []
+        if wallet_address:
+            sql += " WHERE wallet_address = ?"
+            params.append(wallet_address)
+        with self._lock:
+            return dict(self._conn.execute(sql, params).fetchall())
+
+    def save(self, task_info: TaskDeploymentInfo, wallet_address: Optional[str] = None):
+        """Insert or replace a task together with its jobs, config orders and CPs."""
+        task = task_info.task
+        if not task.uuid:
+            raise ValueError("Cannot store a task without uuid")
+        data = {
+            "task": task.to_dict(),
+            "jobs": [job.to_dict() for job in task_info.jobs],
+            "config_orders": [config_order.to_dict() for config_order in task_info.config_orders],
+            "computing_providers": [cp.to_dict() for cp in task_info.computing_providers],
+        }
+        task_detail = task.task_detail
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    task.uuid, wallet_address or task.refund_wallet, task.status,
+                    task_detail.hardware if task_detail else None, _region(task),
+                    task.created_at, task.updated_at, task.start_at, task.end_at, json.dumps(data)
+                )
+            )
+            for table in ("jobs", "config_orders", "task_computing_providers"):
+                self._conn.execute(f"DELETE FROM {table} WHERE task_uuid = ?", (task.uuid,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        _row_key(job, index), task.uuid, job.cp_account_address, job.status,
+                        job.hardware, job.created_at, job.updated_at, json.dumps(job_data)
+                    )
+                    for index, (job, job_data) in enumerate(zip(task_info.jobs, data["jobs"]))
+                ]
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO config_orders VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        _row_key(order, index), task.uuid, order.status, order.order_type,
+                        order.tx_hash, order.created_at, order.updated_at, json.dumps(order_data)
+                    )
+                    for index, (order, order_data) in enumerate(zip(task_info.config_orders, data["config_orders"]))
+                ]
+            )
+            for cp, cp_data in zip(task_info.computing_providers, data["computing_providers"]):
+                if not cp.cp_account_address:
+                    continue
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO computing_providers VALUES (?, ?, ?, ?, ?)",
+                    (cp.cp_account_address, cp.name, cp.region, cp.updated_at, json.dumps(cp_data))
+                )
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO task_computing_providers VALUES (?, ?)",
+                    (task.uuid, cp.cp_account_address)
+                )
+
+    def delete(self, task_uuid: str):
+        with self._lock, self._conn:
+            for table in ("jobs", "config_orders", "task_computing_providers", "task_owners"):
+                self._conn.execute(f"DELETE FROM {table} WHERE task_uuid = ?", (task_uuid,))
+            self._conn.execute("DELETE FROM tasks WHERE uuid = ?", (task_uuid,))
+
+    def set_owner(self, task_uuids: Iterable[str], owner: str):
+        """Tag tasks as owned by `owner`, e.g. the replica set that created them."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO task_owners VALUES (?, ?)",
+                [(task_uuid, owner) for task_uuid in task_uuids]
+            )
+
+    def release(self, task_uuids: Iterable[str]):
+        """Remove the owner tag of tasks."""
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM task_owners WHERE task_uuid = ?", [(task_uuid,) for task_uuid in task_uuids])
+
+    def owners(self, owner: Optional[str] = None) -> Dict[str, str]:
+        """Owner of every tagged task (owned by `owner`, if given), keyed by task uuid."""
+        sql = "SELECT task_uuid, owner FROM task_owners"
+        params = []
+        if owner:
+            sql += " WHERE owner = ?"
+            params.append(owner)
+        with self._lock:
+            return dict(self._conn.execute(sql, params).fetchall())
+
+    @staticmethod
+    def _load_task(data: str) -> TaskDeploymentInfo:
+        task_info = TaskInfo(json.loads(data))
+        return TaskDeploymentInfo(
+            task=task_info.task,
+            computing_providers=task_info.computing_providers,
+            config_orders=task_info.config_orders,
+            jobs=task_info.jobs,
+        )
+
+    def get(self, task_uuid: str) -> Optional[TaskDeploymentInfo]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM tasks WHERE uuid = ?", (task_uuid,)).fetchone()
+        return self._load_task(row[0]) if row else None
+
+    def query(
+            self,
+            wallet_address: Optional[str] = None,
+            status: Optional[str] = None,
+            hardware: Optional[str] = None,
+            region: Optional[str] = None,
+            cp_account_address: Optional[str] = None,
+            start: Optional[int] = None,
+            end: Optional[int] = None,
+            limit: Optional[int] = None,
+        ) -> List[TaskDeploymentInfo]:
+        """Stored tasks matching every given filter, newest first.
+
+        Args:
+            wallet_address: Optional. Owner wallet.
+            status: Optional. Task status.
+            hardware: Optional. Instance type, e.g. `C1ae.small`.
+            region: Optional. Requested region.
+            cp_account_address: Optional. CP the task was deployed to.
+            start: Optional. Minimum `created_at` (unix time).
+            end: Optional. Maximum `created_at` (unix time).
+            limit: Optional. Maximum number of tasks returned.
+
+        Returns:
+            list of TaskDeploymentInfo.
+        """
+        sql = "SELECT t.data FROM tasks t"
+        clauses = []
+        params = []
+        if cp_account_address:
+            sql += " JOIN task_computing_providers c ON c.task_uuid = t.uuid"
+            clauses.append("c.cp_account_address = ?")
+            params.append(cp_account_address)
+        for column, value in (("wallet_address", wallet_address), ("status", status),
+                              ("hardware", hardware), ("region", region)):
+            if value:
+                clauses.append(f"t.{column} = ?")
+                params.append(value)
+        if start is not None:
+            clauses.append("t.created_at >= ?")
+            params.append(int(start))
+        if end is not None:
+            clauses.append("t.created_at <= ?")
+            params.append(int(end))
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY t.created_at DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._load_task(row[0]) for row in rows]
+
+    def jobs(
+            self,
+            task_uuid: Optional[str] = None,
+            cp_account_address: Optional[str] = None,
+            status: Optional[str] = None,
+        ) -> List[Job]:
+        """Stored jobs matching every given filter."""
+        return self._load_rows("jobs", Job, task_uuid=task_uuid, cp_account_address=cp_account_address, status=status)
+
+    def config_orders(
+            self,
+            task_uuid: Optional[str] = None,
+            status: Optional[str] = None,
+            tx_hash: Optional[str] = None,
+        ) -> List[ConfigOrder]:
+        """Stored config orders matching every given filter."""
+        return self._load_rows("config_orders", ConfigOrder, task_uuid=task_uuid, status=status, tx_hash=tx_hash)
+
+    def computing_providers(self, region: Optional[str] = None) -> List[CPAccount]:
+        """Every CP seen in a stored task."""
+        return self._load_rows("computing_providers", CPAccount, region=region)
+
+    def _load_rows(self, table, data_class, **filters) -> list:
+        sql = f"SELECT data FROM {table}"
+        clauses = [f"{column} = ?" for column, value in filters.items() if value]
+        params = [value for value in filters.values() if value]
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        with self._lock:
+            rows = self._conn.execute(sql + " ORDER BY rowid", params).fetchall()
+        return [dict_to_dataclass(data_class, json.loads(row[0])) for row in rows]
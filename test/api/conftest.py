@@ -0,0 +1,71 @@
+# conftest.py
+import pytest
+from unittest.mock import patch
+
+from swan.api.orchestrator import Orchestrator
+
+
+class FakeClock:
+    """Stand-in for the `time` module whose `sleep` advances `now` instead of blocking."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """FakeClock patched in as the `time` module of the orchestrator and the endpoint balancer."""
+    clock = FakeClock()
+    with patch("swan.api.orchestrator.time", clock), patch("swan.api.endpoint_balancer.time", clock):
+        yield clock
+
+
+@pytest.fixture
+def hardware_response():
+    return {
+        "data": {
+            "hardware": [
+                {
+                    "hardware_id": 0,
+                    "hardware_name": "C1ae.small",
+                    "hardware_description": "CPU only · 2 vCPU · 2 GiB",
+                    "hardware_type": "CPU",
+                    "region": ["Quebec-CA", "Tokyo-JP"],
+                    "hardware_price": "0.5",
+                    "hardware_status": "available",
+                    "snapshot_id": 1732047600,
+                    "expiry_time": 1732048445,
+                },
+                {
+                    "hardware_id": 12,
+                    "hardware_name": "G1ae.medium",
+                    "hardware_description": "Nvidia 3080 · 8 vCPU · 32 GiB",
+                    "hardware_type": "GPU",
+                    "region": ["Quebec-CA"],
+                    "hardware_price": "3.5",
+                    "hardware_status": "available",
+                    "snapshot_id": 1732047600,
+                    "expiry_time": 1732048445,
+                },
+            ]
+        },
+        "status": "success",
+    }
+
+
+@pytest.fixture
+def orchestrator(hardware_response):
+    """Orchestrator that is not logged in, with its hardware catalog loaded from `hardware_response`."""
+    with patch.object(Orchestrator, "_request_without_params", return_value=hardware_response):
+        orchestrator = Orchestrator(api_key="dummy", login=False, url_endpoint="https://orchestrator.test")
+    orchestrator.token = "token"
+    orchestrator.contract_info = {"rpc_url": "https://rpc.test"}
+    return orchestrator
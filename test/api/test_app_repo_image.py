@@ -0,0 +1,45 @@
+""" Test app repo image lookup """
+
+from unittest.mock import patch
+
+
+def test_app_repo_image_resolved_from_cached_mapping(orchestrator):
+    mapping = {"status": "success", "data": {"hello_world": "https://github.com/swan/hello_world", "Llama3": {"url": "https://github.com/swan/llama3"}}}
+    with patch.object(orchestrator, "_request_without_params", return_value=mapping) as mock_get, \
+            patch.object(orchestrator, "_request_with_params") as mock_get_name:
+        assert orchestrator.get_app_repo_image("hello_world") == {
+            "status": "success", "data": {"name": "hello_world", "url": "https://github.com/swan/hello_world"}
+        }
+        assert orchestrator._resolve_app_repo_image("Llama3") == "https://github.com/swan/llama3"
+        assert mock_get.call_count == 1
+        mock_get_name.assert_not_called()
+
+        orchestrator.refresh_app_repo_images()
+        assert mock_get.call_count == 2
+
+
+def test_app_repo_image_case_insensitive_is_opt_in(orchestrator):
+    mapping = {"status": "success", "data": {"Llama3": {"url": "https://github.com/swan/llama3"}}}
+    by_name = {"status": "success", "message": "", "data": {"url": "https://github.com/swan/llama3-lower"}}
+    with patch.object(orchestrator, "_request_without_params", return_value=mapping), \
+            patch.object(orchestrator, "_request_with_params", return_value=by_name) as mock_get_name:
+        response = orchestrator.get_app_repo_image("llama3", case_insensitive=True)
+        assert response["data"] == {"name": "Llama3", "url": "https://github.com/swan/llama3"}
+        mock_get_name.assert_not_called()
+
+        # by default the name is matched exactly, like the backend does
+        assert orchestrator.get_app_repo_image("llama3") == by_name
+        assert mock_get_name.call_count == 1
+
+
+def test_app_repo_image_fallback_per_name(orchestrator):
+    mapping = {"status": "success", "data": [{"name": "hello_world", "url": "https://github.com/swan/hello_world"}]}
+    by_name = {"status": "success", "message": "ok", "data": {"url": "https://github.com/swan/other", "id": 7}}
+    with patch.object(orchestrator, "_request_without_params", return_value=mapping) as mock_get, \
+            patch.object(orchestrator, "_request_with_params", return_value=by_name) as mock_get_name:
+        assert orchestrator.get_app_repo_image("hello_world")["data"]["url"] == "https://github.com/swan/hello_world"
+        assert orchestrator.get_app_repo_image("other") == by_name
+        # the cached backend response is returned as is
+        assert orchestrator.get_app_repo_image("other") == by_name
+        assert mock_get.call_count == 1
+        assert mock_get_name.call_count == 1
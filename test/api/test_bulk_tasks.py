@@ -0,0 +1,94 @@
+""" Test bulk termination and renewal """
+
+from unittest.mock import MagicMock, patch
+
+from swan.object import TaskDetail, TaskTerminationMessage
+
+
+def test_terminate_tasks_reports_per_task(orchestrator):
+    def terminate_task(task_uuid):
+        if task_uuid == "t2":
+            return None
+        status = "failed" if task_uuid == "t3" else "success"
+        return TaskTerminationMessage(status=status, message=f"{task_uuid} {status}")
+
+    with patch.object(orchestrator, "terminate_task", side_effect=terminate_task):
+        batch = orchestrator.terminate_tasks(["t1", "t2", "t3"])
+
+    assert batch.results[0].status == "success"
+    assert batch.errors == [None, "Failed to terminate task t2", "t3 failed"]
+    assert batch.failed == [1, 2]
+
+
+def make_contract():
+    contract = MagicMock()
+    contract.to_wei.side_effect = lambda value: int(value * 10 ** 18)
+    contract.from_wei.side_effect = lambda value: value / 10 ** 18
+    contract.get_allowance.return_value = 0
+    contract.approve_payment.return_value = "0xapprove"
+    contract.get_nonce.return_value = 7
+    contract.send_renew_payment.side_effect = lambda task_uuid, **kwargs: f"0xpay-{task_uuid}"
+    return contract
+
+
+def test_renew_tasks_single_approval_and_pipelined_payments(orchestrator, hardware_response):
+    details = {
+        "t1": TaskDetail(hardware="C1ae.small", price_per_hour="0.5"),
+        "t2": TaskDetail(hardware="G1ae.medium", price_per_hour="3.5"),
+        "t3": None,
+    }
+    contract = make_contract()
+    renewals = []
+
+    def request_with_params(method, path, url, params, token, files):
+        renewals.append(params)
+        return {"data": {}, "status": "success"}
+
+    with patch.object(orchestrator, "_request_without_params", return_value=hardware_response), \
+            patch.object(orchestrator, "_request_with_params", side_effect=request_with_params), \
+            patch.object(orchestrator, "get_task_detail", side_effect=details.get) as get_task_detail, \
+            patch("swan.api.orchestrator.SwanContract", return_value=contract):
+        batch = orchestrator.renew_tasks(["t1", "t2", "t3"], duration=7200, private_key="0xkey")
+
+    assert get_task_detail.call_count == 3
+    # one approval for the total: (0.5 + 3.5) * 2 hours
+    contract.approve_payment.assert_called_once_with(8 * 10 ** 18)
+    nonces = [call.kwargs["nonce"] for call in contract.send_renew_payment.call_args_list]
+    assert nonces == [7, 8]
+    assert contract.wait_for_receipt.call_count == 2
+
+    assert [result.tx_hash if result else None for result in batch.results] == ["0xpay-t1", "0xpay-t2", None]
+    assert batch.results[0].tx_hash_approve == "0xapprove"
+    assert batch.results[1].price == 7.0
+    assert batch.failed == [2]
+    assert sorted(params["tx_hash"] for params in renewals) == ["0xpay-t1", "0xpay-t2"]
+
+
+def test_renew_tasks_skips_approval_when_allowance_suffices(orchestrator, hardware_response):
+    contract = make_contract()
+    contract.get_allowance.return_value = 10 ** 30
+    contract.wait_for_receipt.side_effect = [Exception("reverted")]
+
+    with patch.object(orchestrator, "_request_without_params", return_value=hardware_response), \
+            patch.object(orchestrator, "get_task_detail", return_value=TaskDetail(hardware="C1ae.small", price_per_hour="0.5")), \
+            patch("swan.api.orchestrator.SwanContract", return_value=contract):
+        batch = orchestrator.renew_tasks(["t1"], private_key="0xkey")
+
+    contract.approve_payment.assert_not_called()
+    assert batch.errors == ["Renewal failed for task t1, reverted"]
+
+
+def test_payments_reuse_task_detail(orchestrator):
+    task_detail = TaskDetail(hardware="C1ae.small", price_per_hour="0.5")
+    contract = make_contract()
+
+    with patch.object(orchestrator, "get_deployment_info") as get_deployment_info, \
+            patch.object(orchestrator, "_request_with_params", return_value={"data": {}, "status": "success"}), \
+            patch("swan.api.orchestrator.SwanContract", return_value=contract):
+        orchestrator.renew_task("t1", duration=3600, private_key="0xkey", task_detail=task_detail)
+        orchestrator.renew_task("t1", duration=3600, tx_hash="0xpaid", task_detail=task_detail)
+        get_deployment_info.assert_not_called()
+
+        get_deployment_info.return_value = None
+        orchestrator.renew_task("t1", duration=3600, tx_hash="0xpaid")
+        get_deployment_info.assert_called_once_with("t1")
@@ -0,0 +1,90 @@
+""" Test catalog watcher """
+
+import asyncio
+import time
+
+from swan.api.catalog_watcher import CatalogWatcher
+from swan.object import InstanceCatalog
+
+
+def hardware(snapshot_id, price="1.0", status="available", region=None, expiry_time=None):
+    return [
+        {
+            "hardware_id": 1,
+            "hardware_name": "G1ae.medium",
+            "hardware_description": "Nvidia 3080 · 8 vCPU · 32 GiB",
+            "hardware_type": "GPU",
+            "region": region or ["Quebec-CA"],
+            "hardware_price": price,
+            "hardware_status": status,
+            "snapshot_id": snapshot_id,
+            "expiry_time": expiry_time,
+        }
+    ]
+
+
+class StubOrchestrator:
+
+    def __init__(self, snapshots):
+        self.catalog = InstanceCatalog()
+        self.snapshots = list(snapshots)
+        self.calls = 0
+
+    def update_instance_resources(self):
+        self.calls += 1
+        data = self.snapshots.pop(0) if len(self.snapshots) > 1 else self.snapshots[0]
+        return self.catalog.update(data)
+
+
+def test_poll_dispatches_typed_events():
+    orchestrator = StubOrchestrator([
+        hardware(1),
+        hardware(1),
+        hardware(2, price="0.8", status="unavailable", region=["Quebec-CA", "Tokyo-JP"]),
+    ])
+    watcher = CatalogWatcher(orchestrator)
+    received = []
+    prices = []
+    watcher.subscribe(received.append)
+    watcher.subscribe(prices.append, event_types=["price_changed"])
+
+    assert watcher.poll() == []
+    assert watcher.poll() == []
+    events = watcher.poll()
+
+    assert [event.type for event in events] == ["instance_unavailable", "price_changed", "region_added"]
+    assert received == events
+    assert len(prices) == 1
+    assert prices[0].old_price == 1.0 and prices[0].new_price == 0.8
+    assert events[2].region == "Tokyo-JP"
+    assert orchestrator.calls == 3
+
+
+def test_snapshot_expiring_once():
+    expiry_time = int(time.time()) + 10
+    orchestrator = StubOrchestrator([hardware(1, expiry_time=expiry_time)])
+    orchestrator.catalog.load(hardware(1, expiry_time=expiry_time))
+    watcher = CatalogWatcher(orchestrator, expiring_threshold=60)
+
+    events = watcher.poll()
+    assert [event.type for event in events] == ["snapshot_expiring"]
+    assert events[0].expiry_time == expiry_time
+    assert watcher.poll() == []
+    assert watcher.next_delay() <= 11
+
+
+def test_unsubscribe_and_async_iterator():
+    orchestrator = StubOrchestrator([hardware(1), hardware(2, price="2.0")])
+    orchestrator.catalog.load(hardware(1))
+    watcher = CatalogWatcher(orchestrator, interval=0, min_interval=0)
+    received = []
+    callback = watcher.subscribe(received.append)
+    watcher.unsubscribe(callback)
+
+    async def first_event():
+        async for event in watcher.events():
+            return event
+
+    event = asyncio.run(first_event())
+    assert event.type == "price_changed"
+    assert received == []
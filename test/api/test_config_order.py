@@ -0,0 +1,72 @@
+""" Test config order waiting """
+
+import time
+from unittest.mock import Mock, patch
+
+from swan.api.config_order_watcher import ConfigOrderWatcher
+from swan.object import ConfigOrder
+
+
+def order_response(status, error_code=None):
+    return {"data": {"status": status, "error_code": error_code, "task_uuid": "t1"}, "status": "success"}
+
+
+def wait(orchestrator, clock, responses, timeout=120):
+    with patch("swan.api.orchestrator.random.uniform", side_effect=lambda low, high: high), \
+            patch.object(orchestrator, "get_config_order_status", side_effect=responses):
+        return orchestrator.wait_for_config_order("t1", "0xpay", timeout=timeout), clock.sleeps
+
+
+def test_wait_for_config_order_returns_typed_terminal_order(orchestrator, clock):
+    responses = [None, order_response("pending_payment_confirm"), order_response("pending"), order_response("Finished")]
+    config_order, sleeps = wait(orchestrator, clock, responses)
+
+    assert isinstance(config_order, ConfigOrder)
+    assert config_order.status == "Finished"
+    assert not config_order.failed
+    assert sleeps == [1, 2, 4]
+
+
+def test_wait_for_config_order_exits_early_on_error_code(orchestrator, clock):
+    config_order, sleeps = wait(orchestrator, clock, [order_response("pending_payment_confirm", error_code=5)])
+
+    assert config_order.error_code == 5
+    assert config_order.failed
+    assert sleeps == []
+
+
+def test_wait_for_config_order_times_out(orchestrator, clock):
+    config_order, sleeps = wait(orchestrator, clock, lambda *args: order_response("pending_payment_confirm"), timeout=20)
+
+    assert config_order is None
+    assert sum(sleeps) == 20
+
+
+def test_watcher_shares_one_poll_across_orders():
+    orders = {("t1", "0x1"): None, ("t2", "0x2"): ConfigOrder(status="pending_payment_confirm")}
+    orchestrator = Mock()
+    orchestrator.get_config_order.side_effect = lambda task_uuid, tx_hash: orders[(task_uuid, tx_hash)]
+    watcher = ConfigOrderWatcher(orchestrator, min_interval=1, max_interval=8)
+    received = []
+    watcher.subscribe(received.append)
+
+    first = watcher.watch("t1", "0x1")
+    second = watcher.watch("t2", "0x2", timeout=30)
+    assert watcher.watch("t1", "0x1") is first
+
+    assert watcher.poll(now=1000) == []
+    assert watcher._interval == 2
+
+    orders[("t1", "0x1")] = ConfigOrder(status="Finished")
+    events = watcher.poll(now=1010)
+    assert [(event.type, event.task_uuid) for event in events] == [("confirmed", "t1")]
+    assert first.result(timeout=0).status == "Finished"
+    assert watcher._interval == 1
+    assert watcher.pending == [("t2", "0x2")]
+
+    events = watcher.poll(now=time.time() + 31)
+    assert [(event.type, event.task_uuid) for event in events] == [("timeout", "t2")]
+    assert second.result(timeout=0) is None
+    assert [event.type for event in received] == ["confirmed", "timeout"]
+    assert orchestrator.get_config_order.call_count == 5
+
@@ -0,0 +1,73 @@
+""" Test batch task creation """
+
+from unittest.mock import patch
+
+from swan.object import BatchResult, TaskCreationResult, TaskDetail
+
+
+def creation_response(params):
+    return {
+        "data": {"task": {
+            "uuid": "uuid-" + params["job_source_uri"] + "-" + params["wallet"],
+            "status": "initialized",
+            "task_detail": {"hardware": params["cfg_name"], "price_per_hour": "3.5"},
+        }},
+        "message": "Task_uuid initialized.",
+        "status": "success",
+    }
+
+
+def test_create_tasks(orchestrator, hardware_response):
+    source_uri_calls = []
+
+    def request_with_params(method, path, url, params, token, files, json_body=False):
+        if path == "/v2/get_source_uri":
+            source_uri_calls.append(params["repo_uri"])
+            return {"data": {"job_source_uri": "src-" + params["repo_uri"]}}
+        if path == "/util/example_code_mapping":
+            return {"status": "success", "data": {"url": "repo-image"}}
+        return creation_response(params)
+
+    specs = [
+        {"wallet_address": "w1", "repo_uri": "repo-a", "auto_pay": False},
+        {"wallet_address": "w1", "repo_uri": "repo-a", "auto_pay": False},
+        {"wallet_address": "w2", "job_source_uri": "src-b", "private_key": "pk", "instance_type": "G1ae.medium"},
+        {"wallet_address": "w3", "app_repo_image": "hello_world", "auto_pay": False},
+        {"wallet_address": "w4", "repo_uri": "repo-a", "instance_type": "missing", "auto_pay": False},
+        {"wallet_address": "w5", "repo_uri": "repo-a", "duration": 60, "auto_pay": False},
+    ]
+
+    with patch.object(orchestrator, "_request_without_params", return_value=hardware_response) as mock_get, \
+            patch.object(orchestrator, "_request_with_params", side_effect=request_with_params), \
+            patch.object(orchestrator, "make_payment", return_value={"tx_hash": "0xabc", "amount": 3.5, "data": {"status": "paid"}}) as mock_pay:
+        batch = orchestrator.create_tasks(specs, max_workers=4)
+
+    assert isinstance(batch, BatchResult)
+    catalog_fetches = [call for call in mock_get.call_args_list if call.args[1] == "/cp/machines-dp-ssh-ready"]
+    assert len(catalog_fetches) == 1
+    assert sorted(source_uri_calls) == ["repo-a", "repo-image"]
+    assert batch.failed == [4, 5]
+    assert "Invalid instance_type" in batch.errors[4]
+    assert "Duration" in batch.errors[5]
+
+    assert all(isinstance(result, TaskCreationResult) for result in batch.results[:4])
+    assert batch.results[0].task_uuid == "uuid-src-repo-a-w1"
+    assert batch.results[2].task_uuid == "uuid-src-b-w2"
+    assert batch.results[2].tx_hash == "0xabc"
+    assert batch.results[2].price == 3.5
+    assert batch.results[3].task_uuid == "uuid-src-repo-image-w3"
+    mock_pay.assert_called_once_with(
+        task_uuid="uuid-src-b-w2", duration=3600, private_key="pk", instance_type="G1ae.medium",
+        task_detail=TaskDetail(hardware="G1ae.medium", price_per_hour="3.5")
+    )
+    assert len(batch.succeeded) == 4
+
+
+def test_create_tasks_payment_failure(orchestrator, hardware_response):
+    with patch.object(orchestrator, "_request_without_params", return_value=hardware_response), \
+            patch.object(orchestrator, "_request_with_params", side_effect=lambda *args, **kwargs: creation_response(args[3])), \
+            patch.object(orchestrator, "make_payment", return_value=None):
+        batch = orchestrator.create_tasks([{"wallet_address": "w1", "job_source_uri": "src", "private_key": "pk"}])
+
+    assert batch.results[0].task_uuid == "uuid-src-w1"
+    assert batch.errors[0] == "Payment failed for task uuid-src-w1"
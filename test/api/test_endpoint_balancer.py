@@ -0,0 +1,126 @@
+""" Test client-side balancing over job_real_uri endpoints """
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from swan.api.endpoint_balancer import EndpointBalancer
+from swan.object import TaskDeploymentInfo
+
+
+def deployment(*urls):
+    return TaskDeploymentInfo.load_from_resp({
+        "data": {"task": {"uuid": "t1"}, "jobs": [{"job_real_uri": url} for url in urls]}
+    })
+
+
+def test_least_outstanding(clock):
+    orchestrator = Mock()
+    orchestrator.get_deployment_info.return_value = deployment("https://a", "https://b", None)
+    balancer = EndpointBalancer(orchestrator, "t1")
+
+    first = balancer.acquire()
+    second = balancer.acquire()
+    assert {first, second} == {"https://a", "https://b"}
+
+    balancer.release(first, latency=0.1)
+    assert balancer.acquire() == first
+    orchestrator.get_deployment_info.assert_called_once_with("t1")
+
+
+def test_ewma_prefers_faster_endpoint(clock):
+    orchestrator = Mock()
+    orchestrator.get_deployment_info.return_value = deployment("https://a", "https://b")
+    balancer = EndpointBalancer(orchestrator, "t1", policy="ewma")
+    balancer.refresh()
+
+    for url, latency in (("https://a", 1.0), ("https://b", 0.4)):
+        balancer._endpoints[url].outstanding += 1
+        balancer.release(url, latency=latency)
+
+    assert balancer.acquire() == "https://b"
+    assert balancer.acquire() == "https://b"
+    # b now carries two requests in flight: 0.4 * 3 > 1.0 * 1
+    assert balancer.acquire() == "https://a"
+
+
+def test_passive_ejection_and_restore(clock):
+    orchestrator = Mock()
+    orchestrator.get_deployment_info.return_value = deployment("https://a", "https://b")
+    balancer = EndpointBalancer(orchestrator, "t1", failure_threshold=2, ejection_time=10)
+    events = []
+    balancer.subscribe(events.append, ["ejected", "restored"])
+    balancer.refresh()
+
+    for _ in range(2):
+        balancer.release("https://a", success=False)
+    with pytest.raises(ConnectionError):
+        with patch.object(balancer, "acquire", return_value="https://b"):
+            with balancer.endpoint():
+                raise ConnectionError()
+
+    a, b = balancer.endpoints
+    assert a.ejected_until == 1010 and a.ejections == 1
+    assert b.ejected_until is None and b.consecutive_failures == 1
+    assert [event.type for event in events] == ["ejected"]
+    assert [balancer.acquire() for _ in range(3)] == ["https://b"] * 3
+
+    clock.now = 1010
+    assert balancer.acquire() == "https://a"
+    assert [event.type for event in events] == ["ejected", "restored"]
+
+    for _ in range(2):
+        balancer.release("https://a", success=False)
+    assert balancer.endpoints[0].ejected_until == 1030
+
+
+def test_all_ejected_falls_back_to_every_endpoint(clock):
+    orchestrator = Mock()
+    orchestrator.get_deployment_info.return_value = deployment("https://a")
+    balancer = EndpointBalancer(orchestrator, "t1", failure_threshold=1)
+
+    balancer.release(balancer.acquire(), success=False)
+    assert balancer.endpoints[0].ejected_until is not None
+    assert balancer.acquire() == "https://a"
+
+
+def test_refresh_keeps_stats_and_tracks_changes(clock):
+    orchestrator = Mock()
+    orchestrator.get_deployment_info.side_effect = [
+        deployment("https://a", "https://b"), None, deployment("https://b", "https://c")
+    ]
+    balancer = EndpointBalancer(orchestrator, "t1")
+
+    assert [event.type for event in balancer.poll()] == ["added", "added"]
+    balancer.release(balancer.acquire(), latency=1)
+    b_successes = balancer._endpoints["https://b"].successes
+
+    assert balancer.poll() == []
+    assert len(balancer.endpoints) == 2
+
+    events = balancer.poll()
+    assert [(event.type, event.url) for event in events] == [("removed", "https://a"), ("added", "https://c")]
+    assert [endpoint.url for endpoint in balancer.endpoints] == ["https://b", "https://c"]
+    assert balancer._endpoints["https://b"].successes == b_successes
+
+
+def test_only_http_job_uris_are_balanced(clock):
+    orchestrator = Mock()
+    orchestrator.get_deployment_info.return_value = deployment(
+        "https://a", "ssh root@38.80.122.1 -p30001", "http://b:8080", "tcp://c:9000", ""
+    )
+    balancer = EndpointBalancer(orchestrator, "t1")
+
+    assert [event.url for event in balancer.refresh()] == ["https://a", "http://b:8080"]
+    assert {balancer.acquire() for _ in range(4)} == {"https://a", "http://b:8080"}
+
+
+def test_no_endpoints(clock):
+    orchestrator = Mock()
+    orchestrator.get_deployment_info.return_value = deployment()
+    balancer = EndpointBalancer(orchestrator, "t1")
+
+    assert balancer.acquire() is None
+    with pytest.raises(LookupError):
+        with balancer.endpoint():
+            pass
@@ -0,0 +1,163 @@
+""" Test declarative fleet reconciler """
+
+from unittest.mock import Mock
+
+from swan.api.fleet_reconciler import FleetReconciler, ReplicaSetSpec
+from swan.object import BatchResult, TaskCreationResult, TaskInfo, TaskStore
+
+
+def task(uuid, status="running", end_at=10000, region="Quebec-CA", hardware="C1ae.small", source="src-a", job_status="running"):
+    return TaskInfo({
+        "task": {
+            "uuid": uuid,
+            "status": status,
+            "end_at": end_at,
+            "task_detail": {"hardware": hardware, "job_source_uri": source, "requirements": {"region": region}},
+        },
+        "jobs": [{"status": job_status}],
+    })
+
+
+def make_orchestrator(tasks):
+    orchestrator = Mock()
+    orchestrator.get_all_tasks.return_value = tasks
+    orchestrator.resolve_job_source_uri.return_value = "src-a"
+    orchestrator.get_instance_price.return_value = 1.0
+    orchestrator.create_tasks.side_effect = lambda specs: BatchResult(results=[None] * len(specs), errors=[None] * len(specs))
+    orchestrator.renew_tasks.side_effect = lambda uuids, **kwargs: BatchResult(results=[None] * len(uuids), errors=[None] * len(uuids))
+    orchestrator.terminate_tasks.side_effect = lambda uuids: BatchResult(results=[None] * len(uuids), errors=[None] * len(uuids))
+    return orchestrator
+
+
+def spec(**kwargs):
+    values = dict(name="api", wallet_address="0xwallet", replicas=4, instance_type="C1ae.small",
+                  regions=["Quebec-CA", "Tokyo-JP"], repo_uri="repo-a", private_key="0xkey", renew_before=600)
+    values.update(kwargs)
+    return ReplicaSetSpec(**values)
+
+
+def test_plan_creates_renews_and_terminates():
+    tasks = [
+        task("ok-1"),
+        task("expiring", end_at=1300),
+        task("broken", job_status="failed"),
+        task("ended", status="terminated"),
+        task("ended-capitalized", status="Ended"),
+        task("cancelled", status="Cancelled"),
+        task("other-source", source="src-b"),
+        task("other-hardware", hardware="G1ae.medium"),
+    ]
+    reconciler = FleetReconciler(make_orchestrator(tasks))
+    report = reconciler.plan(spec(), tasks, now=1000)
+
+    assert sorted(report.healthy) == ["expiring", "ok-1"]
+    assert report.renew == ["expiring"]
+    assert report.terminate == ["broken"]
+    assert report.create_regions == ["Tokyo-JP", "Tokyo-JP"]
+
+
+def test_surplus_drops_pending_and_soonest_ending_first():
+    tasks = [task("a", end_at=5000), task("b", status="initialized", end_at=9000), task("c", end_at=8000)]
+    reconciler = FleetReconciler(make_orchestrator(tasks))
+    report = reconciler.plan(spec(replicas=1), tasks, now=1000)
+
+    assert report.healthy == ["c"]
+    assert sorted(report.terminate) == ["a", "b"]
+
+
+def test_reconcile_applies_budgets_and_batches_actions():
+    tasks = [task("expiring-1", end_at=1100), task("expiring-2", end_at=1200)]
+    orchestrator = make_orchestrator(tasks)
+    reconciler = FleetReconciler(orchestrator, specs=[spec(replicas=5)], max_creates_per_cycle=2, max_spend_per_cycle=3.5)
+
+    report, = reconciler.reconcile(now=1000)
+
+    orchestrator.get_all_tasks.assert_called_once_with("0xwallet")
+    orchestrator.renew_tasks.assert_called_once_with(["expiring-1", "expiring-2"], duration=3600, private_key="0xkey")
+    created_specs = orchestrator.create_tasks.call_args.args[0]
+    assert [created["region"] for created in created_specs] == ["Tokyo-JP"]
+    assert created_specs[0]["job_source_uri"] == "src-a"
+    assert report.deferred == ["create in Tokyo-JP", "create in Quebec-CA"]
+    orchestrator.terminate_tasks.assert_not_called()
+
+
+def test_dry_run_and_listing_failure():
+    orchestrator = make_orchestrator([])
+    reconciler = FleetReconciler(orchestrator, specs=[spec(replicas=2)])
+
+    report, = reconciler.reconcile(now=1000, dry_run=True)
+    assert report.create_regions == ["Quebec-CA", "Tokyo-JP"]
+    orchestrator.create_tasks.assert_not_called()
+
+    orchestrator.get_all_tasks.return_value = None
+    report, = reconciler.reconcile(now=1000)
+    assert report.error == "Failed to list tasks"
+    orchestrator.create_tasks.assert_not_called()
+
+
+def test_owned_replicas_survive_source_uri_change():
+    store = TaskStore()
+    tasks = [task("a"), task("b", region="Tokyo-JP"), task("foreign")]
+    store.set_owner(["foreign"], "other-service")
+    orchestrator = make_orchestrator(tasks)
+    orchestrator.create_tasks.side_effect = lambda specs: BatchResult(
+        results=[TaskCreationResult(task_uuid=f"new-{i}") for i in range(len(specs))], errors=[None] * len(specs)
+    )
+
+    report, = FleetReconciler(orchestrator, specs=[spec(replicas=3)], store=store).reconcile(now=1000)
+    assert sorted(report.adopted) == ["a", "b"]
+    assert store.owners("api") == {"a": "api", "b": "api", "new-0": "api"}
+
+    # after a restart the spec resolves to another source URI: owned replicas still count
+    orchestrator = make_orchestrator(tasks + [task("new-0", source="src-a")])
+    orchestrator.resolve_job_source_uri.return_value = "src-b"
+    report, = FleetReconciler(orchestrator, specs=[spec(replicas=3)], store=store).reconcile(now=1000)
+    assert sorted(report.healthy) == ["a", "b", "new-0"]
+    assert report.adopted == []
+    orchestrator.create_tasks.assert_not_called()
+
+
+def test_dry_run_does_not_tag_and_ended_replicas_are_released():
+    store = TaskStore()
+    store.set_owner(["gone"], "api")
+    tasks = [task("a"), task("gone", status="Ended")]
+    reconciler = FleetReconciler(make_orchestrator(tasks), specs=[spec(replicas=1)], store=store)
+
+    report, = reconciler.reconcile(now=1000, dry_run=True)
+    assert (report.adopted, report.released) == (["a"], ["gone"])
+    assert store.owners() == {"gone": "api"}
+
+    reconciler.reconcile(now=1000)
+    assert store.owners() == {"a": "api"}
+
+
+def test_in_flight_renewal_is_paid_once():
+    tasks = [task("a", end_at=1300)]
+    orchestrator = make_orchestrator(tasks)
+    reconciler = FleetReconciler(orchestrator, specs=[spec(replicas=1)], renew_timeout=900)
+
+    reconciler.reconcile(now=1000)
+    # the backend still reports the old end_at on the next cycle
+    report, = reconciler.reconcile(now=1060)
+    assert (report.renew, report.renewing) == ([], ["a"])
+    assert orchestrator.renew_tasks.call_count == 1
+
+    # once end_at moved, the renewal is done and the task is not due
+    orchestrator.get_all_tasks.return_value = [task("a", end_at=4900)]
+    report, = reconciler.reconcile(now=1120)
+    assert (report.renew, report.renewing) == ([], [])
+
+    orchestrator.get_all_tasks.return_value = [task("a", end_at=5000)]
+    reconciler.reconcile(now=4500)
+    assert orchestrator.renew_tasks.call_count == 2
+
+
+def test_unapplied_renewal_is_retried_after_timeout():
+    orchestrator = make_orchestrator([task("a", end_at=1300)])
+    reconciler = FleetReconciler(orchestrator, specs=[spec(replicas=1)], renew_timeout=900)
+
+    reconciler.reconcile(now=1000)
+    reconciler.reconcile(now=1500)
+    assert orchestrator.renew_tasks.call_count == 1
+    reconciler.reconcile(now=1900)
+    assert orchestrator.renew_tasks.call_count == 2
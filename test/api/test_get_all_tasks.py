@@ -0,0 +1,57 @@
+""" Test parallel full task list fetch """
+
+from unittest.mock import patch
+
+from swan.object import TaskList
+
+
+def task_page(uuids, page, total_page):
+    return TaskList.load_from_resp({
+        "data": {
+            "list": [{"task": {"uuid": uuid}} for uuid in uuids],
+            "page": page,
+            "size": len(uuids),
+            "total_page": total_page,
+        },
+        "status": "success",
+    })
+
+
+def test_get_all_tasks_merges_pages_in_order_and_dedupes(orchestrator):
+    pages = {
+        1: ["t0", "t1", "t2"],
+        # a new task was created after page 1 was read, shifting t2 onto page 2
+        2: ["t2", "t3", "t4"],
+        3: ["t5", "t6"],
+    }
+
+    def get_task_list(wallet_address, page, size):
+        return task_page(pages[page], page, 3)
+
+    with patch.object(orchestrator, "get_task_list", side_effect=get_task_list) as mocked:
+        tasks = orchestrator.get_all_tasks("0xwallet", page_size=3, concurrency=4)
+
+    assert [task_info.task.uuid for task_info in tasks] == ["t0", "t1", "t2", "t3", "t4", "t5", "t6"]
+    assert sorted(call.kwargs["page"] for call in mocked.call_args_list) == [1, 2, 3]
+
+
+def test_get_all_tasks_single_page_and_failures(orchestrator):
+    with patch.object(orchestrator, "get_task_list", return_value=task_page(["t0"], 1, 1)) as mocked:
+        assert [task_info.task.uuid for task_info in orchestrator.get_all_tasks("0xwallet")] == ["t0"]
+    mocked.assert_called_once()
+
+    with patch.object(orchestrator, "get_task_list", return_value=None):
+        assert orchestrator.get_all_tasks("0xwallet") is None
+
+    def get_task_list(wallet_address, page, size):
+        return task_page(["t0"], 1, 2) if page == 1 else None
+
+    with patch.object(orchestrator, "get_task_list", side_effect=get_task_list):
+        assert orchestrator.get_all_tasks("0xwallet") is None
+
+
+def test_get_all_tasks_invalid_page_size(orchestrator, caplog):
+    with patch.object(orchestrator, "get_task_list") as get_task_list:
+        assert orchestrator.get_all_tasks("0xwallet", page_size=-1) is None
+    get_task_list.assert_not_called()
+    assert "Invalid page_size -1" in caplog.text
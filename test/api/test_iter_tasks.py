@@ -0,0 +1,71 @@
+""" Test lazy task iteration """
+
+import threading
+from unittest.mock import patch
+
+from swan.object import TaskList
+
+
+def task_page(uuids, page, total_page):
+    return TaskList.load_from_resp({
+        "data": {
+            "list": [{"task": {"uuid": uuid}} for uuid in uuids],
+            "page": page,
+            "size": len(uuids),
+            "total_page": total_page,
+        },
+        "status": "success",
+    })
+
+
+def paged_tasks(count, page_size):
+    total_page = -(-count // page_size)
+    uuids = [f"task-{i}" for i in range(count)]
+
+    def get_task_list(wallet_address, page, size):
+        return task_page(uuids[(page - 1) * size:page * size], page, total_page)
+    return get_task_list
+
+
+def test_iter_tasks_walks_all_pages_in_order(orchestrator):
+    with patch.object(orchestrator, "get_task_list", side_effect=paged_tasks(23, 5)) as get_task_list:
+        uuids = [task_info.task.uuid for task_info in orchestrator.iter_tasks("0xwallet", page_size=5, prefetch=2)]
+
+    assert uuids == [f"task-{i}" for i in range(23)]
+    assert sorted(call.args[1] for call in get_task_list.call_args_list) == [1, 2, 3, 4, 5]
+
+
+def test_iter_tasks_prefetch_is_bounded(orchestrator):
+    requested = []
+    lock = threading.Lock()
+    source = paged_tasks(1000, 10)
+
+    def get_task_list(wallet_address, page, size):
+        with lock:
+            requested.append(page)
+        return source(wallet_address, page, size)
+
+    with patch.object(orchestrator, "get_task_list", side_effect=get_task_list):
+        tasks = orchestrator.iter_tasks("0xwallet", page_size=10, prefetch=2)
+        first = next(tasks)
+        assert first.task.uuid == "task-0"
+        tasks.close()
+
+    # page 1 plus at most two prefetched pages were ever requested
+    assert max(requested) <= 3
+
+
+def test_iter_tasks_stops_on_failure_or_empty_page(orchestrator):
+    with patch.object(orchestrator, "get_task_list", return_value=None):
+        assert list(orchestrator.iter_tasks("0xwallet")) == []
+
+    with patch.object(orchestrator, "get_task_list", return_value=task_page([], 1, 0)) as get_task_list:
+        assert list(orchestrator.iter_tasks("0xwallet")) == []
+    get_task_list.assert_called_once()
+
+
+def test_iter_tasks_invalid_page_size(orchestrator, caplog):
+    with patch.object(orchestrator, "get_task_list") as get_task_list:
+        assert list(orchestrator.iter_tasks("0xwallet", page_size=0)) == []
+    get_task_list.assert_not_called()
+    assert "Invalid page_size 0" in caplog.text
@@ -0,0 +1,117 @@
+""" Test incremental job log streaming """
+
+from unittest.mock import Mock, patch
+
+from swan.api.job_logs import HttpLogCursor, JobLogStreamer, LineCursor, WebSocketLogReader
+from swan.object import TaskDeploymentInfo
+
+
+def http_response(status_code, body=b"", etag=None):
+    response = Mock(status_code=status_code, content=body, headers={"ETag": etag} if etag else {})
+    response.raise_for_status.return_value = None
+    return response
+
+
+class FakeSocket:
+
+    def __init__(self, messages):
+        self.messages = list(messages)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def recv(self, timeout=None):
+        if not self.messages:
+            raise ConnectionError("closed")
+        return self.messages.pop(0)
+
+
+def test_line_cursor_skips_replayed_lines():
+    cursor = LineCursor()
+    assert cursor.feed("a\nb\nc") == ["a", "b"]
+    assert cursor.feed("\n") == ["c"]
+
+    cursor.restart()
+    assert cursor.feed("a\nb\nc\nd\n") == ["d"]
+
+    # a replay that differs is a new log from the first differing line on
+    cursor.restart()
+    assert cursor.feed("a\nx\n") == ["x"]
+    assert cursor.feed("tail", final=True) == ["tail"]
+
+
+def test_http_cursor_uses_ranges_and_etags():
+    session = Mock()
+    session.get.side_effect = [
+        http_response(200, b"a\nb\n", etag='"v1"'),
+        http_response(304),
+        http_response(206, b"c\n", etag='"v2"'),
+    ]
+    cursor = HttpLogCursor("https://cp/log")
+
+    assert cursor.poll(session) == ["a", "b"]
+    assert cursor.poll(session) == []
+    assert cursor.poll(session) == ["c"]
+    assert session.get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"', "Range": "bytes=4-"}
+    assert cursor.offset == 6
+
+
+def test_http_cursor_dedupes_when_ranges_are_ignored():
+    session = Mock()
+    session.get.side_effect = [http_response(200, b"a\nb\n"), http_response(200, b"a\nb\nc\n"), http_response(200, b"a\nb\nc\n")]
+    cursor = HttpLogCursor("https://cp/log")
+
+    assert cursor.poll(session) == ["a", "b"]
+    assert cursor.poll(session) == ["c"]
+    assert cursor.poll(session) == []
+    assert "Range" not in session.get.call_args.kwargs["headers"]
+
+
+def test_websocket_reader_dedupes_reconnect_replay():
+    connections = [FakeSocket(["l1\nl2\nl", "3\n"]), FakeSocket(["l1\nl2\nl3\nl4\n"])]
+    lines = []
+    reader = WebSocketLogReader("wss://cp/log", lines.extend, connect=lambda url: connections.pop(0), reconnect_interval=0)
+    reader._stop_event.wait = lambda delay: connections or reader._stop_event.set()
+
+    reader.run()
+    assert lines == ["l1", "l2", "l3", "l4"]
+
+
+def test_stream_job_logs_follows_all_jobs(orchestrator):
+    def deployment(status, *jobs):
+        return TaskDeploymentInfo.load_from_resp({"data": {"task": {"uuid": "t1", "status": status}, "jobs": list(jobs)}})
+
+    job1 = {"uuid": "j1", "cp_account_address": "0xcp1", "build_log": "https://cp1/log?type=build"}
+    job2 = {"uuid": "j2", "cp_account_address": "0xcp2", "container_log": "wss://cp2/log?type=container"}
+    bodies = {"https://cp1/log?type=build": [http_response(200, b"step 1\n"), http_response(206, b"step 2\n"), http_response(304)]}
+    session = Mock()
+    session.get.side_effect = lambda url, headers, timeout: bodies[url].pop(0)
+
+    with patch.object(orchestrator, "get_deployment_info", side_effect=[
+        deployment("running", job1), deployment("terminated", job1, job2)
+    ]):
+        streamer = JobLogStreamer(
+            orchestrator, "t1", interval=0.05, refresh_interval=0, session=session,
+            connect=lambda url: FakeSocket(["serving\n"])
+        )
+        logs = list(streamer.stream(timeout=5))
+
+    assert [(log.log_type, log.line) for log in logs if log.job_uuid == "j1"] == [("build", "step 1"), ("build", "step 2")]
+    assert [(log.log_type, log.line, log.cp_account_address) for log in logs if log.job_uuid == "j2"] == [
+        ("container", "serving", "0xcp2")
+    ]
+    assert not streamer._readers
+
+
+def test_websocket_reader_stops_when_client_is_missing(caplog):
+    def connect(url):
+        raise ImportError("Following wss:// job logs requires websockets>=12")
+
+    reader = WebSocketLogReader("wss://cp/log", Mock(), connect=connect)
+    reader.run()
+
+    assert "requires websockets>=12" in caplog.text
+    assert caplog.records[-1].levelname == "ERROR"
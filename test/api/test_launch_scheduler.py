@@ -0,0 +1,120 @@
+""" Test deferred launch scheduler """
+
+from unittest.mock import Mock
+
+from swan.api.launch_scheduler import DeferredLaunchScheduler
+from swan.object import InstanceCatalog, TaskCreationResult
+
+
+def hardware(snapshot_id, price, status="available"):
+    return [
+        {
+            "hardware_id": 12,
+            "hardware_name": "G1ae.medium",
+            "hardware_description": "Nvidia 3080 · 8 vCPU · 32 GiB",
+            "hardware_type": "GPU",
+            "region": ["Quebec-CA"],
+            "hardware_price": price,
+            "hardware_status": status,
+            "snapshot_id": snapshot_id,
+        }
+    ]
+
+
+class StubOrchestrator:
+
+    def __init__(self, snapshots):
+        self.catalog = InstanceCatalog()
+        self.snapshots = list(snapshots)
+        self.create_task = Mock(side_effect=lambda **kwargs: TaskCreationResult(task_uuid="uuid-" + kwargs["wallet_address"]))
+
+    def update_instance_resources(self):
+        data = self.snapshots.pop(0) if len(self.snapshots) > 1 else self.snapshots[0]
+        return self.catalog.update(data)
+
+
+def test_launch_when_price_drops():
+    orchestrator = StubOrchestrator([hardware(1, "4.0"), hardware(2, "2.5")])
+    scheduler = DeferredLaunchScheduler(orchestrator)
+    launch = scheduler.submit(
+        max_price=3.0,
+        deadline=10_000,
+        wallet_address="w1",
+        instance_type="G1ae.medium",
+        region="Quebec-CA",
+    )
+
+    assert scheduler.check(now=0) == []
+    assert launch.status == "pending"
+
+    assert scheduler.check(now=1) == [launch]
+    assert launch.status == "launched"
+    assert launch.reason == "price"
+    assert launch.launch_price == 2.5
+    assert launch.wait(0).task_uuid == "uuid-w1"
+    assert scheduler.pending == []
+    orchestrator.create_task.assert_called_once_with(wallet_address="w1", instance_type="G1ae.medium", region="Quebec-CA")
+
+
+def test_launch_at_deadline_and_cancel():
+    orchestrator = StubOrchestrator([hardware(1, "4.0")])
+    scheduler = DeferredLaunchScheduler(orchestrator, interval=60, min_interval=1)
+    late = scheduler.submit(max_price=3.0, deadline=100, wallet_address="w1", instance_type="G1ae.medium")
+    other = scheduler.submit(max_price=3.0, deadline=200, wallet_address="w2", instance_type="G1ae.medium", region="Tokyo-JP")
+
+    assert scheduler.next_delay(now=50) == 50
+    assert scheduler.check(now=100) == [late]
+    assert late.reason == "deadline"
+    assert late.launch_price == 4.0
+
+    assert scheduler.cancel(other)
+    assert other.status == "cancelled"
+    assert other.done
+    assert not scheduler.cancel(other)
+    assert orchestrator.create_task.call_count == 1
+
+
+def test_cancel_during_check_skips_create_task():
+    orchestrator = StubOrchestrator([hardware(1, "2.0")])
+    scheduler = DeferredLaunchScheduler(orchestrator)
+    first = scheduler.submit(max_price=3.0, deadline=10_000, wallet_address="w1", instance_type="G1ae.medium")
+    second = scheduler.submit(max_price=3.0, deadline=10_000, wallet_address="w2", instance_type="G1ae.medium")
+
+    def create_task(**kwargs):
+        # the second launch is cancelled while the first one is being created
+        assert not scheduler.cancel(first)
+        assert scheduler.cancel(second)
+        return TaskCreationResult(task_uuid="uuid-" + kwargs["wallet_address"])
+    orchestrator.create_task.side_effect = create_task
+
+    assert scheduler.check(now=0) == [first]
+    assert first.status == "launched"
+    assert second.status == "cancelled"
+    orchestrator.create_task.assert_called_once_with(wallet_address="w1", instance_type="G1ae.medium")
+
+
+def test_unavailable_instance_in_explicit_region_waits_for_deadline():
+    orchestrator = StubOrchestrator([hardware(1, "2.0", status="unavailable")])
+    scheduler = DeferredLaunchScheduler(orchestrator)
+    launch = scheduler.submit(
+        max_price=3.0, deadline=100, wallet_address="w1", instance_type="G1ae.medium", region="Quebec-CA"
+    )
+
+    assert scheduler.check(now=0) == []
+    assert scheduler.check(now=100) == [launch]
+    assert launch.reason == "deadline"
+    assert launch.launch_price is None
+
+
+def test_submit_wakes_the_polling_thread():
+    orchestrator = StubOrchestrator([hardware(1, "2.0")])
+    scheduler = DeferredLaunchScheduler(orchestrator, interval=60)
+    events = []
+    scheduler.subscribe(events.append, event_types=["launched"])
+    scheduler.start()
+    try:
+        launch = scheduler.submit(max_price=3.0, deadline=10_000, wallet_address="w1", instance_type="G1ae.medium")
+        assert launch.wait(5).task_uuid == "uuid-w1"
+    finally:
+        scheduler.stop(timeout=5)
+    assert events == [launch]
@@ -0,0 +1,93 @@
+""" Test payment confirmation """
+
+from unittest.mock import patch
+
+from swan.object import PaymentResult, TaskDetail
+
+
+def make_payment(orchestrator, clock, validations, order_status=None):
+    payment = PaymentResult(tx_hash="0xpay", tx_hash_approve=None, amount=0.5)
+    with patch.object(orchestrator, "submit_payment", return_value=payment), \
+            patch.object(orchestrator, "validate_payment", side_effect=validations) as validate_payment, \
+            patch.object(orchestrator, "get_config_order_status", return_value=order_status):
+        result = orchestrator.make_payment(
+            "t1", private_key="0xkey", instance_type="C1ae.small",
+            task_detail=TaskDetail(hardware="C1ae.small", price_per_hour="0.5")
+        )
+    return result, clock.sleeps, validate_payment.call_count
+
+
+def test_accepted_payment_returns_without_sleeping(orchestrator, clock):
+    result, sleeps, calls = make_payment(orchestrator, clock, [{"status": "success", "data": {"status": "pending_payment_confirm"}}])
+
+    assert result["tx_hash"] == "0xpay"
+    assert sleeps == []
+    assert calls == 1
+
+
+def test_validation_retries_with_backoff(orchestrator, clock):
+    validations = [
+        None, {"status": "failed", "data": {"status": "pending_payment_confirm"}}, None, {"status": "success", "data": {}}
+    ]
+    result, sleeps, calls = make_payment(orchestrator, clock, validations)
+
+    assert result["status"] == "success"
+    assert sleeps == [0.5, 1, 2]
+    assert calls == 4
+
+
+def test_config_order_status_counts_as_accepted(orchestrator, clock):
+    order_status = {"status": "success", "data": {"status": "Finished", "error_code": None}}
+    result, sleeps, calls = make_payment(orchestrator, clock, [None], order_status)
+
+    assert result["data"]["status"] == "Finished"
+    assert sleeps == []
+
+
+def test_pending_config_order_is_retried(orchestrator, clock):
+    order_status = {"status": "success", "data": {"status": "pending_payment_confirm", "error_code": None}}
+    result, sleeps, calls = make_payment(orchestrator, clock, [None, None, {"status": "success", "data": {}}], order_status)
+
+    assert result["status"] == "success"
+    assert sleeps == [0.5, 1]
+    assert calls == 3
+
+
+def test_rejected_payment_returns_at_once(orchestrator, clock):
+    rejection = {"status": "failed", "message": "tx_hash does not match task", "data": {"status": "payment_failed"}}
+    result, sleeps, calls = make_payment(orchestrator, clock, [rejection])
+
+    assert result["message"] == "tx_hash does not match task"
+    assert result["tx_hash"] == "0xpay"
+    assert sleeps == []
+    assert calls == 1
+
+    rejection = {"status": "failed", "data": {"status": "pending_payment_confirm", "error_code": 3}}
+    result, sleeps, calls = make_payment(orchestrator, clock, [rejection])
+    assert result["data"]["error_code"] == 3
+    assert calls == 1
+
+
+def test_unindexed_payment_is_retried(orchestrator, clock):
+    not_found = {"status": "failed", "message": "tx not found"}
+    result, sleeps, calls = make_payment(orchestrator, clock, [not_found, not_found, {"status": "success", "data": {}}])
+
+    assert result["status"] == "success"
+    assert sleeps == [0.5, 1]
+    assert calls == 3
+
+
+def test_failed_config_order_returns_at_once(orchestrator, clock):
+    order_status = {"status": "success", "data": {"status": "payment_failed", "error_code": 3}}
+    result, sleeps, calls = make_payment(orchestrator, clock, [None], order_status)
+
+    assert result["data"]["status"] == "payment_failed"
+    assert sleeps == []
+
+
+def test_gives_up_after_timeout(orchestrator, clock):
+    result, sleeps, calls = make_payment(orchestrator, clock, lambda **kwargs: None)
+
+    assert result is None
+    assert sum(sleeps) <= 60
+    assert sleeps[-1] == 5
@@ -0,0 +1,32 @@
+""" Test batch cost planning """
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+
+def test_plan_costs_checks_wallet(orchestrator, hardware_response):
+    contract = Mock()
+    contract.get_allowance.return_value = 2
+    contract.get_balance.return_value = 100
+    contract.from_wei.side_effect = float
+
+    with patch.object(orchestrator, "_request_without_params", return_value=hardware_response), \
+            patch("swan.api.orchestrator.SwanContract", return_value=contract):
+        plan = orchestrator.plan_costs(
+            [("C1ae.small", "Quebec-CA", 7200, 3), ("G1ae.medium", "global", 1800, 2)], private_key="0xkey"
+        )
+
+    assert plan.total == pytest.approx(0.5 * 2 * 3 + 3.5 * 0.5 * 2)
+    assert plan.total == pytest.approx(orchestrator.estimate_payment(7200 * 3, "C1ae.small")
+                                       + orchestrator.estimate_payment(1800 * 2, "G1ae.medium"))
+    assert plan.allowance_shortfall == pytest.approx(4.5)
+    assert plan.affordable
+
+
+def test_plan_costs_without_wallet(orchestrator):
+    plan = orchestrator.plan_costs([("C1ae.small", "Tokyo-JP")], refresh=False)
+
+    assert plan.total == pytest.approx(0.5)
+    assert plan.allowance is None
+    assert plan.allowance_shortfall == 0
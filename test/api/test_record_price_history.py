@@ -0,0 +1,21 @@
+""" Test price history recording on catalog refresh """
+
+import logging
+from unittest.mock import patch
+
+from swan.api.orchestrator import Orchestrator
+
+
+def test_record_failure_does_not_fail_refresh(orchestrator, hardware_response, caplog):
+    price_history = orchestrator.enable_price_history()
+    hardware_response["data"]["hardware"][0]["snapshot_id"] = 1732051200
+    hardware_response["data"]["hardware"][0]["hardware_price"] = "0.4"
+
+    with patch.object(Orchestrator, "_request_without_params", return_value=hardware_response), \
+            patch.object(price_history, "record", side_effect=OSError("disk I/O error")), \
+            caplog.at_level(logging.ERROR):
+        diff = orchestrator.update_instance_resources()
+
+    assert diff.changed
+    assert orchestrator.catalog.get("C1ae.small").price == "0.4"
+    assert "disk I/O error" in caplog.text
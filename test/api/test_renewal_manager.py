@@ -0,0 +1,106 @@
+""" Test auto-renewal manager """
+
+from unittest.mock import Mock
+
+import pytest
+
+from swan.api.renewal_manager import RenewalManager
+from swan.object import BatchResult, ConfigOrder, TaskDetail, TaskRenewalResult
+
+
+def make_orchestrator(end_at):
+    orchestrator = Mock()
+    orchestrator.get_task_detail.side_effect = lambda task_uuid: TaskDetail(status="running", end_at=end_at[task_uuid])
+    orchestrator.renew_tasks.side_effect = lambda task_uuids, duration, private_key: BatchResult(
+        results=[TaskRenewalResult(task_uuid=task_uuid, tx_hash=f"0x{task_uuid}") for task_uuid in task_uuids],
+        errors=[None] * len(task_uuids)
+    )
+    orchestrator.get_config_order.return_value = ConfigOrder(status="pending_payment_confirm")
+    return orchestrator
+
+
+def test_renews_due_tasks_in_one_batch_and_confirms():
+    end_at = {"t1": 1000, "t2": 1200, "t3": 5000}
+    orchestrator = make_orchestrator(end_at)
+    manager = RenewalManager(orchestrator, private_key="0xkey", duration=3600, lead_time=300, batch_window=300)
+    manager.track(["t1", "t2", "t3"])
+
+    assert manager.poll(now=600) == []
+    assert manager.tracked == end_at
+    assert manager.next_delay(now=600) == 100
+
+    events = manager.poll(now=700)
+    orchestrator.renew_tasks.assert_called_once_with(["t1", "t2"], duration=3600, private_key="0xkey")
+    assert [(event.type, event.task_uuid) for event in events] == [("renewal_submitted", "t1"), ("renewal_submitted", "t2")]
+
+    # pending confirmation: no second renewal and no detail refetch
+    assert manager.poll(now=710) == []
+    assert orchestrator.renew_tasks.call_count == 1
+
+    orchestrator.get_config_order.return_value = ConfigOrder(status="Finished")
+    end_at.update(t1=4600, t2=4800)
+    events = manager.poll(now=720)
+    assert sorted((event.type, event.task_uuid) for event in events) == [("renewal_confirmed", "t1"), ("renewal_confirmed", "t2")]
+    assert manager.tracked == {"t1": 4600, "t2": 4800, "t3": 5000}
+
+
+def test_failed_renewal_is_retried_after_interval():
+    end_at = {"t1": 1000}
+    orchestrator = make_orchestrator(end_at)
+    orchestrator.renew_tasks.side_effect = None
+    orchestrator.renew_tasks.return_value = BatchResult(results=[None], errors=["Renewal payment failed"])
+    manager = RenewalManager(orchestrator, private_key="0xkey", lead_time=300, retry_interval=60)
+    manager.track(["t1"])
+
+    events = manager.poll(now=800)
+    assert [(event.type, event.error) for event in events] == [("renewal_failed", "Renewal payment failed")]
+    assert manager.poll(now=830) == []
+    assert orchestrator.renew_tasks.call_count == 1
+    assert manager.next_delay(now=830) == 30
+
+    manager.poll(now=861)
+    assert orchestrator.renew_tasks.call_count == 2
+
+
+@pytest.mark.parametrize("status", ["terminated", "Ended", "Finished", "Complete", "Cancelled"])
+def test_ended_tasks_are_dropped(status):
+    orchestrator = Mock()
+    orchestrator.get_task_detail.return_value = TaskDetail(status=status, end_at=100)
+    manager = RenewalManager(orchestrator, private_key="0xkey")
+    manager.track(["t1"])
+
+    events = manager.poll(now=50)
+    assert [(event.type, event.task_uuid) for event in events] == [("task_expired", "t1")]
+    assert manager.tracked == {}
+    orchestrator.renew_tasks.assert_not_called()
+
+
+def test_stale_end_at_after_confirmation_is_not_renewed_twice():
+    end_at = {"t1": 1000}
+    orchestrator = make_orchestrator(end_at)
+    manager = RenewalManager(orchestrator, private_key="0xkey", duration=3600, lead_time=300)
+    manager.track(["t1"])
+
+    manager.poll(now=800)
+    orchestrator.get_config_order.return_value = ConfigOrder(status="Finished")
+    # the backend has not applied the renewal to end_at yet
+    events = manager.poll(now=810)
+    assert [event.type for event in events] == ["renewal_confirmed"]
+    assert manager.tracked == {"t1": 4600}
+    assert orchestrator.renew_tasks.call_count == 1
+
+
+def test_unconfirmed_renewal_times_out_and_is_retried():
+    end_at = {"t1": 1000}
+    orchestrator = make_orchestrator(end_at)
+    orchestrator.get_config_order.return_value = None
+    manager = RenewalManager(orchestrator, private_key="0xkey", lead_time=300, confirm_timeout=100)
+    manager.track(["t1"])
+
+    manager.poll(now=800)
+    assert manager.poll(now=850) == []
+
+    events = manager.poll(now=900)
+    assert [(event.type, event.tx_hash) for event in events] == [("renewal_failed", "0xt1"), ("renewal_submitted", "0xt1")]
+    assert events[0].error == "Renewal not confirmed within 100 seconds"
+    assert orchestrator.renew_tasks.call_count == 2
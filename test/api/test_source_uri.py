@@ -0,0 +1,33 @@
+""" Test job source uri resolution """
+
+from unittest.mock import patch
+
+
+def test_source_uri_is_memoized(orchestrator):
+    response = {"data": {"job_source_uri": "https://source-uri"}}
+    with patch.object(orchestrator, "_request_with_params", return_value=response) as mock_post:
+        for _ in range(3):
+            assert orchestrator._get_source_uri("repo", wallet_address="w1", instance_type="C1ae.small") == "https://source-uri"
+        assert mock_post.call_count == 1
+
+        orchestrator._get_source_uri("repo", repo_branch="dev", wallet_address="w1", instance_type="C1ae.small")
+        orchestrator._get_source_uri("repo", wallet_address="w1", instance_type="G1ae.medium")
+        assert mock_post.call_count == 3
+
+        assert orchestrator.invalidate_source_uri("repo", repo_branch="dev") == 1
+        assert orchestrator.invalidate_source_uri("repo") == 2
+        orchestrator._get_source_uri("repo", wallet_address="w1", instance_type="C1ae.small")
+        assert mock_post.call_count == 4
+
+
+def test_source_uri_cache_disabled(orchestrator, tmp_path):
+    orchestrator.configure_source_uri_cache(ttl=0)
+    with patch.object(orchestrator, "_request_with_params", return_value={"data": {"job_source_uri": "uri"}}) as mock_post:
+        orchestrator._get_source_uri("repo", wallet_address="w1", instance_type="C1ae.small")
+        orchestrator._get_source_uri("repo", wallet_address="w1", instance_type="C1ae.small")
+    assert mock_post.call_count == 2
+
+    cache = orchestrator.configure_source_uri_cache(ttl=60, path=str(tmp_path / "source_uri.json"))
+    with patch.object(orchestrator, "_request_with_params", return_value={"data": {"job_source_uri": "uri"}}):
+        orchestrator._get_source_uri("repo", wallet_address="w1", instance_type="C1ae.small")
+    assert cache.get(("repo", None, 0, "w1")) == "uri"
@@ -0,0 +1,44 @@
+""" Test incremental task store sync """
+
+from unittest.mock import patch
+
+from swan.object import TaskDeploymentInfo, TaskList, TaskStore
+
+
+def task_list(versions):
+    return TaskList.load_from_resp({
+        "data": {
+            "list": [{"task": {"uuid": uuid, "updated_at": updated_at}} for uuid, updated_at in versions.items()],
+            "page": 1,
+            "size": len(versions),
+            "total_page": 1,
+        },
+        "status": "success",
+    })
+
+
+def deployment_info(uuid, updated_at):
+    return TaskDeploymentInfo.load_from_resp({
+        "data": {"task": {"uuid": uuid, "status": "running", "updated_at": updated_at}},
+        "status": "success",
+    })
+
+
+def test_sync_fetches_only_changed_tasks(orchestrator):
+    store = TaskStore()
+    versions = {"t1": 10, "t2": 10}
+
+    with patch.object(orchestrator, "get_task_list", side_effect=lambda *args, **kwargs: task_list(versions)), \
+            patch.object(orchestrator, "get_deployment_info", side_effect=lambda uuid: deployment_info(uuid, versions[uuid])) as get_deployment_info:
+        assert sorted(orchestrator.sync_task_store(store, "0xwallet")) == ["t1", "t2"]
+        assert get_deployment_info.call_count == 2
+
+        assert orchestrator.sync_task_store(store, "0xwallet") == []
+        assert get_deployment_info.call_count == 2
+
+        versions["t2"] = 20
+        versions["t3"] = 5
+        assert sorted(orchestrator.sync_task_store(store, "0xwallet")) == ["t2", "t3"]
+        assert sorted(call.args[0] for call in get_deployment_info.call_args_list[2:]) == ["t2", "t3"]
+
+    assert store.versions("0xwallet") == {"t1": 10, "t2": 20, "t3": 5}
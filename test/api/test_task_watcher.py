@@ -0,0 +1,91 @@
+""" Test fleet task watcher """
+
+from unittest.mock import Mock
+
+from swan.api.task_watcher import TaskFleetWatcher
+from swan.object import TaskDeploymentInfo, TaskList
+
+
+def task_page(tasks, page, total_page):
+    return TaskList.load_from_resp({
+        "data": {
+            "list": [{"task": {"uuid": uuid, "status": status, "updated_at": updated_at}} for uuid, status, updated_at in tasks],
+            "page": page,
+            "size": len(tasks),
+            "total_page": total_page,
+        },
+        "status": "success",
+    })
+
+
+def deployment_info(uuid, status, updated_at):
+    return TaskDeploymentInfo.load_from_resp({"data": {"task": {"uuid": uuid, "status": status, "updated_at": updated_at}}})
+
+
+def test_sweep_and_transitions():
+    pages = {
+        1: [("t1", "initialized", 1), ("other", "running", 1)],
+        2: [("t2", "running", 1)],
+        3: [("t3", "running", 1)],
+    }
+    orchestrator = Mock()
+    orchestrator.get_task_list.side_effect = lambda wallet, page, size: task_page(pages[page], page, 3)
+    orchestrator.get_deployment_info.side_effect = lambda uuid: deployment_info(uuid, "running", 1)
+
+    watcher = TaskFleetWatcher(orchestrator, page_size=2)
+    watcher.watch(["t1", "t2"], wallet_address="0xwallet")
+    watcher.watch(["t9"])
+    received = []
+    watcher.subscribe(received.append, event_types=["status_changed"])
+
+    events = watcher.poll()
+    assert {(event.task_uuid, event.new_status) for event in events} == {("t1", "initialized"), ("t2", "running"), ("t9", "running")}
+    # the sweep stops after page 2 once t1 and t2 were seen; only t9 is fetched individually
+    assert orchestrator.get_task_list.call_count == 2
+    orchestrator.get_deployment_info.assert_called_once_with("t9")
+    assert len(received) == 3
+
+    assert watcher.poll() == []
+
+    pages[1] = [("t1", "running", 2)]
+    pages[2] = [("t2", "running", 5)]
+    events = watcher.poll()
+    assert sorted((event.type, event.task_uuid, event.old_status, event.new_status) for event in events) == [
+        ("status_changed", "t1", "initialized", "running"),
+        ("updated", "t2", "running", "running"),
+    ]
+    assert watcher.status("t1") == "running"
+    assert len(received) == 4
+
+
+def test_missing_task_and_details():
+    orchestrator = Mock()
+    orchestrator.get_task_list.return_value = task_page([("t1", "running", 1)], 1, 1)
+    orchestrator.get_deployment_info.side_effect = lambda uuid: deployment_info(uuid if uuid == "t1" else None, "running", 1)
+
+    watcher = TaskFleetWatcher(orchestrator, fetch_details=True)
+    watcher.watch(["t1", "gone"], wallet_address="0xwallet")
+    events = {event.task_uuid: event for event in watcher.poll()}
+
+    assert events["gone"].type == "not_found"
+    assert isinstance(events["t1"].task_info, TaskDeploymentInfo)
+    assert watcher.poll() == []
+
+    watcher.unwatch(["gone"])
+    assert list(watcher.watched) == ["t1"]
+
+
+def test_failed_fetch_keeps_last_state():
+    orchestrator = Mock()
+    orchestrator.get_deployment_info.return_value = deployment_info("t1", "running", 1)
+    watcher = TaskFleetWatcher(orchestrator)
+    watcher.watch(["t1"])
+    watcher.poll()
+
+    # a network or backend error is not a missing task
+    orchestrator.get_deployment_info.return_value = None
+    assert watcher.poll() == []
+    assert watcher.status("t1") == "running"
+
+    orchestrator.get_deployment_info.return_value = deployment_info("t1", "running", 1)
+    assert watcher.poll() == []
@@ -0,0 +1,43 @@
+""" Test task waiter """
+
+from unittest.mock import patch
+
+from swan.object import TaskDeploymentInfo
+
+
+def deployment_info(status, real_uri=None, created_at=1000, start_in=60):
+    return TaskDeploymentInfo.load_from_resp({
+        "data": {
+            "task": {"uuid": "task-1", "status": status, "created_at": created_at, "start_in": start_in},
+            "jobs": [{"job_real_uri": real_uri}],
+        },
+        "status": "success",
+    })
+
+
+def test_wait_for_task_adaptive(orchestrator, clock):
+    responses = [deployment_info("initialized")] * 8 + [deployment_info("running"), deployment_info("running", "https://app")]
+    with patch.object(orchestrator, "get_deployment_info", side_effect=responses) as mock_info:
+        task_info = orchestrator.wait_for_task("task-1", timeout=600)
+
+    assert task_info.jobs[0].job_real_uri == "https://app"
+    assert mock_info.call_count == 10
+    # halves the distance to created_at + start_in, then backs off after it
+    assert clock.sleeps == [30, 15, 7.5, 3.75, 2, 2, 3, 4.5, 6.75]
+
+
+def test_wait_for_task_terminal_and_timeout(orchestrator, clock):
+    with patch.object(orchestrator, "get_deployment_info", return_value=deployment_info("terminated")):
+        assert orchestrator.wait_for_task("task-1") is None
+    assert clock.sleeps == []
+
+    with patch.object(orchestrator, "get_deployment_info", return_value=deployment_info("initialized")):
+        assert orchestrator.wait_for_task("task-1", until="running", timeout=100, max_interval=10) is None
+    assert sum(clock.sleeps) == 100
+    assert max(clock.sleeps) <= 10
+
+
+def test_wait_for_task_callable_condition(orchestrator):
+    with patch.object(orchestrator, "get_deployment_info", return_value=deployment_info("deploying")):
+        task_info = orchestrator.wait_for_task("task-1", until=lambda info: info.task.status == "deploying")
+    assert task_info.task.status == "deploying"
@@ -0,0 +1,52 @@
+# test_cache.py
+import time
+
+from swan.common.cache import TTLCache
+
+
+def test_get_set_and_expiry():
+    cache = TTLCache(ttl=60)
+    cache.set(("repo", None, 0, "w1"), "uri")
+    assert cache.get(("repo", None, 0, "w1")) == "uri"
+    assert cache.get(("repo", "main", 0, "w1")) is None
+
+    cache.set("short", "value", ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("short") is None
+    assert len(cache) == 1
+
+
+def test_get_or_set_skips_empty_values():
+    cache = TTLCache(ttl=60)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return "" if len(calls) == 1 else "uri"
+
+    assert cache.get_or_set("key", factory) == ""
+    assert cache.get_or_set("key", factory) == "uri"
+    assert cache.get_or_set("key", factory) == "uri"
+    assert len(calls) == 2
+
+
+def test_invalidate():
+    cache = TTLCache(ttl=60)
+    cache.set(("a", None), 1)
+    cache.set(("a", "dev"), 2)
+    cache.set(("b", None), 3)
+
+    assert cache.invalidate(("b", None)) == 1
+    assert cache.invalidate(predicate=lambda key: key[0] == "a" and key[1] == "dev") == 1
+    assert cache.get(("a", None)) == 1
+    assert cache.invalidate() == 1
+    assert len(cache) == 0
+
+
+def test_disk_tier(tmp_path):
+    path = str(tmp_path / "cache.json")
+    TTLCache(ttl=60, path=path).set(("repo", None), "uri")
+    assert TTLCache(ttl=60, path=path).get(("repo", None)) == "uri"
+
+    (tmp_path / "broken.json").write_text("{not json")
+    assert TTLCache(ttl=60, path=str(tmp_path / "broken.json")).get("x") is None
@@ -0,0 +1,21 @@
+""" Test common helpers """
+
+import pytest
+
+from swan.common.utils import is_terminal_status, percentile
+
+
+@pytest.mark.parametrize("status", ["Ended", "Finished", "Complete", "Cancelled", "terminated", "FAILED", "completed"])
+def test_terminal_statuses(status):
+    assert is_terminal_status(status)
+
+
+@pytest.mark.parametrize("status", ["running", "Deploying", "pending_payment_confirm", "", None])
+def test_live_statuses(status):
+    assert not is_terminal_status(status)
+
+
+def test_percentile():
+    assert percentile([4.0, 1.0, 3.0, 2.0], 25) == pytest.approx(1.75)
+    assert percentile([5.0], 90) == 5.0
+    assert percentile([], 50) is None
@@ -0,0 +1,187 @@
+# test_catalog.py
+import threading
+
+import pytest
+from swan.object import InstanceCatalog, InstanceQuote
+
+
+@pytest.fixture
+def hardware_list():
+    return [
+        {
+            "hardware_id": 0,
+            "hardware_name": "C1ae.small",
+            "hardware_description": "CPU only · 2 vCPU · 2 GiB",
+            "hardware_type": "CPU",
+            "region": ["Quebec-CA", "Tokyo-JP"],
+            "hardware_price": "0.48",
+            "hardware_status": "available",
+            "snapshot_id": 1732047600,
+            "expiry_time": 1732048445,
+        },
+        {
+            "hardware_id": 1,
+            "hardware_name": "C1ae.medium",
+            "hardware_description": "CPU only · 4 vCPU · 4 GiB",
+            "hardware_type": "CPU",
+            "region": ["Quebec-CA"],
+            "hardware_price": "0.96",
+            "hardware_status": "available",
+            "snapshot_id": 1732047600,
+            "expiry_time": 1732048445,
+        },
+        {
+            "hardware_id": 12,
+            "hardware_name": "G1ae.medium",
+            "hardware_description": "Nvidia 3080 · 8 vCPU · 32 GiB",
+            "hardware_type": "GPU",
+            "region": ["Tokyo-JP"],
+            "hardware_price": "3.5",
+            "hardware_status": "available",
+            "snapshot_id": 1732047600,
+            "expiry_time": 1732048445,
+        },
+        {
+            "hardware_id": 13,
+            "hardware_name": "G2ae.large",
+            "hardware_description": "2 x Nvidia 4090 · 16 vCPU · 64 GiB",
+            "hardware_type": "GPU",
+            "region": ["Quebec-CA"],
+            "hardware_price": "2.0",
+            "hardware_status": "unavailable",
+            "snapshot_id": 1732047600,
+            "expiry_time": 1732048445,
+        },
+    ]
+
+
+@pytest.fixture
+def catalog(hardware_list):
+    return InstanceCatalog(hardware_list)
+
+
+def test_catalog_index(catalog):
+    assert len(catalog) == 4
+    assert "G1ae.medium" in catalog
+    assert catalog.get("G1ae.medium").gpu_model == "Nvidia 3080"
+    assert catalog.get("missing") is None
+    assert catalog.instance_mapping()["C1ae.small"]["hardware_id"] == 0
+    mapping = catalog.instance_mapping()
+    assert mapping["C1ae.small"] is catalog.get("C1ae.small")
+    assert catalog.instance_mapping() is mapping
+    with pytest.raises(TypeError):
+        mapping["C1ae.small"] = None
+
+    copies = catalog.instance_mapping(copy=True)
+    assert copies["C1ae.small"]["expiry_time"] == "2024-11-19 20:34:05 UTC"
+    copies["C1ae.small"]["price"] = "0"
+    assert catalog.get("C1ae.small").price == "0.48"
+
+
+def test_catalog_accessors(catalog):
+    assert catalog.price("C1ae.small") == 0.48
+    assert catalog.price("missing") is None
+    assert catalog.regions("C1ae.small") == ["Quebec-CA", "Tokyo-JP"]
+    assert catalog.regions("missing") == []
+    assert catalog.is_available("C1ae.small", "Tokyo-JP")
+    assert not catalog.is_available("C1ae.medium", "Tokyo-JP")
+    assert not catalog.is_available("G2ae.large")
+    assert not catalog.is_available("G2ae.large", "Quebec-CA")
+    assert not catalog.is_available("missing")
+
+
+def test_find_cheapest_cpu(catalog):
+    quotes = catalog.find_cheapest(min_vcpu=2, duration=7200)
+    assert [quote.instance_type for quote in quotes] == ["C1ae.small", "C1ae.medium", "G1ae.medium"]
+    assert isinstance(quotes[0], InstanceQuote)
+    assert quotes[0].amount == pytest.approx(0.96)
+
+
+def test_find_cheapest_requirements(catalog):
+    quotes = catalog.find_cheapest(min_vcpu=4, min_memory=8)
+    assert [quote.instance_type for quote in quotes] == ["G1ae.medium"]
+
+    quotes = catalog.find_cheapest(min_vcpu=2, max_gpu_count=0)
+    assert [quote.instance_type for quote in quotes] == ["C1ae.small", "C1ae.medium"]
+
+    quotes = catalog.find_cheapest(gpu_models=["nvidia 4090"])
+    assert quotes == []
+
+    quotes = catalog.find_cheapest(gpu_models=["nvidia 4090"], available=False)
+    assert [quote.instance_type for quote in quotes] == ["G2ae.large"]
+    assert quotes[0].gpu_count == 2
+
+
+def test_find_cheapest_regions(catalog):
+    quotes = catalog.find_cheapest(regions=["Tokyo-JP"])
+    assert [quote.instance_type for quote in quotes] == ["C1ae.small", "G1ae.medium"]
+    assert quotes[0].regions == ["Tokyo-JP"]
+
+    quotes = catalog.find_cheapest(regions="global", limit=1)
+    assert [quote.instance_type for quote in quotes] == ["C1ae.small"]
+
+
+def test_update_same_snapshot(catalog, hardware_list):
+    instances = catalog.instances
+    hardware_list[0]["hardware_price"] = "9.9"
+    diff = catalog.update(hardware_list)
+    assert diff.changed is False
+    assert diff.snapshot_id == 1732047600
+    assert catalog.instances is instances
+    assert catalog.get("C1ae.small").price == "0.48"
+
+
+def test_update_new_snapshot(catalog, hardware_list):
+    for config in hardware_list:
+        config["snapshot_id"] = 1732051200
+    hardware_list[0]["hardware_price"] = "0.5"
+    hardware_list[2]["region"] = ["Quebec-CA"]
+    hardware_list[3]["hardware_status"] = "available"
+    del hardware_list[1]
+    hardware_list.append({
+        "hardware_id": 20,
+        "hardware_name": "G4ae.large",
+        "hardware_description": "4 x Nvidia 4090 · 32 vCPU · 128 GiB",
+        "hardware_type": "GPU",
+        "region": ["Quebec-CA"],
+        "hardware_price": "8.0",
+        "hardware_status": "available",
+        "snapshot_id": 1732051200,
+    })
+
+    diff = catalog.update(hardware_list)
+    assert diff.changed is True
+    assert diff.old_snapshot_id == 1732047600
+    assert diff.snapshot_id == 1732051200
+    assert diff.added == ["G4ae.large"]
+    assert diff.removed == ["C1ae.medium"]
+
+    changes = {change.instance_type: change for change in diff.changes}
+    assert set(changes) == {"C1ae.small", "G1ae.medium", "G2ae.large"}
+    assert changes["C1ae.small"].price_changed
+    assert changes["C1ae.small"].new_price == 0.5
+    assert changes["G1ae.medium"].added_regions == ["Quebec-CA"]
+    assert changes["G1ae.medium"].removed_regions == ["Tokyo-JP"]
+    assert changes["G2ae.large"].status_changed
+    assert not changes["G2ae.large"].price_changed
+    assert catalog.get("C1ae.small").price == "0.5"
+
+
+def test_concurrent_update_keeps_columns_consistent(hardware_list):
+    catalog = InstanceCatalog(hardware_list)
+    shrunk = [dict(hardware_list[0], snapshot_id=1)]
+    stop = threading.Event()
+
+    def reload():
+        for i in range(200):
+            catalog.update(shrunk if i % 2 else [dict(config, snapshot_id=2 + i) for config in hardware_list])
+        stop.set()
+
+    thread = threading.Thread(target=reload)
+    thread.start()
+    while not stop.is_set():
+        for instance_type in ("C1ae.small", "G2ae.large"):
+            catalog.price(instance_type)
+            catalog.is_available(instance_type, "Quebec-CA")
+        assert all(quote.price is not None for quote in catalog.find_cheapest(available=False))
+    thread.join()
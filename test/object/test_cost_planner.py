@@ -0,0 +1,77 @@
+# test_cost_planner.py
+import pytest
+from swan.object import CostPlanner, InstanceCatalog
+
+
+@pytest.fixture
+def catalog():
+    def hardware(hardware_id, name, description, region, price, status="available"):
+        return {
+            "hardware_id": hardware_id,
+            "hardware_name": name,
+            "hardware_description": description,
+            "hardware_type": "GPU" if "Nvidia" in description else "CPU",
+            "region": region,
+            "hardware_price": price,
+            "hardware_status": status,
+        }
+
+    return InstanceCatalog([
+        hardware(0, "C1ae.small", "CPU only · 2 vCPU · 2 GiB", ["Quebec-CA", "Tokyo-JP"], "0.5"),
+        hardware(1, "C1ae.medium", "CPU only · 4 vCPU · 4 GiB", ["Quebec-CA"], "1.0"),
+        hardware(2, "C1ae.large", "CPU only · 8 vCPU · 8 GiB", ["Quebec-CA"], "0.8"),
+        hardware(12, "G1ae.medium", "Nvidia 3080 · 8 vCPU · 32 GiB", ["Tokyo-JP"], "3.5"),
+        hardware(13, "G2ae.large", "2 x Nvidia 4090 · 16 vCPU · 64 GiB", ["Quebec-CA"], "2.0", status="unavailable"),
+        hardware(3, "C1ae.xlarge", "CPU only · 16 vCPU · 16 GiB", ["Quebec-CA"], "1.2", status="unavailable"),
+    ])
+
+
+def test_plan_rows_and_total(catalog):
+    plan = CostPlanner(catalog).plan([
+        ("C1ae.small", "Quebec-CA", 7200, 3),
+        {"instance_type": "G1ae.medium", "region": "Tokyo-JP"},
+        ("C1ae.small",),
+        ("G1ae.medium", "Quebec-CA", 3600, 1),
+        ("G2ae.large", "global", 3600, 1),
+        ("X9.huge", "global", 3600, 1),
+        ("C1ae.xlarge", "Quebec-CA", 3600, 1),
+    ])
+
+    assert [row.amount for row in plan.rows] == [pytest.approx(3.0), 3.5, 0.5, None, None, None, None]
+    assert plan.rows[0].hardware_id == 0
+    assert plan.rows[2].region == "global"
+    assert plan.total == pytest.approx(7.0)
+    assert plan.unpriced == [3, 4, 5, 6]
+    assert plan.rows[3].error == "No G1ae.medium machine in Quebec-CA"
+    assert plan.rows[4].error == "G2ae.large is not available"
+    assert plan.rows[5].error == "Unknown instance type X9.huge"
+    assert plan.rows[6].error == "C1ae.xlarge is not available"
+    assert not plan.affordable
+
+
+def test_plan_alternatives(catalog):
+    plan = CostPlanner(catalog).plan([("C1ae.medium", "Quebec-CA", 7200, 2), ("C1ae.small", "Tokyo-JP")], alternatives=2)
+
+    medium, small = plan.rows
+    assert [quote.instance_type for quote in medium.alternatives] == ["C1ae.large"]
+    assert medium.alternatives[0].amount == pytest.approx(3.2)
+    assert medium.alternatives[0].duration == 7200
+    assert medium.savings == pytest.approx(0.8)
+    # CPU rows are never offered GPU instance types
+    assert small.alternatives == []
+    assert small.savings == 0
+    assert plan.savings == pytest.approx(0.8)
+
+
+def test_plan_wallet_checks(catalog):
+    rows = [("C1ae.small", "Quebec-CA", 3600, 4)]
+
+    plan = CostPlanner(catalog).plan(rows, allowance=0.5, balance=10)
+    assert plan.allowance_shortfall == pytest.approx(1.5)
+    assert plan.balance_shortfall == 0
+    assert plan.affordable
+
+    plan = CostPlanner(catalog).plan(rows, allowance=5, balance=1)
+    assert plan.allowance_shortfall == 0
+    assert plan.balance_shortfall == pytest.approx(1)
+    assert not plan.affordable
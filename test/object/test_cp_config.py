@@ -1,6 +1,6 @@
 import unittest
 import json
-from swan.object.cp_config import InstanceResource
+from swan.object.cp_config import InstanceResource, parse_hardware_description
 
 class TestInstanceConfig(unittest.TestCase):
 
@@ -38,7 +38,14 @@ class TestInstanceConfig(unittest.TestCase):
             "type": self.config["hardware_type"],
             "region": self.config["region"],
             "price": self.config["hardware_price"],
-            "status": self.config["hardware_status"]
+            "status": self.config["hardware_status"],
+            "snapshot_id": None,
+            "expiry_time": None,
+            "ssh_ready": [],
+            "vcpu": 2,
+            "memory": 2.0,
+            "gpu_model": None,
+            "gpu_count": 0
         }
         # print(self.instance_config.to_dict())
         self.assertEqual(self.instance_config.to_dict(), expected_dict)
@@ -51,7 +58,14 @@ class TestInstanceConfig(unittest.TestCase):
             "type": self.config["hardware_type"],
             "region": self.config["region"],
             "price": self.config["hardware_price"],
-            "status": self.config["hardware_status"]
+            "status": self.config["hardware_status"],
+            "snapshot_id": None,
+            "expiry_time": None,
+            "ssh_ready": [],
+            "vcpu": 2,
+            "memory": 2.0,
+            "gpu_model": None,
+            "gpu_count": 0
         }, indent=2)
         # print(self.instance_config.to_json())
         self.assertEqual(self.instance_config.to_json(), expected_json)
@@ -64,12 +78,33 @@ class TestInstanceConfig(unittest.TestCase):
             "type": self.config["hardware_type"],
             "region": self.config["region"],
             "price": self.config["hardware_price"],
-            "status": self.config["hardware_status"]
+            "status": self.config["hardware_status"],
+            "snapshot_id": None,
+            "expiry_time": None,
+            "ssh_ready": [],
+            "vcpu": 2,
+            "memory": 2.0,
+            "gpu_model": None,
+            "gpu_count": 0
         }, indent=2)
         expected_str = str(expected_json)
         # print(str(self.instance_config))
         self.assertEqual(str(self.instance_config), expected_str)
 
+    def test_parsed_description(self):
+        self.assertEqual(self.instance_config.vcpu, 2)
+        self.assertEqual(self.instance_config.memory, 2.0)
+        self.assertIsNone(self.instance_config.gpu_model)
+        self.assertEqual(self.instance_config.gpu_count, 0)
+
+    def test_parse_gpu_description(self):
+        spec = parse_hardware_description("2 x Nvidia 4090 · 16 vCPU · 64 GiB")
+        self.assertEqual(spec, {"vcpu": 16, "memory": 64.0, "gpu_model": "Nvidia 4090", "gpu_count": 2})
+        spec = parse_hardware_description("Nvidia 3080 · 4 vCPU · 16 GiB")
+        self.assertEqual(spec["gpu_model"], "Nvidia 3080")
+        self.assertEqual(spec["gpu_count"], 1)
+        self.assertEqual(parse_hardware_description(None)["vcpu"], None)
+
     def test_getitem(self):
         self.assertEqual(self.instance_config["hardware_id"], self.config["hardware_id"])
         self.assertEqual(self.instance_config["instance_type"], self.config["hardware_name"])
@@ -90,6 +125,14 @@ class TestInstanceConfig(unittest.TestCase):
         self.assertIsNone(self.instance_config.get("non_existent_key"))
         self.assertEqual(self.instance_config.get("non_existent_key", "default_value"), "default_value")
 
+    def test_slots(self):
+        self.assertFalse(hasattr(self.instance_config, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.instance_config.non_existent_key = 1
+        with self.assertRaises(KeyError):
+            self.instance_config["to_dict"]
+        self.assertIsNone(self.instance_config.get("to_dict"))
+
     def test_repr(self):
         expected_repr = f"InstanceResource({self.instance_config.to_json()})"
         print(repr(self.instance_config))
@@ -0,0 +1,78 @@
+""" Test deployment timeline analytics """
+
+import pytest
+
+from swan.object import DeploymentAnalytics, TaskDeploymentInfo
+from swan.object.deployment_timeline import deployment_timeline
+
+
+def deployment(uuid, hardware="C1ae.small", region="Quebec-CA", cp="0xcp1", paid=10, assigned=30, running=60, url=90):
+    return TaskDeploymentInfo.load_from_resp({
+        "data": {
+            "task": {
+                "uuid": uuid,
+                "created_at": 1000,
+                "task_detail": {"hardware": hardware, "requirements": {"region": region}},
+            },
+            "config_orders": [{"started_at": 1000 + paid if paid is not None else None}],
+            "jobs": [{
+                "cp_account_address": cp,
+                "created_at": 1000 + assigned,
+                "start_at": 1000 + running,
+                "updated_at": 1000 + (url or assigned),
+                "job_real_uri": "https://app" if url is not None else None,
+            }],
+        },
+    })
+
+
+def test_deployment_timeline():
+    timeline = deployment_timeline(deployment("t1"))
+
+    assert (timeline.instance_type, timeline.region, timeline.cp_account_address) == ("C1ae.small", "Quebec-CA", "0xcp1")
+    assert (timeline.time_to_payment, timeline.time_to_cp_assignment, timeline.time_to_running, timeline.time_to_url) == (10, 30, 60, 90)
+
+    pending = deployment_timeline(deployment("t2", paid=None, url=None))
+    assert pending.time_to_payment is None
+    assert pending.time_to_url is None
+
+
+def test_time_to_url_ignores_updates_after_end():
+    info = deployment("t1", url=90)
+    info.task.end_at = 1500
+    assert deployment_timeline(info).time_to_url == 90
+    assert deployment_timeline(info, url_ready_at=1070).time_to_url == 70
+
+    # a job updated when the task ended says nothing about when its URL came up
+    info.jobs[0].updated_at = 1500
+    assert deployment_timeline(info).time_to_url is None
+    info.task.end_at = None
+    info.jobs[0].ended_at = 1400
+    info.jobs[0].updated_at = 1450
+    assert deployment_timeline(info).time_to_url is None
+
+
+def test_percentiles_by_group():
+    analytics = DeploymentAnalytics([
+        deployment("t1", url=100),
+        deployment("t2", url=200),
+        deployment("t3", url=300),
+        deployment("t4", region="Tokyo-JP", cp="0xcp2", url=50),
+        deployment("t5", region="Tokyo-JP", cp="0xcp2", url=None),
+    ])
+    assert len(analytics) == 5
+
+    overall, = analytics.stats("time_to_url")
+    assert overall.count == 4
+    assert overall.percentiles[50] == pytest.approx(150)
+
+    by_region = {stat.group: stat for stat in analytics.stats("time_to_url", by="region", qs=(50, 90))}
+    assert by_region["Quebec-CA"].percentiles == {50: 200, 90: 280}
+    assert by_region["Tokyo-JP"].count == 1
+
+    assert [stat.group for stat in analytics.fastest("cp_account_address")] == ["0xcp2", "0xcp1"]
+    assert [stat.group for stat in analytics.fastest("cp_account_address", min_count=2)] == ["0xcp1"]
+    assert analytics.timelines()[3].task_uuid == "t4"
+
+    with pytest.raises(ValueError):
+        analytics.stats("time_to_lunch")
@@ -0,0 +1,56 @@
+""" Test geo-aware CP placement """
+
+import pytest
+
+from swan.object import CPAccount, CPPlacement, TaskDeploymentInfo
+from swan.object.placement import great_circle_km
+
+MONTREAL = (45.50, -73.57)
+TOKYO = (35.68, 139.69)
+NEW_YORK = (40.71, -74.01)
+
+
+def deployment(cp_address, lat, lon, region, real_uri=None, status="running"):
+    return TaskDeploymentInfo.load_from_resp({
+        "data": {
+            "computing_providers": [{"cp_account_address": cp_address, "lat": lat, "lon": lon, "region": region}],
+            "jobs": [{"cp_account_address": cp_address, "job_real_uri": real_uri, "status": status}],
+            "task": {"uuid": "t-" + cp_address},
+        },
+    })
+
+
+def test_great_circle_km():
+    distance = great_circle_km([MONTREAL[0], TOKYO[0]], [MONTREAL[1], TOKYO[1]], *NEW_YORK)
+    assert distance[0] == pytest.approx(531, rel=0.01)
+    assert distance[1] == pytest.approx(10850, rel=0.01)
+
+
+def test_rank_by_nearest_location():
+    placement = CPPlacement()
+    placement.add_providers([
+        CPAccount(cp_account_address="0xmtl", lat=MONTREAL[0], lon=MONTREAL[1], region="Quebec-CA"),
+        CPAccount(cp_account_address="0xtyo", lat=TOKYO[0], lon=TOKYO[1], region="Tokyo-JP"),
+        CPAccount(cp_account_address="0xnowhere", region="Quebec-CA"),
+    ])
+
+    assert [candidate.cp_account_address for candidate in placement.rank([NEW_YORK])] == ["0xmtl", "0xtyo", "0xnowhere"]
+    assert placement.preferred_cp_list([NEW_YORK]) == ["0xmtl", "0xtyo"]
+    assert placement.preferred_cp_list([NEW_YORK, (35.0, 139.0)], limit=2) == ["0xtyo", "0xmtl"]
+    assert placement.preferred_cp_list([TOKYO], regions=["Quebec-CA"]) == ["0xmtl"]
+    assert placement.preferred_cp_list([TOKYO], regions=["Oregon-US"]) == []
+
+
+def test_observed_failures_outweigh_distance():
+    placement = CPPlacement.from_tasks(
+        [deployment("0xnear", *MONTREAL, "Quebec-CA", status="failed") for _ in range(5)]
+        + [deployment("0xfar", 43.65, -79.38, "Ontario-CA", real_uri="https://app") for _ in range(5)]
+    )
+
+    ranked = placement.rank([MONTREAL])
+    assert [candidate.cp_account_address for candidate in ranked] == ["0xfar", "0xnear"]
+    assert ranked[1].failures == 5
+    assert ranked[0].success_rate == pytest.approx(6 / 7)
+
+    with pytest.raises(ValueError):
+        placement.rank([])
@@ -0,0 +1,53 @@
+# test_price_history.py
+import pytest
+from swan.object import InstanceCatalog, PriceHistory
+
+
+def snapshot(snapshot_id, price, status="available", region=None):
+    return InstanceCatalog([
+        {
+            "hardware_id": 12,
+            "hardware_name": "G1ae.medium",
+            "hardware_description": "Nvidia 3080 · 8 vCPU · 32 GiB",
+            "hardware_type": "GPU",
+            "region": region or ["Quebec-CA", "Tokyo-JP"],
+            "hardware_price": price,
+            "hardware_status": status,
+            "snapshot_id": snapshot_id,
+        },
+    ])
+
+
+@pytest.fixture
+def price_history():
+    history = PriceHistory()
+    history.record(snapshot(1, "4.0"), recorded_at=100)
+    history.record(snapshot(2, "2.0", region=["Tokyo-JP"]), recorded_at=200)
+    history.record(snapshot(3, "3.0", status="unavailable"), recorded_at=300)
+    yield history
+    history.close()
+
+
+def test_record_is_append_only(price_history):
+    assert price_history.record(snapshot(3, "9.0"), recorded_at=400) == 0
+    assert [point.price for point in price_history.history("G1ae.medium")] == [4.0, 2.0, 3.0]
+
+
+def test_price_stats(price_history):
+    stats = price_history.price_stats("G1ae.medium")
+    assert (stats.count, stats.min, stats.max) == (3, 2.0, 4.0)
+    assert stats.avg == pytest.approx(3.0)
+
+    stats = price_history.price_stats("G1ae.medium", region="Quebec-CA")
+    assert (stats.count, stats.min) == (2, 3.0)
+
+    stats = price_history.price_stats("G1ae.medium", start=150, available_only=True)
+    assert (stats.count, stats.min, stats.max) == (1, 2.0, 2.0)
+
+    assert price_history.price_stats("missing").count == 0
+
+
+def test_price_percentile(price_history):
+    assert price_history.price_percentile("G1ae.medium", 50) == 3.0
+    assert price_history.price_percentile("G1ae.medium", 50, end=200) == 3.0
+    assert price_history.price_percentile("missing", 50) is None
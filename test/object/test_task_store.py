@@ -0,0 +1,87 @@
+""" Test local task store """
+
+from swan.object import ConfigOrder, Job, TaskDeploymentInfo, TaskStore
+
+
+def deployment_info(uuid, status="running", hardware="C1ae.small", cp="0xcp1", created_at=100, updated_at=100):
+    return TaskDeploymentInfo.load_from_resp({
+        "data": {
+            "task": {
+                "uuid": uuid,
+                "status": status,
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "task_detail": {"hardware": hardware, "requirements": {"region": "Quebec-CA"}},
+            },
+            "jobs": [{"uuid": f"{uuid}-job", "task_uuid": uuid, "cp_account_address": cp, "status": status}],
+            "config_orders": [{"uuid": f"{uuid}-order", "task_uuid": uuid, "status": "Finished", "tx_hash": f"0x{uuid}"}],
+            "computing_providers": [{"cp_account_address": cp, "name": cp, "region": "Quebec-CA", "lat": 45.5, "lon": -73.6}],
+        },
+        "status": "success",
+    })
+
+
+def test_save_and_query():
+    store = TaskStore()
+    store.save(deployment_info("t1", created_at=100), "0xwallet")
+    store.save(deployment_info("t2", status="terminated", hardware="G1ae.medium", cp="0xcp2", created_at=200), "0xwallet")
+    store.save(deployment_info("t3", created_at=300), "0xother")
+
+    assert store.versions("0xwallet") == {"t1": 100, "t2": 100}
+
+    task_info = store.get("t1")
+    assert task_info.task.task_detail.hardware == "C1ae.small"
+    assert task_info.jobs[0].cp_account_address == "0xcp1"
+    assert task_info.computing_providers[0].lat == 45.5
+
+    uuids = lambda tasks: [task_info.task.uuid for task_info in tasks]
+    assert uuids(store.query(wallet_address="0xwallet")) == ["t2", "t1"]
+    assert uuids(store.query(status="running")) == ["t3", "t1"]
+    assert uuids(store.query(hardware="G1ae.medium")) == ["t2"]
+    assert uuids(store.query(cp_account_address="0xcp1", start=150)) == ["t3"]
+    assert uuids(store.query(region="Quebec-CA", limit=1)) == ["t3"]
+
+    assert [job.task_uuid for job in store.jobs(cp_account_address="0xcp2")] == ["t2"]
+    assert store.config_orders(tx_hash="0xt1")[0].task_uuid == "t1"
+    assert sorted(cp.cp_account_address for cp in store.computing_providers()) == ["0xcp1", "0xcp2"]
+
+
+def test_save_replaces_children():
+    store = TaskStore()
+    store.save(deployment_info("t1", cp="0xcp1"), "0xwallet")
+    store.save(deployment_info("t1", cp="0xcp2", updated_at=150), "0xwallet")
+
+    assert store.versions() == {"t1": 150}
+    assert [job.cp_account_address for job in store.jobs(task_uuid="t1")] == ["0xcp2"]
+    assert store.query(cp_account_address="0xcp1") == []
+
+    store.delete("t1")
+    assert store.get("t1") is None
+    assert store.jobs() == []
+
+
+def test_jobs_without_uuid_or_id_are_all_kept():
+    task_info = deployment_info("t1")
+    task_info.jobs[0].uuid = None
+    task_info.jobs.append(Job(task_uuid="t1", cp_account_address="0xcp2"))
+    task_info.config_orders.append(ConfigOrder(task_uuid="t1", tx_hash="0xrenew"))
+    store = TaskStore()
+    store.save(task_info, "0xwallet")
+
+    assert [job.cp_account_address for job in store.jobs(task_uuid="t1")] == ["0xcp1", "0xcp2"]
+    assert [order.tx_hash for order in store.config_orders(task_uuid="t1")] == ["0xt1", "0xrenew"]
+
+
+def test_owner_tags(tmp_path):
+    path = str(tmp_path / "tasks.db")
+    store = TaskStore(path)
+    store.set_owner(["t1", "t2"], "api")
+    store.set_owner(["t3"], "worker")
+    store.release(["t2"])
+    store.close()
+
+    store = TaskStore(path)
+    assert store.owners() == {"t1": "api", "t3": "worker"}
+    assert store.owners("api") == {"t1": "api"}
+    store.delete("t1")
+    assert store.owners("api") == {}
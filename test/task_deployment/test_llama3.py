@@ -56,20 +56,14 @@ def test_get_deployment_info(swan_orchestrator, task_uuid):
 
 @pytest.fixture(scope="module")
 def real_url(swan_orchestrator, task_uuid) -> str:
-    max_retries = 10
-    retry_interval = 30  # seconds
-
-    for _ in range(max_retries):
-        job_urls = swan_orchestrator.get_real_url(task_uuid)
-
-        if job_urls:
-            assert isinstance(job_urls, list)
-            assert len(job_urls) > 0
-            return job_urls[0]
-
-        time.sleep(retry_interval)
-
-    pytest.fail("Failed to get real URL after maximum retries")
+    task_info = swan_orchestrator.wait_for_task(task_uuid, until="has_real_url", timeout=300)
+    if not task_info:
+        pytest.fail("Failed to get real URL before timeout")
+
+    job_urls = swan_orchestrator.get_real_url(task_uuid)
+    assert isinstance(job_urls, list)
+    assert len(job_urls) > 0
+    return job_urls[0]
 
 
 def test_llama_chat_content(real_url: str):